@@ -3,17 +3,23 @@
 This module contains the create_app factory function that initializes
 and configures the Flask application.
 """
+from dotenv import load_dotenv
 from flask import Flask
+from jinja2 import FileSystemBytecodeCache
 from flask_sqlalchemy import SQLAlchemy
 from flask_migrate import Migrate
 
 from app.config import Config
+from app.json_provider import ISODateJSONProvider
 
 # Initialize extensions without app context
 # These will be initialized with the app in create_app()
 db = SQLAlchemy()
 migrate = Migrate()
 
+# Pre-serialized body for the health check, which is polled frequently
+_HEALTH_BODY = b'{"status":"healthy"}\n'
+
 
 def create_app(config_class: type = Config) -> Flask:
     """Create and configure the Flask application.
@@ -27,9 +33,24 @@ def create_app(config_class: type = Config) -> Flask:
     Returns:
         Configured Flask application instance.
     """
+    # Load .env before reading environment-backed settings. Test configs
+    # set their values directly and skip it.
+    if not getattr(config_class, 'TESTING', False):
+        load_dotenv(override=False)
+
     app = Flask(__name__)
     app.config.from_object(config_class)
 
+    # Serialize dates as ISO strings in JSON responses
+    app.json = ISODateJSONProvider(app)
+
+    # Reuse compiled templates across processes. Outside debug mode Flask
+    # already skips the per-render template mtime check.
+    if app.config.get('JINJA_BYTECODE_CACHE') and not app.debug:
+        app.jinja_env.bytecode_cache = FileSystemBytecodeCache(
+            app.config.get('JINJA_BYTECODE_CACHE_DIR')
+        )
+
     # Initialize extensions with app
     db.init_app(app)
     migrate.init_app(app, db)
@@ -41,9 +62,10 @@ def create_app(config_class: type = Config) -> Flask:
     from app.routes import register_blueprints
     register_blueprints(app)
 
-    # Simple health check route
+    # Simple health check route. A new response is built per call because
+    # after_request hooks may modify it; only the JSON encoding is skipped.
     @app.route('/health')
     def health_check():
-        return {'status': 'healthy'}
+        return app.response_class(_HEALTH_BODY, mimetype='application/json')
 
     return app
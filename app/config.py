@@ -1,14 +1,62 @@
 """Application configuration module.
 
 Loads configuration from environment variables with sensible defaults
-for development.
+for development. Environment-backed settings are read when the app is
+created, not at import time; create_app() loads the .env file first.
 """
 import os
 
-from dotenv import load_dotenv
+# Case-insensitive values treated as true, by boolean environment settings
+# here and by the routes' parse_bool
+TRUTHY_VALUES = frozenset({'true', '1', 'yes', 'on', 'y', 't'})
 
-# Load environment variables from .env file
-load_dotenv()
+
+def _engine_options(database_uri: str) -> dict:
+    """Build SQLAlchemy engine options for the given database URI.
+
+    Server databases (PostgreSQL) get an explicitly sized connection pool
+    with pre-ping and recycling so stale connections are replaced instead of
+    stalling requests. SQLite manages its own pool, so no options are set.
+
+    Args:
+        database_uri: The SQLAlchemy database URI.
+
+    Returns:
+        Dictionary of keyword arguments for create_engine().
+    """
+    if database_uri.startswith('sqlite:'):
+        return {}
+    return {
+        'pool_size': int(os.environ.get('DB_POOL_SIZE', 20)),
+        'max_overflow': int(os.environ.get('DB_MAX_OVERFLOW', 40)),
+        'pool_timeout': 30,
+        'pool_recycle': 3600,
+        'pool_pre_ping': True,
+    }
+
+
+class _FromEnv:
+    """Config attribute computed from the environment when it is read.
+
+    Flask's config.from_object() reads attributes off the class, so the
+    value is resolved at app creation. Subclasses that assign a plain value
+    (e.g. the test config) never touch the environment.
+    """
+
+    def __init__(self, func):
+        self.func = func
+
+    def __get__(self, obj, owner):
+        return self.func(owner)
+
+
+def _database_uri() -> str:
+    """Read the database URI, defaulting to a local SQLite file."""
+    uri = os.environ.get('DATABASE_URL', 'sqlite:///legal_tracker.db')
+    # Handle Railway's postgres:// vs postgresql:// URL scheme
+    if uri.startswith('postgres://'):
+        uri = uri.replace('postgres://', 'postgresql://', 1)
+    return uri
 
 
 class Config:
@@ -19,23 +67,49 @@ class Config:
     """
 
     # Flask settings
-    SECRET_KEY = os.environ.get('SECRET_KEY', 'dev-secret-key-change-in-production')
-    DEBUG = os.environ.get('DEBUG', 'false').lower() in ('true', '1', 'yes')
+    SECRET_KEY = _FromEnv(
+        lambda cls: os.environ.get('SECRET_KEY', 'dev-secret-key-change-in-production')
+    )
+    DEBUG = _FromEnv(lambda cls: os.environ.get('DEBUG', 'false').lower() in TRUTHY_VALUES)
 
     # Database settings
     # Default to SQLite for local development, PostgreSQL for production
-    SQLALCHEMY_DATABASE_URI = os.environ.get(
-        'DATABASE_URL',
-        'sqlite:///legal_tracker.db'
+    SQLALCHEMY_DATABASE_URI = _FromEnv(lambda cls: _database_uri())
+    SQLALCHEMY_ENGINE_OPTIONS = _FromEnv(
+        lambda cls: _engine_options(cls.SQLALCHEMY_DATABASE_URI)
     )
-
-    # Handle Railway's postgres:// vs postgresql:// URL scheme
-    if SQLALCHEMY_DATABASE_URI.startswith('postgres://'):
-        SQLALCHEMY_DATABASE_URI = SQLALCHEMY_DATABASE_URI.replace(
-            'postgres://', 'postgresql://', 1
-        )
-
     SQLALCHEMY_TRACK_MODIFICATIONS = False
 
+    # Raise on relationship lazy loads in list queries (enabled in tests)
+    SQLALCHEMY_RAISELOAD = False
+
     # Application settings
     APP_NAME = 'Legal Project Tracker'
+
+    # Persist compiled templates so new worker processes skip recompiling
+    # them. Not used in debug mode. The directory defaults to a per-user
+    # temp directory.
+    JINJA_BYTECODE_CACHE = _FromEnv(
+        lambda cls: os.environ.get('JINJA_BYTECODE_CACHE', 'true').lower() in TRUTHY_VALUES
+    )
+    JINJA_BYTECODE_CACHE_DIR = _FromEnv(lambda cls: os.environ.get('JINJA_BYTECODE_CACHE_DIR'))
+
+    # Seconds to cache distinct field values (autocomplete, filter dropdowns).
+    # Writes in this process clear the cache immediately; the TTL bounds how
+    # long other worker processes can serve stale values. 0 disables caching.
+    DISTINCT_VALUES_CACHE_TTL = _FromEnv(
+        lambda cls: int(os.environ.get('DISTINCT_VALUES_CACHE_TTL', 30))
+    )
+
+    # Seconds to reuse a rendered HTMX table fragment for identical filters.
+    # Writes in this process take effect immediately. 0 disables caching.
+    TABLE_ROWS_CACHE_TTL = _FromEnv(
+        lambda cls: float(os.environ.get('TABLE_ROWS_CACHE_TTL', 3))
+    )
+
+    # Seconds to reuse dashboard section data between requests. Writes in
+    # this process and the date changing take effect immediately; the TTL
+    # bounds staleness across workers. 0 disables caching.
+    DASHBOARD_CACHE_TTL = _FromEnv(
+        lambda cls: float(os.environ.get('DASHBOARD_CACHE_TTL', 5))
+    )
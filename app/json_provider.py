@@ -0,0 +1,72 @@
+"""JSON provider for the Legal Project Tracker.
+
+Flask's default provider formats dates as HTTP dates (RFC 822). This
+provider emits ISO-8601 strings instead, matching Project.to_dict(), so
+routes can pass raw column values straight to jsonify().
+
+When orjson is installed it is used for serialization; it handles dates
+natively and is several times faster than the standard library encoder
+on large list responses. Without it, the standard encoder is used.
+"""
+from datetime import date
+
+from flask.json.provider import DefaultJSONProvider
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional speedup
+    orjson = None
+
+
+class ISODateJSONProvider(DefaultJSONProvider):
+    """JSON provider that serializes dates and datetimes as ISO-8601 strings."""
+
+    @staticmethod
+    def default(o):
+        """Serialize date/datetime values as ISO strings.
+
+        Args:
+            o: Object the standard encoder could not serialize.
+
+        Returns:
+            JSON-serializable representation of the object.
+        """
+        # datetime is a subclass of date, so this covers both
+        if isinstance(o, date):
+            return o.isoformat()
+        return DefaultJSONProvider.default(o)
+
+    def dumps(self, obj, **kwargs) -> str:
+        """Serialize data as JSON, using orjson when available.
+
+        orjson covers the compact and 2-space indented layouts that
+        response() asks for. Other encoder arguments, and values orjson
+        cannot encode, fall back to the standard library encoder.
+
+        Args:
+            obj: The data to serialize.
+            **kwargs: Arguments passed to json.dumps().
+
+        Returns:
+            JSON string.
+        """
+        if orjson is None:
+            return super().dumps(obj, **kwargs)
+
+        option = orjson.OPT_NON_STR_KEYS
+        if self.sort_keys:
+            option |= orjson.OPT_SORT_KEYS
+
+        extra = dict(kwargs)
+        if extra.get('separators') == (',', ':'):
+            del extra['separators']
+        if extra.get('indent') == 2:
+            del extra['indent']
+            option |= orjson.OPT_INDENT_2
+        if extra:
+            return super().dumps(obj, **kwargs)
+
+        try:
+            return orjson.dumps(obj, default=self.default, option=option).decode()
+        except TypeError:
+            return super().dumps(obj, **kwargs)
@@ -3,6 +3,6 @@
 This package contains all database models for the application.
 Models are imported here and exposed for use throughout the app.
 """
-from app.models.project import Project, ProjectStatus
+from app.models.project import SEARCH_FIELDS, Project, ProjectStatus
 
-__all__ = ['Project', 'ProjectStatus']
+__all__ = ['Project', 'ProjectStatus', 'SEARCH_FIELDS']
@@ -4,11 +4,16 @@ This module defines the Project model which represents a legal project
 being tracked in the system.
 """
 from datetime import datetime, timezone
+from operator import attrgetter
 from typing import Optional
 
 from app import db
 
 
+# Columns matched by the project list's multi-term search
+SEARCH_FIELDS = ('project_name', 'department', 'notes', 'project_group')
+
+
 def _utcnow():
     """Return current UTC time as timezone-aware datetime."""
     return datetime.now(timezone.utc)
@@ -28,6 +33,14 @@ class ProjectStatus:
 
     ALL = [IN_PROGRESS, UNDER_REVIEW, WAITING_ON_CLIENT, ON_HOLD, COMPLETED]
 
+    # Every status except Completed; the default list/report filter.
+    # A tuple, since the same object is shared by every request.
+    ACTIVE = (IN_PROGRESS, UNDER_REVIEW, WAITING_ON_CLIENT, ON_HOLD)
+
+    # Set forms of the above for membership tests
+    ALL_SET = frozenset(ALL)
+    ACTIVE_SET = frozenset(ACTIVE)
+
 
 class Project(db.Model):
     """SQLAlchemy model for legal projects.
@@ -55,6 +68,77 @@ class Project(db.Model):
     """
     __tablename__ = 'projects'
 
+    # Indexes backing the dashboard buckets and default list filters.
+    # Most are partial: every dashboard and list query excludes
+    # soft-deleted rows.
+    __table_args__ = (
+        # Dashboard deadline sections and the weekly report
+        db.Index(
+            'ix_projects_status_delivery', 'status', 'delivery_deadline',
+            postgresql_where=db.text('deleted_at IS NULL'),
+            sqlite_where=db.text('deleted_at IS NULL'),
+        ),
+        # Default list sort over live projects
+        db.Index(
+            'ix_projects_active_delivery', 'delivery_deadline',
+            postgresql_where=db.text('deleted_at IS NULL'),
+            sqlite_where=db.text('deleted_at IS NULL'),
+        ),
+        # Case-insensitive department filter, alone or with a status filter
+        db.Index(
+            'ix_projects_department_lower_status',
+            db.text('lower(department)'), 'status',
+            postgresql_where=db.text('deleted_at IS NULL'),
+            sqlite_where=db.text('deleted_at IS NULL'),
+        ),
+        # Case-insensitive attorney filters
+        *(
+            db.Index(
+                f'ix_projects_{field}_lower', db.text(f'lower({field})'),
+                postgresql_where=db.text('deleted_at IS NULL'),
+                sqlite_where=db.text('deleted_at IS NULL'),
+            )
+            for field in ('assigned_attorney', 'qcp_attorney')
+        ),
+        # Autocomplete SELECT DISTINCT over live values, read in order
+        *(
+            db.Index(
+                f'ix_projects_{field}', field,
+                postgresql_where=db.text('deleted_at IS NULL'),
+                sqlite_where=db.text('deleted_at IS NULL'),
+            )
+            for field in ('department', 'assigned_attorney', 'qcp_attorney', 'project_group')
+        ),
+        # Substring search (ILIKE '%term%') on PostgreSQL via pg_trgm
+        *(
+            db.Index(
+                f'ix_projects_{field}_trgm', field,
+                postgresql_using='gin',
+                postgresql_ops={field: 'gin_trgm_ops'},
+                postgresql_where=db.text('deleted_at IS NULL'),
+            ).ddl_if(dialect='postgresql')
+            for field in SEARCH_FIELDS
+        ),
+        # Recently completed and completed-this-month (monthly report)
+        db.Index(
+            'ix_projects_status_updated', 'status', 'updated_at',
+            postgresql_where=db.text('deleted_at IS NULL'),
+            sqlite_where=db.text('deleted_at IS NULL'),
+        ),
+        # Opened-this-month (monthly report)
+        db.Index(
+            'ix_projects_created_at', 'created_at',
+            postgresql_where=db.text('deleted_at IS NULL'),
+            sqlite_where=db.text('deleted_at IS NULL'),
+        ),
+        # List sorted by last update
+        db.Index(
+            'ix_projects_updated_at', 'updated_at',
+            postgresql_where=db.text('deleted_at IS NULL'),
+            sqlite_where=db.text('deleted_at IS NULL'),
+        ),
+    )
+
     # Primary key
     id: int = db.Column(db.Integer, primary_key=True)
 
@@ -116,20 +200,19 @@ class Project(db.Model):
         Returns:
             Dictionary with all project fields.
         """
-        return {
-            'id': self.id,
-            'project_name': self.project_name,
-            'project_group': self.project_group,
-            'department': self.department,
-            'date_to_client': self.date_to_client.isoformat() if self.date_to_client else None,
-            'date_assigned_to_us': self.date_assigned_to_us.isoformat() if self.date_assigned_to_us else None,
-            'internal_deadline': self.internal_deadline.isoformat() if self.internal_deadline else None,
-            'delivery_deadline': self.delivery_deadline.isoformat() if self.delivery_deadline else None,
-            'assigned_attorney': self.assigned_attorney,
-            'qcp_attorney': self.qcp_attorney,
-            'status': self.status,
-            'notes': self.notes,
-            'created_at': self.created_at.isoformat() if self.created_at else None,
-            'updated_at': self.updated_at.isoformat() if self.updated_at else None,
-            'deleted_at': self.deleted_at.isoformat() if self.deleted_at else None,
-        }
+        result = dict(zip(self._COLUMNS, self._get_columns(self)))
+        for field in self._ISO_FIELDS:
+            value = result[field]
+            if value is not None:
+                result[field] = value.isoformat()
+        return result
+
+
+# to_dict() field groups, derived from the table so new columns are
+# picked up automatically. Date and timestamp values are ISO-formatted.
+Project._COLUMNS = tuple(Project.__table__.columns.keys())
+Project._ISO_FIELDS = tuple(
+    column.name for column in Project.__table__.columns
+    if isinstance(column.type, (db.Date, db.DateTime))
+)
+Project._get_columns = staticmethod(attrgetter(*Project._COLUMNS))
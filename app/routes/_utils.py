@@ -0,0 +1,98 @@
+"""Request and response helpers shared by the route blueprints.
+
+The parsing helpers convert raw query string and form values into Python
+types. They never raise; invalid input yields None or the caller's default.
+"""
+from datetime import date
+from functools import lru_cache
+from typing import Optional
+
+from flask import Response, jsonify, request
+
+from app.config import TRUTHY_VALUES
+
+
+def parse_bool(value: Optional[str], default: bool = False) -> bool:
+    """Parse a boolean query parameter.
+
+    Args:
+        value: String value to parse.
+        default: Default value if the parameter is missing.
+
+    Returns:
+        Boolean value.
+    """
+    if value is None:
+        return default
+    return value.lower() in TRUTHY_VALUES
+
+
+def parse_int(value: Optional[str], default: int) -> int:
+    """Parse an integer from a string value.
+
+    Args:
+        value: String value to parse.
+        default: Default value if parsing fails.
+
+    Returns:
+        Integer value.
+    """
+    if not value:
+        return default
+    try:
+        return int(value)
+    except ValueError:
+        return default
+
+
+def parse_date(date_str: Optional[str]) -> Optional[date]:
+    """Parse a date string in YYYY-MM-DD format.
+
+    Args:
+        date_str: Date string to parse.
+
+    Returns:
+        date object if valid, None otherwise.
+    """
+    if not date_str or not isinstance(date_str, str):
+        return None
+    return _parse_iso_date(date_str)
+
+
+def conditional_json(payload) -> Response:
+    """Build a JSON response that clients revalidate with an ETag.
+
+    Args:
+        payload: JSON-serializable response data.
+
+    Returns:
+        200 response with an ETag, or 304 if the request's If-None-Match
+        matches it.
+    """
+    response = jsonify(payload)
+    response.add_etag()
+    response.cache_control.no_cache = True
+    return response.make_conditional(request)
+
+
+@lru_cache(maxsize=256)
+def _parse_iso_date(date_str: str) -> Optional[date]:
+    """Parse a YYYY-MM-DD string, memoizing results.
+
+    Filter values repeat across paginated requests, so most calls become
+    a cache lookup. date objects are immutable and safe to share.
+
+    Args:
+        date_str: Date string to parse.
+
+    Returns:
+        date object if valid, None otherwise.
+    """
+    # fromisoformat also accepts compact and week-date forms on 3.11+;
+    # only the extended calendar form is a valid input here.
+    if len(date_str) != 10 or date_str[4] != '-' or date_str[7] != '-':
+        return None
+    try:
+        return date.fromisoformat(date_str)
+    except ValueError:
+        return None
@@ -2,46 +2,56 @@
 
 Provides the main dashboard view with projects organized by deadline urgency.
 """
-from datetime import date
+import time
 
-from flask import Blueprint, jsonify, render_template
+from flask import Blueprint, current_app, render_template
 
+from app.routes._utils import conditional_json
 from app.services import project_service
 
 dashboard_bp = Blueprint('dashboard', __name__)
 
+# Dashboard data kept per app by _get_dashboard_data
+_DASHBOARD_CACHE_KEY = 'dashboard_data_cache'
+
 
 def _get_dashboard_data() -> dict:
     """Fetch and structure dashboard data.
 
-    Retrieves projects organized by deadline urgency from the service layer.
+    Retrieves projects organized by deadline urgency from the service layer
+    in a single query. Rows are plain column dicts; date values are left
+    as-is and the app's JSON provider formats them as ISO strings.
+
+    Deadline sections report the total number of matching projects, which
+    may exceed the rows returned. Recently completed is a "last N" list, so
+    its count is the number of rows shown.
+
+    The result is reused for DASHBOARD_CACHE_TTL seconds. It is keyed on
+    the project data version and the current date, so a write in this
+    process or a new day is reflected on the next request. The returned
+    dict may be shared between requests and must not be modified.
 
     Returns:
         Dictionary with four project sections, each containing 'data' and 'count'.
     """
-    overdue = project_service.get_overdue_projects()
-    due_this_week = project_service.get_due_this_week()
-    longer_deadline = project_service.get_longer_deadline()
-    recently_completed = project_service.get_recently_completed()
-
-    return {
-        'overdue': {
-            'data': [p.to_dict() for p in overdue],
-            'count': len(overdue)
-        },
-        'due_this_week': {
-            'data': [p.to_dict() for p in due_this_week],
-            'count': len(due_this_week)
-        },
-        'longer_deadline': {
-            'data': [p.to_dict() for p in longer_deadline],
-            'count': len(longer_deadline)
-        },
-        'recently_completed': {
-            'data': [p.to_dict() for p in recently_completed],
-            'count': len(recently_completed)
-        }
-    }
+    ttl = current_app.config.get('DASHBOARD_CACHE_TTL', 0)
+    if ttl > 0:
+        key = (project_service.get_data_version(), project_service.current_date())
+        now = time.monotonic()
+        cached = current_app.extensions.get(_DASHBOARD_CACHE_KEY)
+        if cached is not None and cached[0] == key and cached[2] > now:
+            return cached[1]
+
+    buckets = project_service.get_dashboard_buckets()
+
+    data = {}
+    for name, (rows, total) in buckets.items():
+        count = len(rows) if name == 'recently_completed' else total
+        data[name] = {'data': rows, 'count': count}
+
+    if ttl > 0:
+        current_app.extensions[_DASHBOARD_CACHE_KEY] = (key, data, now + ttl)
+    return data
 
 
 @dashboard_bp.route('/')
@@ -59,7 +69,7 @@ def dashboard():
         Rendered HTML template with project data.
     """
     data = _get_dashboard_data()
-    return render_template('dashboard.html', **data, today=date.today())
+    return render_template('dashboard.html', **data, today=project_service.current_date())
 
 
 @dashboard_bp.route('/api/dashboard')
@@ -68,9 +78,10 @@ def dashboard_api():
 
     Provides dashboard data as JSON for API consumers and testing.
     This endpoint will remain as JSON even after Sprint 3.2 converts
-    the main dashboard routes to return HTML templates.
+    the main dashboard routes to return HTML templates. Responses carry
+    an ETag, so unchanged data is answered with 304 Not Modified.
 
     Returns:
         JSON object with project lists and counts.
     """
-    return jsonify(_get_dashboard_data())
+    return conditional_json(_get_dashboard_data())
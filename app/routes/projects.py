@@ -4,123 +4,260 @@ This module provides RESTful API endpoints for project CRUD operations,
 as well as HTML page routes for the web interface.
 Routes call the service layer; they handle HTTP concerns only.
 """
-from datetime import date, datetime
+import time
+from itertools import islice
+from typing import Iterable, Iterator, Optional
+from urllib.parse import urlencode
 
-from flask import Blueprint, flash, jsonify, redirect, render_template, request, url_for
+from flask import (
+    Blueprint, Response, current_app, flash, jsonify, redirect, render_template,
+    request, stream_with_context, url_for,
+)
 
 from app.models import ProjectStatus
+from app.routes._utils import conditional_json, parse_bool, parse_date
 from app.services import project_service
 
 projects_bp = Blueprint('projects', __name__)
 
+# Projects serialized per chunk when streaming GET /projects
+_STREAM_BATCH_SIZE = 100
 
-def _parse_date(date_str: str):
-    """Parse a date string in YYYY-MM-DD format.
+# Fields the autocomplete endpoints serve; checked before calling the service
+_AUTOCOMPLETE_FIELDS = frozenset(project_service.DISTINCT_FIELDS)
 
-    Args:
-        date_str: Date string to parse.
+# Partial rendered by the HTMX table endpoint
+_TABLE_ROWS_TEMPLATE = 'partials/project_table_rows.html'
 
-    Returns:
-        date object if valid, None otherwise.
-    """
-    if not date_str:
-        return None
-    try:
-        return datetime.strptime(date_str, '%Y-%m-%d').date()
-    except ValueError:
-        return None
+# Rendered table fragments kept per app by projects_table_rows
+_TABLE_ROWS_CACHE_KEY = 'project_table_rows_cache'
+_TABLE_ROWS_CACHE_SIZE = 256
 
+# Fields the new project form can be pre-filled with
+_PREFILL_FIELDS = (
+    'project_name', 'project_group', 'department', 'assigned_attorney',
+    'qcp_attorney', 'date_to_client', 'date_assigned_to_us',
+    'internal_deadline', 'delivery_deadline', 'notes',
+)
 
-def _parse_bool(value: str, default: bool = False) -> bool:
-    """Parse a boolean query parameter.
+# Date inputs on the new and edit project forms
+_FORM_DATE_FIELDS = (
+    'date_to_client', 'date_assigned_to_us', 'internal_deadline', 'delivery_deadline',
+)
 
-    Args:
-        value: String value to parse.
-        default: Default value if parsing fails.
-
-    Returns:
-        Boolean value.
-    """
-    if value is None:
-        return default
-    return value.lower() in ('true', '1', 'yes')
+# Fields copied into the new project form when cloning
+_CLONE_FIELDS = [
+    'project_name', 'department', 'assigned_attorney', 'qcp_attorney', 'project_group',
+]
 
 
 def _build_filters_from_request() -> dict:
     """Build a filters dict from request query parameters.
 
-    Handles all supported filter and sort parameters.
+    Handles all supported filter and sort parameters. The result is
+    memoized on the current request so repeated calls reuse it. (flask.g
+    is not used because it belongs to the app context, which can outlive a
+    single request.)
 
     Returns:
         Dictionary of filter parameters for the service layer.
     """
+    cached = getattr(request, '_projects_filters', None)
+    if cached is not None:
+        return cached
+
+    args = request.args
     filters = {}
 
     # Status filter - pass raw values; service layer handles parsing
-    status_list = request.args.getlist('status')
+    status_list = args.getlist('status')
     if status_list:
         filters['status'] = status_list
 
     # include_completed logic: if false (default), exclude Completed status
     # unless status filter is explicitly provided
-    include_completed = _parse_bool(request.args.get('include_completed'), False)
+    include_completed = parse_bool(args.get('include_completed'), False)
     if not include_completed and 'status' not in filters:
         # Exclude Completed status by default
-        filters['status'] = [
-            s for s in ProjectStatus.ALL if s != ProjectStatus.COMPLETED
-        ]
+        filters['status'] = ProjectStatus.ACTIVE
 
     # Other text filters
-    if request.args.get('department'):
-        filters['department'] = request.args.get('department')
-    if request.args.get('assigned_attorney'):
-        filters['assigned_attorney'] = request.args.get('assigned_attorney')
-    if request.args.get('qcp_attorney'):
-        filters['qcp_attorney'] = request.args.get('qcp_attorney')
+    for field in ('department', 'assigned_attorney', 'qcp_attorney'):
+        value = args.get(field)
+        if value:
+            filters[field] = value
 
     # Search term (multi-field, multi-term search)
-    if request.args.get('search'):
-        filters['search'] = request.args.get('search')
+    search = args.get('search')
+    if search:
+        filters['search'] = search
 
     # Date range filters
-    delivery_from = _parse_date(request.args.get('delivery_deadline_from'))
-    if delivery_from:
-        filters['delivery_deadline_from'] = delivery_from
-    delivery_to = _parse_date(request.args.get('delivery_deadline_to'))
-    if delivery_to:
-        filters['delivery_deadline_to'] = delivery_to
-
-    date_assigned_from = _parse_date(request.args.get('date_assigned_from'))
-    if date_assigned_from:
-        filters['date_assigned_from'] = date_assigned_from
-    date_assigned_to = _parse_date(request.args.get('date_assigned_to'))
-    if date_assigned_to:
-        filters['date_assigned_to'] = date_assigned_to
+    for field in (
+        'delivery_deadline_from', 'delivery_deadline_to',
+        'date_assigned_from', 'date_assigned_to',
+    ):
+        parsed = parse_date(args.get(field))
+        if parsed:
+            filters[field] = parsed
 
     # Include deleted
-    filters['include_deleted'] = _parse_bool(
-        request.args.get('include_deleted'), False
-    )
+    filters['include_deleted'] = parse_bool(args.get('include_deleted'), False)
 
     # Sorting
-    if request.args.get('sort_by'):
-        filters['sort_by'] = request.args.get('sort_by')
-    if request.args.get('sort_dir'):
-        filters['sort_dir'] = request.args.get('sort_dir')
+    for field in ('sort_by', 'sort_dir'):
+        value = args.get(field)
+        if value:
+            filters[field] = value
 
+    request._projects_filters = filters
     return filters
 
 
+def _autocomplete_values() -> dict:
+    """Fetch dropdown/autocomplete values for the project templates.
+
+    Returns:
+        Template keyword arguments: departments, attorneys, qcp_attorneys.
+    """
+    values = project_service.get_distinct_values_bulk(
+        ['department', 'assigned_attorney', 'qcp_attorney']
+    )
+    return {
+        'departments': values['department'],
+        'attorneys': values['assigned_attorney'],
+        'qcp_attorneys': values['qcp_attorney'],
+    }
+
+
+def _table_rows_template():
+    """Get the project table rows template, resolved once per app.
+
+    The HTMX table endpoint is hit on every filter or sort change, so the
+    Template object is kept on the app instead of being looked up on each
+    render. In debug mode (template auto-reload) it is looked up every
+    time so edits still show up.
+
+    Returns:
+        The jinja2 Template for partials/project_table_rows.html.
+    """
+    env = current_app.jinja_env
+    if env.auto_reload:
+        return env.get_template(_TABLE_ROWS_TEMPLATE)
+    template = current_app.extensions.get('project_table_rows_template')
+    if template is None:
+        template = env.get_template(_TABLE_ROWS_TEMPLATE)
+        current_app.extensions['project_table_rows_template'] = template
+    return template
+
+
+def _filters_cache_key(filters: dict) -> tuple:
+    """Build a hashable, order-independent key for a filters dict.
+
+    Args:
+        filters: Filters from _build_filters_from_request().
+
+    Returns:
+        Sorted tuple of (name, value) pairs with lists made into tuples.
+    """
+    return tuple(sorted(
+        (name, tuple(value) if isinstance(value, (list, tuple)) else value)
+        for name, value in filters.items()
+    ))
+
+
+def _render_table_rows(filters: dict) -> str:
+    """Render the project table rows partial for a set of filters.
+
+    HTMX fires this on every keystroke in the search box and every filter
+    change, so identical requests often arrive within moments of each other.
+    Rendered HTML is reused for TABLE_ROWS_CACHE_TTL seconds. Entries are
+    keyed on the project data version, so a write in this process is
+    visible on the next request; the TTL bounds staleness across workers.
+
+    Rows are fetched in batches as the template renders rather than loaded
+    into a list first.
+
+    Args:
+        filters: Filters from _build_filters_from_request().
+
+    Returns:
+        Rendered HTML fragment.
+    """
+    ttl = current_app.config.get('TABLE_ROWS_CACHE_TTL', 0)
+    if ttl > 0:
+        cache = current_app.extensions.setdefault(_TABLE_ROWS_CACHE_KEY, {})
+        key = (project_service.get_data_version(), _filters_cache_key(filters))
+        now = time.monotonic()
+        cached = cache.get(key)
+        if cached is not None and cached[1] > now:
+            return cached[0]
+
+    html = render_template(
+        _table_rows_template(),
+        projects=project_service.iter_projects(filters),
+        is_htmx=True  # Flag to include OOB swap for results count
+    )
+
+    if ttl > 0:
+        if len(cache) >= _TABLE_ROWS_CACHE_SIZE:
+            cache.clear()
+        cache[key] = (html, now + ttl)
+    return html
+
+
+def _invalid_autocomplete_field(field: str):
+    """Build the 400 response for an unknown autocomplete field.
+
+    Args:
+        field: The requested field name.
+
+    Returns:
+        Tuple of JSON error response and 400 status.
+    """
+    return jsonify({
+        'error': f"Invalid field: {field}. Must be one of: {project_service.DISTINCT_FIELDS}"
+    }), 400
+
+
+def _stream_project_list(projects: Iterable) -> Iterator[str]:
+    """Yield a {"data": [...], "count": n} JSON document in chunks.
+
+    Projects are consumed and serialized a batch at a time, so a large
+    result is never held in memory as instances, dicts or one big JSON
+    string. The count is only known once every project has been written,
+    so it follows the array.
+
+    Args:
+        projects: Iterable of Project instances to serialize.
+
+    Yields:
+        Consecutive pieces of the JSON document.
+    """
+    dumps = current_app.json.dumps
+    projects = iter(projects)
+    count = 0
+    yield '{"data":['
+    while batch := list(islice(projects, _STREAM_BATCH_SIZE)):
+        yield (',' if count else '') + ','.join(dumps(p.to_dict()) for p in batch)
+        count += len(batch)
+    yield f'],"count":{count}}}\n'
+
+
 def _parse_project_data(data: dict) -> dict:
     """Parse and prepare project data from request JSON.
 
-    Converts date strings to date objects.
+    Converts date strings to date objects. Invalid dates are rejected here,
+    before any service or database work is done.
 
     Args:
         data: Raw request JSON data.
 
     Returns:
         Prepared data dict for service layer.
+
+    Raises:
+        ValueError: If a date field is not a valid YYYY-MM-DD date.
     """
     result = {}
 
@@ -140,12 +277,14 @@ def _parse_project_data(data: dict) -> dict:
     ]
     for field in date_fields:
         if field in data:
-            if data[field]:
-                parsed = _parse_date(data[field])
-                if parsed:
-                    result[field] = parsed
-                else:
-                    result[field] = data[field]  # Let service handle invalid
+            value = data[field]
+            if value:
+                parsed = parse_date(value)
+                if parsed is None:
+                    raise ValueError(
+                        f"Invalid date for {field}: {value!r}. Expected YYYY-MM-DD."
+                    )
+                result[field] = parsed
             else:
                 result[field] = None
 
@@ -180,11 +319,11 @@ def get_projects():
         JSON array of projects with count.
     """
     filters = _build_filters_from_request()
-    projects = project_service.get_all_projects(filters)
-    return jsonify({
-        'data': [p.to_dict() for p in projects],
-        'count': len(projects)
-    })
+    projects = project_service.iter_projects(filters, batch_size=_STREAM_BATCH_SIZE)
+    return Response(
+        stream_with_context(_stream_project_list(projects)),
+        mimetype='application/json',
+    )
 
 
 @projects_bp.route('/projects/<int:id>', methods=['GET'])
@@ -220,15 +359,42 @@ def create_project():
     if not data:
         return jsonify({'error': 'Request body must be JSON'}), 400
 
-    parsed_data = _parse_project_data(data)
-
     try:
-        project = project_service.create_project(parsed_data)
+        project = project_service.create_project(_parse_project_data(data))
         return jsonify({'data': project.to_dict()}), 201
     except ValueError as e:
         return jsonify({'error': str(e)}), 400
 
 
+@projects_bp.route('/projects/bulk', methods=['POST'])
+def bulk_create_projects():
+    """Create many projects in one request.
+
+    Request Body (JSON):
+        Array of project objects, each with the same fields as
+        POST /projects.
+
+    Returns:
+        201 with the created project IDs, or 400 on validation error.
+        If any row is invalid, no projects are created.
+    """
+    data = request.get_json(silent=True)
+    if not data or not isinstance(data, list) or not all(isinstance(row, dict) for row in data):
+        return jsonify({'error': 'Request body must be a non-empty JSON array of objects'}), 400
+
+    try:
+        rows = []
+        for index, row in enumerate(data):
+            try:
+                rows.append(_parse_project_data(row))
+            except ValueError as e:
+                raise ValueError(f"Row {index}: {e}") from e
+        ids = project_service.bulk_create_projects(rows)
+        return jsonify({'data': ids, 'count': len(ids)}), 201
+    except ValueError as e:
+        return jsonify({'error': str(e)}), 400
+
+
 @projects_bp.route('/projects/<int:id>', methods=['PUT'])
 def update_project(id: int):
     """Update an existing project.
@@ -246,10 +412,8 @@ def update_project(id: int):
     if not data:
         return jsonify({'error': 'Request body must be JSON'}), 400
 
-    parsed_data = _parse_project_data(data)
-
     try:
-        project = project_service.update_project(id, parsed_data)
+        project = project_service.update_project(id, _parse_project_data(data))
         if not project:
             return jsonify({'error': 'Project not found'}), 404
         return jsonify({'data': project.to_dict()})
@@ -320,14 +484,46 @@ def autocomplete(field: str):
         field: Field name (department, assigned_attorney, qcp_attorney,
                status, project_group).
 
+    The response carries an ETag; clients revalidate on each use and get a
+    304 with no body while the values are unchanged.
+
     Returns:
-        JSON array of distinct values, or 400 if field is invalid.
+        JSON array of distinct values, 304 if the client's copy is current,
+        or 400 if field is invalid.
     """
-    try:
-        values = project_service.get_distinct_values(field)
-        return jsonify({'data': values})
-    except ValueError as e:
-        return jsonify({'error': str(e)}), 400
+    if field not in _AUTOCOMPLETE_FIELDS:
+        return _invalid_autocomplete_field(field)
+    return conditional_json({'data': project_service.get_distinct_values(field)})
+
+
+@projects_bp.route('/api/autocomplete', methods=['GET'])
+def autocomplete_bulk():
+    """Get distinct values for several fields in one request.
+
+    Query Parameters:
+        fields: Comma-separated field names (department, assigned_attorney,
+                qcp_attorney, status, project_group). May be repeated.
+
+    Like the single-field endpoint, responses carry an ETag and unchanged
+    values are answered with 304.
+
+    Returns:
+        JSON object mapping each field to its distinct values, 304 if the
+        client's copy is current, or 400 if fields is missing or invalid.
+    """
+    fields = []
+    for value in request.args.getlist('fields'):
+        for field in value.split(','):
+            field = field.strip()
+            if field and field not in fields:
+                fields.append(field)
+    if not fields:
+        return jsonify({'error': 'fields parameter is required'}), 400
+
+    for field in fields:
+        if field not in _AUTOCOMPLETE_FIELDS:
+            return _invalid_autocomplete_field(field)
+    return conditional_json(project_service.get_distinct_values_bulk(fields))
 
 
 # ============================================================================
@@ -348,19 +544,14 @@ def projects_page():
     projects = project_service.get_all_projects(filters)
 
     # Get distinct values for filter dropdowns
-    statuses = [s for s in ProjectStatus.ALL]
-    departments = project_service.get_distinct_values('department')
-    attorneys = project_service.get_distinct_values('assigned_attorney')
-    qcp_attorneys = project_service.get_distinct_values('qcp_attorney')
+    statuses = ProjectStatus.ALL
 
     return render_template(
         'projects.html',
         projects=projects,
         statuses=statuses,
-        departments=departments,
-        attorneys=attorneys,
-        qcp_attorneys=qcp_attorneys,
-        filters=request.args
+        filters=request.args,
+        **_autocomplete_values()
     )
 
 
@@ -374,14 +565,7 @@ def projects_table_rows():
     Returns:
         HTML fragment containing table rows.
     """
-    filters = _build_filters_from_request()
-    projects = project_service.get_all_projects(filters)
-
-    return render_template(
-        'partials/project_table_rows.html',
-        projects=projects,
-        is_htmx=True  # Flag to include OOB swap for results count
-    )
+    return _render_table_rows(_build_filters_from_request())
 
 
 # ============================================================================
@@ -404,73 +588,60 @@ def new_project_form():
         HTML page with new project form.
     """
     # Check for clone parameters
-    clone_from = request.args.get('clone_from')
-    is_clone = clone_from is not None
-
-    # Build prefill data from query params
-    prefill = {
-        'project_name': request.args.get('project_name', ''),
-        'department': request.args.get('department', ''),
-        'assigned_attorney': request.args.get('assigned_attorney', ''),
-        'qcp_attorney': request.args.get('qcp_attorney', ''),
-        'project_group': request.args.get('project_group', ''),
-        'date_to_client': request.args.get('date_to_client', ''),
-        'date_assigned_to_us': request.args.get('date_assigned_to_us', ''),
-        'internal_deadline': request.args.get('internal_deadline', ''),
-        'delivery_deadline': request.args.get('delivery_deadline', ''),
-        'notes': request.args.get('notes', ''),
-    }
+    is_clone = request.args.get('clone_from') is not None
+
+    return _render_new_project_form(request.args, is_clone=is_clone)
 
-    # Get distinct values for autocomplete
-    departments = project_service.get_distinct_values('department')
-    attorneys = project_service.get_distinct_values('assigned_attorney')
-    qcp_attorneys = project_service.get_distinct_values('qcp_attorney')
+
+def _render_new_project_form(source, error: Optional[str] = None, is_clone: bool = False):
+    """Render the new project form, pre-filled from request values.
+
+    Used both for the initial page (pre-filled from query parameters) and
+    to re-render after a failed submission (preserving the posted form).
+
+    Args:
+        source: Mapping to pre-fill from (request.args or request.form).
+        error: Optional error message to display.
+        is_clone: Whether the form is cloning an existing project.
+
+    Returns:
+        Rendered project_form.html template.
+    """
+    prefill = {field: source.get(field, '') for field in _PREFILL_FIELDS}
 
     return render_template(
         'project_form.html',
         prefill=prefill,
         is_clone=is_clone,
-        departments=departments,
-        attorneys=attorneys,
-        qcp_attorneys=qcp_attorneys,
-        today=date.today().strftime('%Y-%m-%d')
+        today=project_service.current_date().strftime('%Y-%m-%d'),
+        error=error,
+        **_autocomplete_values()
     )
 
 
-def _render_project_form_with_error(error_message: str):
-    """Helper to re-render the new project form with an error message.
+def _parse_date_form_fields(form) -> tuple[dict, Optional[str]]:
+    """Parse the date inputs of a submitted project form.
 
-    Preserves all form data the user entered and fetches autocomplete values.
+    Blank inputs become None.
 
     Args:
-        error_message: The error message to display.
+        form: Submitted form data (request.form).
 
     Returns:
-        Rendered project_form.html template with error and preserved data.
+        Tuple of (parsed dates by field, error message or None). Parsing
+        stops at the first invalid date.
     """
-    prefill = {
-        'project_name': request.form.get('project_name', ''),
-        'project_group': request.form.get('project_group', ''),
-        'department': request.form.get('department', ''),
-        'assigned_attorney': request.form.get('assigned_attorney', ''),
-        'qcp_attorney': request.form.get('qcp_attorney', ''),
-        'date_to_client': request.form.get('date_to_client', ''),
-        'date_assigned_to_us': request.form.get('date_assigned_to_us', ''),
-        'internal_deadline': request.form.get('internal_deadline', ''),
-        'delivery_deadline': request.form.get('delivery_deadline', ''),
-        'notes': request.form.get('notes', ''),
-    }
-
-    return render_template(
-        'project_form.html',
-        prefill=prefill,
-        is_clone=False,
-        departments=project_service.get_distinct_values('department'),
-        attorneys=project_service.get_distinct_values('assigned_attorney'),
-        qcp_attorneys=project_service.get_distinct_values('qcp_attorney'),
-        today=date.today().strftime('%Y-%m-%d'),
-        error=error_message
-    )
+    dates = {}
+    for field in _FORM_DATE_FIELDS:
+        date_str = form.get(field, '').strip()
+        if not date_str:
+            dates[field] = None
+            continue
+        parsed = parse_date(date_str)
+        if parsed is None:
+            return dates, f'Invalid date format for {field.replace("_", " ").title()}'
+        dates[field] = parsed
+    return dates, None
 
 
 @projects_bp.route('/projects/create', methods=['POST'])
@@ -484,39 +655,27 @@ def create_project_form():
         Redirect to projects page on success, or re-render form with errors.
     """
     # Parse form data
+    form = request.form
     form_data = {
-        'project_name': request.form.get('project_name', '').strip(),
-        'project_group': request.form.get('project_group', '').strip() or None,
-        'department': request.form.get('department', '').strip(),
-        'assigned_attorney': request.form.get('assigned_attorney', '').strip(),
-        'qcp_attorney': request.form.get('qcp_attorney', '').strip(),
-        'status': request.form.get('status', 'In Progress').strip(),
+        'project_name': form.get('project_name', '').strip(),
+        'project_group': form.get('project_group', '').strip() or None,
+        'department': form.get('department', '').strip(),
+        'assigned_attorney': form.get('assigned_attorney', '').strip(),
+        'qcp_attorney': form.get('qcp_attorney', '').strip(),
+        'status': form.get('status', 'In Progress').strip(),
     }
 
-    # Parse date fields
-    date_fields = ['date_to_client', 'date_assigned_to_us', 'internal_deadline', 'delivery_deadline']
-    date_error = None
-    for field in date_fields:
-        date_str = request.form.get(field, '').strip()
-        if date_str:
-            parsed = _parse_date(date_str)
-            if parsed:
-                form_data[field] = parsed
-            else:
-                date_error = f'Invalid date format for {field.replace("_", " ").title()}'
-                break
-        else:
-            form_data[field] = None
+    # Parse date fields; on error, re-render the form
+    dates, date_error = _parse_date_form_fields(form)
+    if date_error:
+        return _render_new_project_form(form, error=date_error)
+    form_data.update(dates)
 
     # Handle initial notes
-    notes = request.form.get('notes', '').strip()
+    notes = form.get('notes', '').strip()
     if notes:
         form_data['notes'] = notes
 
-    # If date parse error, re-render form
-    if date_error:
-        return _render_project_form_with_error(date_error)
-
     try:
         # Create the project
         project = project_service.create_project(form_data)
@@ -524,7 +683,7 @@ def create_project_form():
         return redirect(url_for('projects.projects_page'))
 
     except ValueError as e:
-        return _render_project_form_with_error(str(e))
+        return _render_new_project_form(form, error=str(e))
 
 
 # ============================================================================
@@ -549,7 +708,7 @@ def view_project(id: int):
     return render_template(
         'project_detail.html',
         project=project,
-        today=date.today()
+        today=project_service.current_date()
     )
 
 
@@ -570,17 +729,12 @@ def edit_project_form(id: int):
 
     # Get autocomplete values for dropdowns
     statuses = ProjectStatus.ALL
-    departments = project_service.get_distinct_values('department')
-    attorneys = project_service.get_distinct_values('assigned_attorney')
-    qcp_attorneys = project_service.get_distinct_values('qcp_attorney')
 
     return render_template(
         'project_edit.html',
         project=project,
         statuses=statuses,
-        departments=departments,
-        attorneys=attorneys,
-        qcp_attorneys=qcp_attorneys
+        **_autocomplete_values()
     )
 
 
@@ -597,34 +751,23 @@ def update_project_form(id: int):
     Returns:
         Redirect to detail page on success, or re-render form with errors.
     """
-    project = project_service.get_project(id)
-    if not project:
-        flash('Project not found', 'danger')
-        return redirect(url_for('projects.projects_page'))
-
-    # Parse form data
+    # Parse form data. A missing project is detected by update_project().
+    form = request.form
     form_data = {
-        'project_name': request.form.get('project_name', '').strip(),
-        'project_group': request.form.get('project_group', '').strip() or None,
-        'department': request.form.get('department', '').strip(),
-        'assigned_attorney': request.form.get('assigned_attorney', '').strip(),
-        'qcp_attorney': request.form.get('qcp_attorney', '').strip(),
-        'status': request.form.get('status', '').strip(),
+        'project_name': form.get('project_name', '').strip(),
+        'project_group': form.get('project_group', '').strip() or None,
+        'department': form.get('department', '').strip(),
+        'assigned_attorney': form.get('assigned_attorney', '').strip(),
+        'qcp_attorney': form.get('qcp_attorney', '').strip(),
+        'status': form.get('status', '').strip(),
     }
 
     # Parse date fields
-    date_fields = ['date_to_client', 'date_assigned_to_us', 'internal_deadline', 'delivery_deadline']
-    for field in date_fields:
-        date_str = request.form.get(field, '').strip()
-        if date_str:
-            parsed = _parse_date(date_str)
-            if parsed:
-                form_data[field] = parsed
-            else:
-                flash(f'Invalid date format for {field.replace("_", " ")}', 'danger')
-                return redirect(url_for('projects.edit_project_form', id=id))
-        else:
-            form_data[field] = None
+    dates, date_error = _parse_date_form_fields(form)
+    if date_error:
+        flash(date_error, 'danger')
+        return redirect(url_for('projects.edit_project_form', id=id))
+    form_data.update(dates)
 
     try:
         # Update the project
@@ -634,7 +777,7 @@ def update_project_form(id: int):
             return redirect(url_for('projects.projects_page'))
 
         # Handle new note if provided
-        new_note = request.form.get('new_note', '').strip()
+        new_note = form.get('new_note', '').strip()
         if new_note:
             project_service.append_note(id, new_note)
 
@@ -658,21 +801,23 @@ def clone_project(id: int):
     Returns:
         Redirect to new project form with query params, or projects page if not found.
     """
-    project = project_service.get_project(id)
+    project = project_service.get_project_fields(id, _CLONE_FIELDS)
     if not project:
         flash('Project not found', 'danger')
         return redirect(url_for('projects.projects_page'))
 
-    # Redirect to new project form with pre-filled data
-    return redirect(url_for(
-        'projects.new_project_form',
-        clone_from=id,
-        project_name=f'Copy of {project.project_name}',
-        department=project.department,
-        assigned_attorney=project.assigned_attorney,
-        qcp_attorney=project.qcp_attorney,
-        project_group=project.project_group or ''
-    ))
+    # Redirect to new project form with pre-filled data; empty values
+    # (e.g. no project group) are left out of the query string
+    params = {
+        'clone_from': id,
+        'project_name': f"Copy of {project['project_name']}",
+        'department': project['department'],
+        'assigned_attorney': project['assigned_attorney'],
+        'qcp_attorney': project['qcp_attorney'],
+        'project_group': project['project_group'],
+    }
+    query = urlencode({name: value for name, value in params.items() if value})
+    return redirect(f"{url_for('projects.new_project_form')}?{query}")
 
 
 @projects_bp.route('/projects/<int:id>/delete', methods=['POST'])
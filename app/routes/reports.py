@@ -5,47 +5,15 @@ Routes call the service layer; they handle HTTP concerns only.
 """
 from datetime import datetime
 
-from flask import Blueprint, Response, render_template, request
+from flask import Blueprint, Response, render_template, request, stream_with_context
 
 from app.models import ProjectStatus
+from app.routes._utils import parse_bool, parse_int
 from app.services import report_service
 
 reports_bp = Blueprint('reports', __name__)
 
 
-def _parse_int(value: str, default: int) -> int:
-    """Parse an integer from a string value.
-
-    Args:
-        value: String value to parse.
-        default: Default value if parsing fails.
-
-    Returns:
-        Integer value.
-    """
-    if not value:
-        return default
-    try:
-        return int(value)
-    except ValueError:
-        return default
-
-
-def _parse_bool(value: str, default: bool = False) -> bool:
-    """Parse a boolean query parameter.
-
-    Args:
-        value: String value to parse.
-        default: Default value if parsing fails.
-
-    Returns:
-        Boolean value.
-    """
-    if value is None:
-        return default
-    return value.lower() in ('true', '1', 'yes')
-
-
 def _build_filters_from_request() -> dict:
     """Build a filters dict from request query parameters.
 
@@ -54,10 +22,11 @@ def _build_filters_from_request() -> dict:
     Returns:
         Dictionary of filter parameters for the service layer.
     """
+    args = request.args
     filters = {}
 
     # Status filter - can be comma-separated
-    status = request.args.get('status')
+    status = args.get('status')
     if status:
         status_list = [s.strip() for s in status.split(',') if s.strip()]
         if status_list:
@@ -65,29 +34,15 @@ def _build_filters_from_request() -> dict:
 
     # include_completed logic: if false (default), exclude Completed status
     # unless status filter is explicitly provided
-    include_completed = _parse_bool(request.args.get('include_completed'), False)
+    include_completed = parse_bool(args.get('include_completed'), False)
     if not include_completed and 'status' not in filters:
-        filters['status'] = [
-            s for s in ProjectStatus.ALL if s != ProjectStatus.COMPLETED
-        ]
-
-    # Other text filters
-    if request.args.get('department'):
-        filters['department'] = request.args.get('department')
-    if request.args.get('assigned_attorney'):
-        filters['assigned_attorney'] = request.args.get('assigned_attorney')
-    if request.args.get('qcp_attorney'):
-        filters['qcp_attorney'] = request.args.get('qcp_attorney')
-
-    # Search term
-    if request.args.get('search'):
-        filters['search'] = request.args.get('search')
-
-    # Sorting
-    if request.args.get('sort_by'):
-        filters['sort_by'] = request.args.get('sort_by')
-    if request.args.get('sort_dir'):
-        filters['sort_dir'] = request.args.get('sort_dir')
+        filters['status'] = ProjectStatus.ACTIVE
+
+    # Other text filters, search term and sorting
+    for field in ('department', 'assigned_attorney', 'qcp_attorney', 'search', 'sort_by', 'sort_dir'):
+        value = args.get(field)
+        if value:
+            filters[field] = value
 
     return filters
 
@@ -166,8 +121,8 @@ def monthly_report():
     """
     now = datetime.now()
 
-    year = _parse_int(request.args.get('year'), now.year)
-    month = _parse_int(request.args.get('month'), now.month)
+    year = parse_int(request.args.get('year'), now.year)
+    month = parse_int(request.args.get('month'), now.month)
 
     # Validate month range
     if month < 1:
@@ -201,12 +156,9 @@ def export_csv():
     """
     filters = _build_filters_from_request()
 
-    # Generate CSV content
-    csv_content = report_service.export_projects_csv(filters)
-
-    # Create response with appropriate headers for CSV download
+    # Stream CSV content as rows are read from the database
     response = Response(
-        csv_content,
+        stream_with_context(report_service.iter_projects_csv(filters)),
         mimetype='text/csv; charset=utf-8',
     )
     response.headers['Content-Disposition'] = 'attachment; filename=projects_export.csv'
@@ -6,40 +6,56 @@ This separation keeps routes thin and logic testable.
 """
 from app.services.project_service import (
     create_project,
+    bulk_create_projects,
     get_project,
+    get_project_fields,
     get_all_projects,
+    iter_projects,
+    iter_project_rows,
     update_project,
     delete_project,
     append_note,
     get_distinct_values,
+    get_distinct_values_bulk,
     get_overdue_projects,
     get_due_this_week,
     get_longer_deadline,
     get_recently_completed,
+    get_dashboard_buckets,
+    current_date,
 )
 from app.services.report_service import (
     get_weekly_status_data,
     get_monthly_stats,
     export_projects_csv,
+    iter_projects_csv,
     get_available_weekly_fields,
 )
 
 __all__ = [
     # Project service
     'create_project',
+    'bulk_create_projects',
     'get_project',
+    'get_project_fields',
     'get_all_projects',
+    'iter_projects',
+    'iter_project_rows',
     'update_project',
     'delete_project',
     'append_note',
     'get_distinct_values',
+    'get_distinct_values_bulk',
     'get_overdue_projects',
     'get_due_this_week',
     'get_longer_deadline',
     'get_recently_completed',
+    'get_dashboard_buckets',
+    'current_date',
     # Report service
     'get_weekly_status_data',
     'get_monthly_stats',
     'export_projects_csv',
+    'iter_projects_csv',
     'get_available_weekly_fields',
 ]
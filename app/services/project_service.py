@@ -4,23 +4,167 @@ This module provides the service layer for project CRUD operations,
 implementing soft delete, soft normalization, filtering, and sorting.
 Routes call these functions; they interact with models and database.
 """
-from datetime import datetime, timedelta, timezone
-from typing import Optional
+import itertools
+import time
+from datetime import date, datetime, timedelta, timezone
+from typing import Iterator, Optional
 
-from sqlalchemy import func, or_
+from flask import current_app, has_app_context, has_request_context, request
+from sqlalchemy import Row, event, func, insert, inspect, literal, or_, select, union_all, update
+from sqlalchemy.orm import Session, raiseload
+from sqlalchemy.orm.attributes import set_committed_value
 
 from app import db
-from app.models import Project, ProjectStatus
+from app.models import SEARCH_FIELDS, Project, ProjectStatus
 
 
 # Fields that should be soft-normalized (case-matched to existing values)
 NORMALIZED_FIELDS = ['department', 'assigned_attorney', 'qcp_attorney']
 
+# Dashboard sections returned by get_dashboard_buckets()
+DASHBOARD_BUCKETS = ('overdue', 'due_this_week', 'longer_deadline', 'recently_completed')
+
+# Fields accepted when creating a project; the rest are system-managed
+CREATE_FIELDS = (
+    'project_name', 'project_group', 'department', 'date_to_client',
+    'date_assigned_to_us', 'internal_deadline', 'delivery_deadline',
+    'assigned_attorney', 'qcp_attorney', 'status', 'notes',
+)
+
+# Column attribute names of Project, in table order
+_COLUMN_KEYS = tuple(column.key for column in Project.__table__.columns)
+
+# Columns update_project may set; identity and lifecycle columns are excluded
+_UPDATABLE_COLUMNS = frozenset(_COLUMN_KEYS) - {'id', 'created_at', 'deleted_at'}
+
+# Fields supported by get_distinct_values()
+DISTINCT_FIELDS = ['department', 'assigned_attorney', 'qcp_attorney', 'status', 'project_group']
+
+# ORDER BY clause for each (column, direction) accepted as sort_by/sort_dir,
+# built once so list queries reuse the same expression objects
+_SORT_CLAUSES = {
+    (column.key, direction): (
+        column.desc() if direction == 'desc' else column.asc()
+    ).nulls_last()
+    for column in Project.__table__.columns
+    for direction in ('asc', 'desc')
+}
+
+# Key in app.extensions holding the distinct-values cache
+_DISTINCT_CACHE_KEY = 'project_distinct_values'
+_CANONICAL_CACHE_KEY = 'project_canonical_values'
+_DATA_VERSION_KEY = 'project_data_version'
+# Key in Session.info flagging flushed but uncommitted Project writes
+_PROJECT_WRITES_KEY = 'project_writes_pending'
+
+
+# ============================================================================
+# Data Version
+# ============================================================================
+
+def get_data_version() -> int:
+    """Get a counter that changes whenever project data is written.
+
+    Callers that cache results derived from projects can include this in
+    their cache key; any insert, update or delete made by this process
+    produces a new version, so stale entries are never served from it.
+
+    Returns:
+        The current app's project data version.
+    """
+    return current_app.extensions.get(_DATA_VERSION_KEY, 0)
+
+
+def bump_data_version() -> None:
+    """Mark project data as changed for the current app.
+
+    Called automatically when a session that flushed Project rows commits.
+    Writes that bypass the ORM unit of work (Core inserts/updates) must call
+    this themselves, after their commit.
+    """
+    if has_app_context():
+        current_app.extensions[_DATA_VERSION_KEY] = get_data_version() + 1
+
+
+@event.listens_for(Session, 'after_flush')
+def _on_session_flush(session, flush_context) -> None:
+    """Record that the session's transaction has written Project rows.
+
+    The version is not bumped yet: until commit, other requests still see
+    the old rows and could cache them under the new version.
+    """
+    for obj in itertools.chain(session.new, session.dirty, session.deleted):
+        if isinstance(obj, Project) and (obj not in session.dirty or session.is_modified(obj)):
+            session.info[_PROJECT_WRITES_KEY] = True
+            return
+
+
+@event.listens_for(Session, 'after_commit')
+def _on_session_commit(session) -> None:
+    """Bump the data version once the recorded Project writes are committed."""
+    if session.info.pop(_PROJECT_WRITES_KEY, False):
+        bump_data_version()
+
+
+@event.listens_for(Session, 'after_rollback')
+def _on_session_rollback(session) -> None:
+    """Forget recorded Project writes that were rolled back."""
+    session.info.pop(_PROJECT_WRITES_KEY, None)
+
+
+# ============================================================================
+# Distinct Values Cache
+# ============================================================================
+
+def invalidate_distinct_values(fields: Optional[list[str]] = None) -> None:
+    """Clear the current app's cached distinct values.
+
+    Called automatically whenever a Project row is inserted, updated or
+    deleted through the ORM.
+
+    Args:
+        fields: Fields to invalidate. None clears every field.
+    """
+    if not has_app_context():
+        return
+    if fields is None:
+        current_app.extensions.pop(_DISTINCT_CACHE_KEY, None)
+        return
+    cache = current_app.extensions.get(_DISTINCT_CACHE_KEY)
+    if cache:
+        for field in fields:
+            cache.pop(field, None)
+
+
+@event.listens_for(Project, 'after_insert')
+@event.listens_for(Project, 'after_delete')
+def _on_project_insert_or_delete(mapper, connection, target) -> None:
+    """Invalidate all cached distinct values when a project is added or removed."""
+    invalidate_distinct_values()
+
+
+@event.listens_for(Project, 'after_update')
+def _on_project_update(mapper, connection, target) -> None:
+    """Invalidate cached distinct values for the fields an update changed.
+
+    Soft-deleting or restoring a project can change every field's values;
+    other updates (e.g. appending a note) only affect the fields they touch.
+    """
+    attrs = inspect(target).attrs
+    if attrs.deleted_at.history.has_changes():
+        invalidate_distinct_values()
+        return
+    changed = [field for field in DISTINCT_FIELDS if attrs[field].history.has_changes()]
+    if changed:
+        invalidate_distinct_values(changed)
+
 
 def get_distinct_values(field: str) -> list[str]:
     """Get distinct values for a field from non-deleted projects.
 
-    Used for autocomplete functionality and soft normalization.
+    Used for autocomplete functionality and soft normalization. Results
+    are cached per app for DISTINCT_VALUES_CACHE_TTL seconds; the returned
+    list may be shared between callers and must not be modified.
 
     Args:
         field: Field name to get distinct values for.
@@ -32,54 +176,119 @@ def get_distinct_values(field: str) -> list[str]:
     Raises:
         ValueError: If field is not a valid column name.
     """
-    valid_fields = ['department', 'assigned_attorney', 'qcp_attorney', 'status', 'project_group']
-    if field not in valid_fields:
-        raise ValueError(f"Invalid field: {field}. Must be one of: {valid_fields}")
-
-    column = getattr(Project, field)
-    results = (
-        db.session.query(column)
-        .filter(Project.deleted_at.is_(None))
-        .filter(column.isnot(None))
-        .filter(column != '')
-        .distinct()
-        .order_by(column)
-        .all()
-    )
-    return [r[0] for r in results]
+    return get_distinct_values_bulk([field])[field]
 
 
-def _normalize_field(field_name: str, value: Optional[str]) -> Optional[str]:
-    """Normalize a field value to match existing canonical values.
+def get_distinct_values_bulk(fields: list[str]) -> dict[str, list[str]]:
+    """Get distinct values for several fields in one query.
 
-    Performs case-insensitive matching against existing values.
-    If a match is found, returns the canonical (existing) version.
-    Otherwise returns the value as-is (it becomes the new canonical).
+    Fields not already cached are fetched together with a UNION ALL of
+    per-field SELECT DISTINCT queries, tagged with the field name; a lone
+    uncached field is read with a plain SELECT DISTINCT. Shares
+    the cache used by get_distinct_values().
 
     Args:
-        field_name: The field being normalized.
-        value: The value to normalize.
+        fields: Field names to get distinct values for.
 
     Returns:
-        The normalized value.
+        Dictionary mapping each field to its sorted list of unique values.
+
+    Raises:
+        ValueError: If any field is not a valid column name.
     """
-    if not value:
-        return value
+    for field in fields:
+        if field not in DISTINCT_FIELDS:
+            raise ValueError(f"Invalid field: {field}. Must be one of: {DISTINCT_FIELDS}")
+
+    ttl = current_app.config.get('DISTINCT_VALUES_CACHE_TTL', 0)
+    cache = current_app.extensions.setdefault(_DISTINCT_CACHE_KEY, {})
+    now = time.monotonic()
+
+    result = {}
+    missing = []
+    for field in fields:
+        cached = cache.get(field)
+        if cached is not None and cached[1] > now:
+            result[field] = cached[0]
+        elif field not in missing:
+            missing.append(field)
+    if not missing:
+        return result
+
+    if len(missing) == 1:
+        # A single field needs no union or field tag; read the values as
+        # scalars rather than unpacking one-column rows.
+        field = missing[0]
+        column = getattr(Project, field)
+        stmt = (
+            select(column)
+            .where(Project.deleted_at.is_(None), column.isnot(None), column != '')
+            .distinct()
+            .order_by(column)
+        )
+        fetched = {field: db.session.scalars(stmt).all()}
+    else:
+        selects = []
+        for field in missing:
+            column = getattr(Project, field)
+            selects.append(
+                select(literal(field).label('field'), column.label('value'))
+                .where(Project.deleted_at.is_(None), column.isnot(None), column != '')
+                .distinct()
+            )
+        combined = union_all(*selects).subquery()
+        stmt = select(combined.c.field, combined.c.value).order_by(
+            combined.c.field, combined.c.value
+        )
+
+        fetched = {field: [] for field in missing}
+        for field, value in db.session.execute(stmt):
+            fetched[field].append(value)
+
+    for field, values in fetched.items():
+        if ttl > 0:
+            cache[field] = (values, now + ttl)
+        result[field] = values
+    return result
+
+
+def _canonical_lookup(fields: list[str]) -> dict[str, dict[str, str]]:
+    """Get case-insensitive lookups of existing values for several fields.
+
+    Each lookup maps a casefolded value to its canonical (existing)
+    spelling; when values differ only by case, the first in sorted order
+    wins. Values come from get_distinct_values_bulk() in one query, and
+    each lookup is rebuilt only when the cached value list changes. The
+    returned dicts are shared and must not be modified.
 
-    try:
-        existing = get_distinct_values(field_name)
-    except ValueError:
-        return value
+    Args:
+        fields: Field names to build lookups for.
 
-    for canonical in existing:
-        if canonical.lower() == value.lower():
-            return canonical
-    return value
+    Returns:
+        Dictionary mapping each field to its casefolded -> canonical dict.
+    """
+    cache = current_app.extensions.setdefault(_CANONICAL_CACHE_KEY, {})
+    lookups = {}
+    for field, values in get_distinct_values_bulk(fields).items():
+        cached = cache.get(field)
+        if cached is not None and cached[0] is values:
+            lookups[field] = cached[1]
+            continue
+        lookup = {}
+        for value in values:
+            lookup.setdefault(value.casefold(), value)
+        cache[field] = (values, lookup)
+        lookups[field] = lookup
+    return lookups
 
 
 def _apply_normalization(data: dict) -> dict:
     """Apply soft normalization to applicable fields in data dict.
 
+    Performs case-insensitive matching against existing values. If a match
+    is found, the canonical (existing) version is used; otherwise the value
+    is kept as-is (it becomes the new canonical).
+
     Args:
         data: Dictionary of project field values.
 
@@ -87,29 +296,26 @@ def _apply_normalization(data: dict) -> dict:
         New dictionary with normalized values for applicable fields.
     """
     result = data.copy()
-    for field in NORMALIZED_FIELDS:
-        if field in result and result[field]:
-            result[field] = _normalize_field(field, result[field])
+    fields = [field for field in NORMALIZED_FIELDS if result.get(field)]
+    if not fields:
+        return result
+    for field, lookup in _canonical_lookup(fields).items():
+        value = result[field]
+        result[field] = lookup.get(value.casefold(), value)
     return result
 
 
-def create_project(data: dict) -> Project:
-    """Create a new project.
-
-    Applies soft normalization to department and attorney fields.
+def _validate_new_project(data: dict) -> dict:
+    """Check required fields and status for a new project.
 
     Args:
         data: Dictionary containing project field values.
-              Required: project_name, department, date_to_client,
-                       date_assigned_to_us, assigned_attorney, qcp_attorney
-              Optional: project_group, internal_deadline, delivery_deadline,
-                       status (defaults to In Progress), notes
 
     Returns:
-        The created Project instance with ID populated.
+        Copy of data with status defaulted to In Progress.
 
     Raises:
-        ValueError: If required fields are missing.
+        ValueError: If required fields are missing or status is invalid.
     """
     required_fields = [
         'project_name', 'department', 'date_to_client',
@@ -119,17 +325,38 @@ def create_project(data: dict) -> Project:
     if missing:
         raise ValueError(f"Missing required fields: {missing}")
 
-    # Apply soft normalization
-    normalized_data = _apply_normalization(data)
+    result = data.copy()
 
     # Set default status if not provided
-    if 'status' not in normalized_data or not normalized_data['status']:
-        normalized_data['status'] = ProjectStatus.IN_PROGRESS
-    elif normalized_data['status'] not in ProjectStatus.ALL:
+    if 'status' not in result or not result['status']:
+        result['status'] = ProjectStatus.IN_PROGRESS
+    elif result['status'] not in ProjectStatus.ALL_SET:
         raise ValueError(
-            f"Invalid status: {normalized_data['status']}. "
+            f"Invalid status: {result['status']}. "
             f"Must be one of: {ProjectStatus.ALL}"
         )
+    return result
+
+
+def create_project(data: dict) -> Project:
+    """Create a new project.
+
+    Applies soft normalization to department and attorney fields.
+
+    Args:
+        data: Dictionary containing project field values.
+              Required: project_name, department, date_to_client,
+                       date_assigned_to_us, assigned_attorney, qcp_attorney
+              Optional: project_group, internal_deadline, delivery_deadline,
+                       status (defaults to In Progress), notes
+
+    Returns:
+        The created Project instance with ID populated.
+
+    Raises:
+        ValueError: If required fields are missing.
+    """
+    normalized_data = _apply_normalization(_validate_new_project(data))
 
     project = Project(**normalized_data)
     db.session.add(project)
@@ -137,6 +364,71 @@ def create_project(data: dict) -> Project:
     return project
 
 
+def bulk_create_projects(rows: list[dict]) -> list[int]:
+    """Create many projects with a single multi-row INSERT.
+
+    Each row is validated and soft-normalized as in create_project();
+    values introduced earlier in the batch become canonical for later
+    rows. Rows are inserted without loading ORM objects and committed
+    together, so either all rows are created or none are.
+
+    Args:
+        rows: List of dictionaries of project field values.
+
+    Returns:
+        IDs of the created projects, in the same order as rows.
+
+    Raises:
+        ValueError: If any row is missing required fields or has an
+            invalid status. The message identifies the row index.
+    """
+    # Copied, since values introduced by this batch are added to them
+    canonical = {
+        field: dict(lookup)
+        for field, lookup in _canonical_lookup(NORMALIZED_FIELDS).items()
+    }
+
+    prepared = []
+    for index, data in enumerate(rows):
+        try:
+            row = _validate_new_project(data)
+        except ValueError as e:
+            raise ValueError(f"Row {index}: {e}") from None
+        for field in NORMALIZED_FIELDS:
+            value = row.get(field)
+            if value:
+                row[field] = canonical[field].setdefault(value.casefold(), value)
+        prepared.append({field: row.get(field) for field in CREATE_FIELDS})
+
+    if not prepared:
+        return []
+
+    stmt = insert(Project).returning(Project.id, sort_by_parameter_order=True)
+    ids = list(db.session.execute(stmt, prepared).scalars())
+    db.session.commit()
+
+    # Bulk inserts bypass the ORM events that normally clear the caches
+    invalidate_distinct_values()
+    bump_data_version()
+    return ids
+
+
+def _list_query():
+    """Start a query for a list of projects.
+
+    With SQLALCHEMY_RAISELOAD enabled (as in tests), any relationship lazy
+    load on the results raises instead of silently issuing one query per
+    row, so N+1 patterns surface before they reach production.
+
+    Returns:
+        Query over Project.
+    """
+    query = db.session.query(Project)
+    if current_app.config.get('SQLALCHEMY_RAISELOAD', False):
+        query = query.options(raiseload('*'))
+    return query
+
+
 def get_project(id: int) -> Optional[Project]:
     """Get a project by ID, excluding soft-deleted projects.
 
@@ -152,6 +444,35 @@ def get_project(id: int) -> Optional[Project]:
     return None
 
 
+def get_project_fields(id: int, fields: list[str]) -> Optional[dict]:
+    """Get selected column values for a project, excluding soft-deleted projects.
+
+    Selects only the requested columns instead of loading the full row
+    (including notes) into an ORM object.
+
+    Args:
+        id: The project ID to retrieve.
+        fields: Column names to select.
+
+    Returns:
+        Dictionary of the requested column values if found and not
+        deleted, None otherwise.
+
+    Raises:
+        ValueError: If a field is not a column of the projects table.
+    """
+    table_columns = Project.__table__.columns
+    invalid = [f for f in fields if f not in table_columns]
+    if invalid:
+        raise ValueError(f"Invalid fields: {invalid}")
+
+    row = db.session.execute(
+        select(*(table_columns[f] for f in fields))
+        .where(Project.id == id, Project.deleted_at.is_(None))
+    ).mappings().one_or_none()
+    return dict(row) if row is not None else None
+
+
 def _parse_status_filter(status_input) -> list[str]:
     """Parse status filter input into a normalized list of status values.
 
@@ -174,6 +495,10 @@ def _parse_status_filter(status_input) -> list[str]:
         # Single string, possibly comma-separated
         return [s.strip() for s in status_input.split(',') if s.strip()]
 
+    # Known status values (e.g. the ProjectStatus.ACTIVE default) need no splitting
+    if ProjectStatus.ALL_SET.issuperset(status_input):
+        return list(status_input)
+
     # List of strings, each possibly comma-separated
     all_statuses = []
     for s in status_input:
@@ -181,33 +506,18 @@ def _parse_status_filter(status_input) -> list[str]:
     return all_statuses
 
 
-def get_all_projects(filters: dict = None) -> list[Project]:
-    """Get all projects with optional filtering and sorting.
-
-    By default excludes soft-deleted projects and includes all statuses.
+def _filtered_query(filters: dict = None):
+    """Build the filtered, sorted project query behind get_all_projects().
 
     Args:
-        filters: Optional dictionary with filter/sort parameters:
-            - status: Single status string, comma-separated string, or list
-            - department: Department name (case-insensitive)
-            - assigned_attorney: Attorney name (case-insensitive)
-            - qcp_attorney: QCP attorney name (case-insensitive)
-            - include_deleted: If True, includes soft-deleted projects
-            - delivery_deadline_from: Minimum delivery deadline (date)
-            - delivery_deadline_to: Maximum delivery deadline (date)
-            - date_assigned_from: Minimum date assigned (date)
-            - date_assigned_to: Maximum date assigned (date)
-            - search: Multi-term search string (searches project_name,
-                     department, notes, project_group with ilike)
-            - sort_by: Field name to sort by (default: delivery_deadline)
-            - sort_dir: 'asc' or 'desc' (default: asc)
+        filters: Filter/sort parameters as described in get_all_projects().
 
     Returns:
-        List of Project instances matching the filters.
+        Query over Project.
     """
     filters = filters or {}
 
-    query = db.session.query(Project)
+    query = _list_query()
 
     # Soft delete filter (default: exclude deleted)
     if not filters.get('include_deleted', False):
@@ -219,6 +529,10 @@ def get_all_projects(filters: dict = None) -> list[Project]:
         if status_values:
             query = query.filter(Project.status.in_(status_values))
 
+    # Text filters are case-insensitive. lower(column) matches the partial
+    # ix_projects_<field>_lower expression indexes; the value is lowered in
+    # SQL too so both sides use the database's case folding.
+
     # Department filter (case-insensitive)
     if 'department' in filters and filters['department']:
         query = query.filter(
@@ -265,32 +579,105 @@ def get_all_projects(filters: dict = None) -> list[Project]:
         for term in search_terms:
             pattern = f'%{term}%'
             term_filter = or_(
-                Project.project_name.ilike(pattern),
-                Project.department.ilike(pattern),
-                Project.notes.ilike(pattern),
-                Project.project_group.ilike(pattern)
+                *(getattr(Project, field).ilike(pattern) for field in SEARCH_FIELDS)
             )
             query = query.filter(term_filter)
 
-    # Sorting
+    # Sorting; unknown columns fall back to delivery_deadline
     sort_by = filters.get('sort_by', 'delivery_deadline')
-    sort_dir = filters.get('sort_dir', 'asc')
-
-    # Validate sort_by is a valid column
-    if hasattr(Project, sort_by):
-        sort_column = getattr(Project, sort_by)
-        if sort_dir.lower() == 'desc':
-            query = query.order_by(sort_column.desc().nulls_last())
-        else:
-            query = query.order_by(sort_column.asc().nulls_last())
-    else:
-        # Default to delivery_deadline if invalid sort_by
-        if sort_dir.lower() == 'desc':
-            query = query.order_by(Project.delivery_deadline.desc().nulls_last())
-        else:
-            query = query.order_by(Project.delivery_deadline.asc().nulls_last())
+    sort_dir = 'desc' if filters.get('sort_dir', 'asc').lower() == 'desc' else 'asc'
+    order = _SORT_CLAUSES.get((sort_by, sort_dir))
+    if order is None:
+        order = _SORT_CLAUSES[('delivery_deadline', sort_dir)]
+    query = query.order_by(order)
+
+    return query
+
+
+def get_all_projects(filters: dict = None) -> list[Project]:
+    """Get all projects with optional filtering and sorting.
+
+    By default excludes soft-deleted projects and includes all statuses.
+
+    Args:
+        filters: Optional dictionary with filter/sort parameters:
+            - status: Single status string, comma-separated string, or list
+            - department: Department name (case-insensitive)
+            - assigned_attorney: Attorney name (case-insensitive)
+            - qcp_attorney: QCP attorney name (case-insensitive)
+            - include_deleted: If True, includes soft-deleted projects
+            - delivery_deadline_from: Minimum delivery deadline (date)
+            - delivery_deadline_to: Maximum delivery deadline (date)
+            - date_assigned_from: Minimum date assigned (date)
+            - date_assigned_to: Maximum date assigned (date)
+            - search: Multi-term search string (searches project_name,
+                     department, notes, project_group with ilike)
+            - sort_by: Field name to sort by (default: delivery_deadline)
+            - sort_dir: 'asc' or 'desc' (default: asc)
+
+    Returns:
+        List of Project instances matching the filters.
+    """
+    return _filtered_query(filters).all()
+
+
+def iter_projects(filters: dict = None, batch_size: int = 500) -> Iterator[Project]:
+    """Iterate over projects matching filters without loading them all at once.
+
+    Accepts the same filters as get_all_projects(). Rows are fetched from
+    the database batch_size at a time, for exports of arbitrary size.
 
-    return query.all()
+    Args:
+        filters: Optional dictionary with filter/sort parameters.
+        batch_size: Number of rows to fetch per batch (default: 500).
+
+    Yields:
+        Project instances matching the filters, in sort order.
+    """
+    yield from _filtered_query(filters).yield_per(batch_size)
+
+
+def iter_project_rows(
+    filters: dict = None,
+    columns: Optional[list[str]] = None,
+    batch_size: int = 500,
+    max_lengths: Optional[dict[str, int]] = None,
+) -> Iterator[Row]:
+    """Iterate over selected columns of projects matching filters.
+
+    Like iter_projects(), but yields lightweight rows holding only the
+    requested columns instead of Project instances, for read-only
+    consumers such as reports and exports.
+
+    Args:
+        filters: Optional dictionary with filter/sort parameters, as for
+            get_all_projects().
+        columns: Column names to select, in order. None selects every column.
+        batch_size: Number of rows to fetch per batch (default: 500).
+        max_lengths: Optional column name -> maximum number of characters
+            to read. Longer text values are cut with SUBSTR in the database,
+            so large values such as notes are not transferred in full.
+
+    Yields:
+        Rows with attribute and key access by column name, in sort order.
+
+    Raises:
+        ValueError: If any column name is not a Project column.
+    """
+    table_columns = Project.__table__.columns
+    names = columns if columns is not None else table_columns.keys()
+    invalid = [name for name in names if name not in table_columns]
+    if invalid:
+        raise ValueError(f"Invalid columns: {invalid}")
+
+    max_lengths = max_lengths or {}
+    selected = [
+        func.substr(table_columns[name], 1, max_lengths[name]).label(name)
+        if name in max_lengths else table_columns[name]
+        for name in names
+    ]
+    query = _filtered_query(filters).with_entities(*selected)
+    yield from query.yield_per(batch_size)
 
 
 def update_project(id: int, data: dict) -> Optional[Project]:
@@ -306,12 +693,11 @@ def update_project(id: int, data: dict) -> Optional[Project]:
     Returns:
         The updated Project instance, or None if not found/deleted.
     """
-    project = get_project(id)
-    if not project:
-        return None
-
-    # Validate status if provided
-    if 'status' in data and data['status'] and data['status'] not in ProjectStatus.ALL:
+    # Validate status if provided. A missing project still takes precedence,
+    # so look it up before reporting the invalid status.
+    if 'status' in data and data['status'] and data['status'] not in ProjectStatus.ALL_SET:
+        if get_project(id) is None:
+            return None
         raise ValueError(
             f"Invalid status: {data['status']}. "
             f"Must be one of: {ProjectStatus.ALL}"
@@ -321,11 +707,57 @@ def update_project(id: int, data: dict) -> Optional[Project]:
     normalized_data = _apply_normalization(data)
 
     # Update only provided fields
-    for key, value in normalized_data.items():
-        if hasattr(project, key) and key not in ['id', 'created_at', 'deleted_at']:
-            setattr(project, key, value)
+    values = {
+        key: value for key, value in normalized_data.items()
+        if key in _UPDATABLE_COLUMNS
+    }
+    if not values:
+        return get_project(id)
+
+    project = _update_active_project(id, values)
+    if project is not None:
+        changed = [field for field in DISTINCT_FIELDS if field in values]
+        if changed:
+            invalidate_distinct_values(changed)
+    return project
 
+
+def _update_active_project(id: int, values: dict) -> Optional[Project]:
+    """Update a non-deleted project with one UPDATE ... RETURNING statement.
+
+    The soft-delete check happens in the WHERE clause, so no SELECT is
+    needed first. ORM flush events do not fire for this statement; the
+    data version is bumped here, and callers handle any other caches.
+
+    Args:
+        id: The project ID to update.
+        values: Column values (or SQL expressions) to set.
+
+    Returns:
+        The updated Project instance, or None if not found/deleted.
+    """
+    stmt = (
+        update(Project)
+        .where(Project.id == id, Project.deleted_at.is_(None))
+        .values(**values)
+        .returning(Project)
+    )
+    # Selecting from the statement lets populate_existing refresh an
+    # instance already in the identity map with the returned row.
+    project = db.session.scalars(
+        select(Project).from_statement(stmt).execution_options(populate_existing=True)
+    ).first()
+    if project is None:
+        # Nothing was written; leave the transaction to the caller
+        return None
+
+    # commit() expires the instance; restore the returned values so reading
+    # it afterwards does not reload the row.
+    returned = {key: getattr(project, key) for key in _COLUMN_KEYS}
     db.session.commit()
+    for key, value in returned.items():
+        set_committed_value(project, key, value)
+    bump_data_version()
     return project
 
 
@@ -356,6 +788,10 @@ def append_note(id: int, note: str) -> Optional[Project]:
 
     Notes are append-only with format: [YYYY-MM-DD HH:MM]: note content
 
+    The note is appended in SQL with a single UPDATE, so existing notes are
+    never read into Python and concurrent appends cannot overwrite each
+    other.
+
     Args:
         id: The project ID to add note to.
         note: The note content to append.
@@ -363,35 +799,120 @@ def append_note(id: int, note: str) -> Optional[Project]:
     Returns:
         The updated Project instance, or None if not found/deleted.
     """
-    project = get_project(id)
-    if not project:
-        return None
-
     if not note or not note.strip():
-        return project
+        return get_project(id)
 
-    timestamp = datetime.now(timezone.utc).strftime('%Y-%m-%d %H:%M')
+    # isoformat is much cheaper than strftime; trim the UTC offset suffix
+    timestamp = datetime.now(timezone.utc).isoformat(sep=' ', timespec='minutes')[:16]
     formatted_note = f"[{timestamp}]: {note.strip()}"
 
-    if project.notes:
-        project.notes = f"{project.notes}\n{formatted_note}"
-    else:
-        project.notes = formatted_note
-
-    db.session.commit()
-    return project
+    notes = func.coalesce(func.nullif(Project.notes, '') + '\n', '') + formatted_note
+    return _update_active_project(id, {'notes': notes})
 
 
 # ============================================================================
 # Dashboard Functions
 # ============================================================================
 
+def current_date() -> date:
+    """Get today's date (UTC) used for deadline comparisons.
+
+    Memoized on the current request, so every dashboard query and template
+    rendered for one request agree on the date even across midnight.
+    (flask.g is not used because it belongs to the app context, which can
+    outlive a single request.) Outside a request, it is computed each call.
+
+    Returns:
+        The current UTC date.
+    """
+    if not has_request_context():
+        return datetime.now(timezone.utc).date()
+    today = getattr(request, '_current_date', None)
+    if today is None:
+        today = datetime.now(timezone.utc).date()
+        request._current_date = today
+    return today
+
+
+# Open projects are matched with status IN (...) rather than != Completed:
+# an equality/IN condition lets ix_projects_status_delivery seek on status
+# and read rows already ordered by delivery_deadline.
+
+def _overdue_criteria(today: date) -> tuple:
+    """Filter criteria for projects past their delivery deadline."""
+    return (
+        Project.deleted_at.is_(None),
+        Project.delivery_deadline.isnot(None),
+        Project.delivery_deadline < today,
+        Project.status.in_(ProjectStatus.ACTIVE),
+    )
+
+
+def _due_this_week_criteria(today: date) -> tuple:
+    """Filter criteria for projects due within the next 7 days."""
+    week_from_now = today + timedelta(days=7)
+    return (
+        Project.deleted_at.is_(None),
+        Project.delivery_deadline.isnot(None),
+        Project.delivery_deadline >= today,
+        Project.delivery_deadline <= week_from_now,
+        Project.status.in_(ProjectStatus.ACTIVE),
+    )
+
+
+def _longer_deadline_criteria(today: date) -> tuple:
+    """Filter criteria for projects with deadlines beyond 7 days."""
+    week_from_now = today + timedelta(days=7)
+    return (
+        Project.deleted_at.is_(None),
+        Project.delivery_deadline.isnot(None),
+        Project.delivery_deadline > week_from_now,
+        Project.status.in_(ProjectStatus.ACTIVE),
+    )
+
+
+def _recently_completed_criteria() -> tuple:
+    """Filter criteria for completed projects."""
+    return (
+        Project.deleted_at.is_(None),
+        Project.status == ProjectStatus.COMPLETED,
+    )
+
+
+def _bucket_select(bucket: str, criteria: tuple, order_by, limit: Optional[int] = None):
+    """Build one branch of the dashboard UNION ALL query.
+
+    Each branch selects the table columns plus a 'bucket' discriminator, a
+    'position' column recording the row's order within its bucket, and a
+    'total' column counting every matching row before the limit applies.
+
+    Args:
+        bucket: Name of the dashboard section.
+        criteria: Filter expressions for the section.
+        order_by: Ordering expression within the section.
+        limit: Optional maximum number of rows for the section.
+
+    Returns:
+        Select statement for the section.
+    """
+    stmt = select(
+        *Project.__table__.columns,
+        literal(bucket).label('bucket'),
+        func.row_number().over(order_by=order_by).label('position'),
+        func.count().over().label('total'),
+    ).where(*criteria)
+    if limit is not None:
+        stmt = stmt.order_by(order_by).limit(limit)
+    # Wrap in a subquery so ORDER BY/LIMIT are allowed inside the compound select
+    return select(stmt.subquery())
+
+
 def get_overdue_projects() -> list[Project]:
     """Get projects past their delivery deadline.
 
     Returns projects where:
     - delivery_deadline < today
-    - status != Completed
+    - status is one of ProjectStatus.ACTIVE (not Completed)
     - Not soft-deleted
 
     Projects are ordered by delivery_deadline ascending (most overdue first).
@@ -399,14 +920,11 @@ def get_overdue_projects() -> list[Project]:
     Returns:
         List of overdue Project instances.
     """
-    today = datetime.now(timezone.utc).date()
+    today = current_date()
 
     return (
-        db.session.query(Project)
-        .filter(Project.deleted_at.is_(None))
-        .filter(Project.delivery_deadline.isnot(None))
-        .filter(Project.delivery_deadline < today)
-        .filter(Project.status != ProjectStatus.COMPLETED)
+        _list_query()
+        .filter(*_overdue_criteria(today))
         .order_by(Project.delivery_deadline.asc())
         .all()
     )
@@ -417,7 +935,7 @@ def get_due_this_week() -> list[Project]:
 
     Returns projects where:
     - today <= delivery_deadline <= today + 7 days
-    - status != Completed
+    - status is one of ProjectStatus.ACTIVE (not Completed)
     - Not soft-deleted
 
     Projects are ordered by delivery_deadline ascending.
@@ -425,16 +943,11 @@ def get_due_this_week() -> list[Project]:
     Returns:
         List of Project instances due this week.
     """
-    today = datetime.now(timezone.utc).date()
-    week_from_now = today + timedelta(days=7)
+    today = current_date()
 
     return (
-        db.session.query(Project)
-        .filter(Project.deleted_at.is_(None))
-        .filter(Project.delivery_deadline.isnot(None))
-        .filter(Project.delivery_deadline >= today)
-        .filter(Project.delivery_deadline <= week_from_now)
-        .filter(Project.status != ProjectStatus.COMPLETED)
+        _list_query()
+        .filter(*_due_this_week_criteria(today))
         .order_by(Project.delivery_deadline.asc())
         .all()
     )
@@ -445,7 +958,7 @@ def get_longer_deadline() -> list[Project]:
 
     Returns projects where:
     - delivery_deadline > today + 7 days
-    - status != Completed
+    - status is one of ProjectStatus.ACTIVE (not Completed)
     - Not soft-deleted
 
     Projects are ordered by delivery_deadline ascending.
@@ -453,15 +966,11 @@ def get_longer_deadline() -> list[Project]:
     Returns:
         List of Project instances with longer deadlines.
     """
-    today = datetime.now(timezone.utc).date()
-    week_from_now = today + timedelta(days=7)
+    today = current_date()
 
     return (
-        db.session.query(Project)
-        .filter(Project.deleted_at.is_(None))
-        .filter(Project.delivery_deadline.isnot(None))
-        .filter(Project.delivery_deadline > week_from_now)
-        .filter(Project.status != ProjectStatus.COMPLETED)
+        _list_query()
+        .filter(*_longer_deadline_criteria(today))
         .order_by(Project.delivery_deadline.asc())
         .all()
     )
@@ -483,10 +992,63 @@ def get_recently_completed(limit: int = 10) -> list[Project]:
         List of recently completed Project instances.
     """
     return (
-        db.session.query(Project)
-        .filter(Project.deleted_at.is_(None))
-        .filter(Project.status == ProjectStatus.COMPLETED)
+        _list_query()
+        .filter(*_recently_completed_criteria())
         .order_by(Project.updated_at.desc())
         .limit(limit)
         .all()
     )
+
+
+def get_dashboard_buckets(
+    recently_completed_limit: int = 10,
+    limit: Optional[int] = 200,
+) -> dict[str, tuple[list[dict], int]]:
+    """Get all four dashboard sections in a single database round-trip.
+
+    Combines the overdue, due this week, longer deadline, and recently
+    completed queries with UNION ALL and splits the rows by section in
+    Python. Rows are plain column dicts rather than ORM objects since the
+    dashboard is read-only. Each section is capped, and its full size is
+    counted in the same query with COUNT(*) OVER ().
+
+    Args:
+        recently_completed_limit: Maximum number of recently completed
+            projects to return (default: 10).
+        limit: Maximum number of rows to return for each deadline section
+            (default: 200). None returns every row.
+
+    Returns:
+        Dictionary mapping each name in DASHBOARD_BUCKETS to a
+        (rows, total) tuple: the project column dicts, ordered as in the
+        individual dashboard functions, and the number of projects matching
+        the section before the limit.
+    """
+    today = current_date()
+    deadline_order = Project.delivery_deadline.asc()
+
+    combined = union_all(
+        _bucket_select('overdue', _overdue_criteria(today), deadline_order, limit=limit),
+        _bucket_select(
+            'due_this_week', _due_this_week_criteria(today), deadline_order, limit=limit
+        ),
+        _bucket_select(
+            'longer_deadline', _longer_deadline_criteria(today), deadline_order, limit=limit
+        ),
+        _bucket_select(
+            'recently_completed',
+            _recently_completed_criteria(),
+            Project.updated_at.desc(),
+            limit=recently_completed_limit,
+        ),
+    ).subquery()
+    stmt = select(combined).order_by(combined.c.position)
+
+    column_names = Project.__table__.columns.keys()
+    rows = {name: [] for name in DASHBOARD_BUCKETS}
+    totals = dict.fromkeys(DASHBOARD_BUCKETS, 0)
+    for row in db.session.execute(stmt).mappings():
+        bucket = row['bucket']
+        rows[bucket].append({name: row[name] for name in column_names})
+        totals[bucket] = row['total']
+    return {name: (rows[name], totals[name]) for name in DASHBOARD_BUCKETS}
@@ -8,13 +8,15 @@ import csv
 import io
 from calendar import monthrange
 from datetime import date, datetime, timezone
-from typing import Optional
+from typing import Iterator, Optional
 
-from sqlalchemy import func
+from sqlalchemy import Integer, Row, func, literal, null, select, union_all
+from sqlalchemy.ext.compiler import compiles
+from sqlalchemy.sql.functions import FunctionElement
 
 from app import db
 from app.models import Project, ProjectStatus
-from app.services.project_service import get_all_projects
+from app.services.project_service import iter_project_rows
 
 
 # Default fields for weekly status report if none specified
@@ -26,6 +28,10 @@ DEFAULT_WEEKLY_FIELDS = [
     'anticipated_completion',
 ]
 
+# Columns whose values are dates or datetimes, formatted as ISO strings
+# (the same columns Project.to_dict() formats)
+_DATE_COLUMNS = frozenset(Project._ISO_FIELDS)
+
 # All available fields for weekly report (internal -> display name mapping)
 WEEKLY_FIELD_OPTIONS = {
     'id': 'ID',
@@ -41,6 +47,16 @@ WEEKLY_FIELD_OPTIONS = {
     'status': 'Status',
 }
 
+# Project columns read by the CSV export
+_CSV_COLUMNS = [
+    'id', 'project_name', 'project_group', 'department', 'date_to_client',
+    'date_assigned_to_us', 'assigned_attorney', 'qcp_attorney',
+    'internal_deadline', 'delivery_deadline', 'status', 'notes',
+]
+
+# Notes longer than this are truncated in the CSV export
+_CSV_NOTES_LENGTH = 200
+
 # CSV export column headers (order matters)
 CSV_FIELDNAMES = [
     'ID',
@@ -78,36 +94,96 @@ def get_weekly_status_data(fields: list[str] = None) -> list[dict]:
     if not fields:
         fields = DEFAULT_WEEKLY_FIELDS.copy()
 
-    # Query active projects (not completed, not deleted)
-    projects = (
-        db.session.query(Project)
-        .filter(Project.deleted_at.is_(None))
-        .filter(Project.status != ProjectStatus.COMPLETED)
+    # Output key -> column it is read from; unknown fields are skipped
+    columns = Project.__table__.columns
+    sources = {}
+    for field in fields:
+        source = 'delivery_deadline' if field == 'anticipated_completion' else field
+        if source in columns:
+            sources[field] = source
+    names = list(sources)
+    date_positions = [
+        position for position, field in enumerate(names)
+        if sources[field] in _DATE_COLUMNS
+    ]
+
+    # Query active projects (not completed, not deleted), selecting only
+    # the columns the report shows
+    selected = [columns[sources[field]].label(field) for field in names] or [Project.id]
+    rows = db.session.execute(
+        select(*selected)
+        .where(Project.deleted_at.is_(None))
+        .where(Project.status.in_(ProjectStatus.ACTIVE))
         .order_by(Project.delivery_deadline.asc().nulls_last())
-        .all()
     )
 
     result = []
-    for project in projects:
-        row = {}
-        for field in fields:
-            if field == 'anticipated_completion':
-                # Map to delivery_deadline
-                value = project.delivery_deadline
-                if value and hasattr(value, 'isoformat'):
-                    value = value.isoformat()
-                row['anticipated_completion'] = value
-            elif hasattr(project, field):
-                value = getattr(project, field)
-                # Convert dates to ISO format strings
-                if value and hasattr(value, 'isoformat'):
-                    value = value.isoformat()
-                row[field] = value
-        result.append(row)
+    for values in rows:
+        if date_positions:
+            values = list(values)
+            # Convert dates to ISO format strings
+            for position in date_positions:
+                value = values[position]
+                if value is not None:
+                    values[position] = value.isoformat()
+        result.append(dict(zip(names, values)))
 
     return result
 
 
+class _DaysBetween(FunctionElement):
+    """Whole days from a date to the calendar date of a timestamp.
+
+    Equivalent to (timestamp - datetime.combine(date, time.min)).days for
+    the naive UTC timestamps stored on projects.
+    """
+
+    type = Integer()
+    inherit_cache = True
+    name = 'days_between'
+
+
+@compiles(_DaysBetween)
+def _compile_days_between(element, compiler, **kw) -> str:
+    start, end = list(element.clauses)
+    return (
+        f"(CAST({compiler.process(end, **kw)} AS DATE)"
+        f" - {compiler.process(start, **kw)})"
+    )
+
+
+@compiles(_DaysBetween, 'sqlite')
+def _compile_days_between_sqlite(element, compiler, **kw) -> str:
+    start, end = list(element.clauses)
+    return (
+        f"CAST(julianday(date({compiler.process(end, **kw)}))"
+        f" - julianday({compiler.process(start, **kw)}) AS INTEGER)"
+    )
+
+
+def _opened_counts_select(kind: str, column, criteria: tuple):
+    """Select (kind, value, count, NULL) rows grouping opened projects by a column.
+
+    Args:
+        kind: Tag identifying the grouping in the combined result.
+        column: Project column to group by.
+        criteria: Filter expressions.
+
+    Returns:
+        Select with columns kind, key, count and avg_days (always NULL).
+    """
+    return (
+        select(
+            literal(kind).label('kind'),
+            column.label('key'),
+            func.count().label('count'),
+            null().label('avg_days'),
+        )
+        .where(*criteria)
+        .group_by(column)
+    )
+
+
 def get_monthly_stats(year: int, month: int) -> dict:
     """Get statistics for a specific month.
 
@@ -141,61 +217,53 @@ def get_monthly_stats(year: int, month: int) -> dict:
     _, last_day = monthrange(year, month)
     end_date = datetime(year, month, last_day, 23, 59, 59, tzinfo=timezone.utc)
 
-    # Projects opened this month (by created_at)
-    opened_query = (
-        db.session.query(Project)
-        .filter(Project.created_at >= start_date)
-        .filter(Project.created_at <= end_date)
-        .filter(Project.deleted_at.is_(None))
+    # Projects opened this month (by created_at), counted in the database
+    opened_criteria = (
+        Project.created_at >= start_date,
+        Project.created_at <= end_date,
+        Project.deleted_at.is_(None),
     )
-    opened_projects = opened_query.all()
-    projects_opened = len(opened_projects)
-
     # Projects completed this month (status = Completed AND updated_at in month)
-    completed_query = (
-        db.session.query(Project)
-        .filter(Project.status == ProjectStatus.COMPLETED)
-        .filter(Project.updated_at >= start_date)
-        .filter(Project.updated_at <= end_date)
-        .filter(Project.deleted_at.is_(None))
+    completed = (
+        select(
+            literal('completed').label('kind'),
+            null().label('key'),
+            func.count().label('count'),
+            func.avg(_DaysBetween(Project.date_assigned_to_us, Project.updated_at))
+            .label('avg_days'),
+        )
+        .where(Project.status == ProjectStatus.COMPLETED)
+        .where(Project.updated_at >= start_date)
+        .where(Project.updated_at <= end_date)
+        .where(Project.deleted_at.is_(None))
     )
-    completed_projects = completed_query.all()
-    projects_completed = len(completed_projects)
 
-    # Breakdown by department (for opened projects)
+    # Count and average everything in one round-trip: per-department and
+    # per-attorney opened counts plus the completed aggregate row, tagged
+    # by kind and split apart here
+    combined = union_all(
+        _opened_counts_select('department', Project.department, opened_criteria),
+        _opened_counts_select('attorney', Project.assigned_attorney, opened_criteria),
+        completed,
+    ).subquery()
     by_department = {}
-    for project in opened_projects:
-        dept = project.department
-        by_department[dept] = by_department.get(dept, 0) + 1
-
-    # Breakdown by assigned attorney (for opened projects)
     by_attorney = {}
-    for project in opened_projects:
-        attorney = project.assigned_attorney
-        by_attorney[attorney] = by_attorney.get(attorney, 0) + 1
+    projects_completed, avg_days = 0, None
+    for kind, key, count, avg in db.session.execute(
+        select(combined).order_by(combined.c.kind, combined.c.key)
+    ):
+        if kind == 'department':
+            by_department[key] = count
+        elif kind == 'attorney':
+            by_attorney[key] = count
+        else:
+            projects_completed, avg_days = count, avg
+    projects_opened = sum(by_department.values())
 
     # Average days to completion (for completed projects)
     avg_days_to_completion = None
-    if completed_projects:
-        total_days = 0
-        valid_count = 0
-        for project in completed_projects:
-            if project.date_assigned_to_us and project.updated_at:
-                # Convert date to datetime for calculation (timezone-naive)
-                assigned_datetime = datetime.combine(
-                    project.date_assigned_to_us,
-                    datetime.min.time()
-                )
-                # updated_at may be timezone-aware or naive depending on DB
-                # Make both naive for comparison
-                updated_at = project.updated_at
-                if updated_at.tzinfo is not None:
-                    updated_at = updated_at.replace(tzinfo=None)
-                days = (updated_at - assigned_datetime).days
-                total_days += days
-                valid_count += 1
-        if valid_count > 0:
-            avg_days_to_completion = round(total_days / valid_count, 1)
+    if avg_days is not None:
+        avg_days_to_completion = round(float(avg_days), 1)
 
     return {
         'projects_opened': projects_opened,
@@ -223,37 +291,87 @@ def export_projects_csv(filters: dict = None) -> str:
         CSV-formatted string suitable for file download.
         Includes header row and all matching projects.
     """
-    # Get projects using existing filtering logic
-    projects = get_all_projects(filters)
+    return ''.join(iter_projects_csv(filters))
+
+
+def iter_projects_csv(filters: dict = None, rows_per_chunk: int = 500) -> Iterator[str]:
+    """Generate the projects CSV export in chunks.
+
+    Produces the same content as export_projects_csv(), but reads projects
+    from the database in batches and yields CSV text every rows_per_chunk
+    rows, so memory use stays flat regardless of export size.
 
-    # Build CSV using StringIO
+    Args:
+        filters: Optional dictionary with filter parameters, as for
+                 export_projects_csv().
+        rows_per_chunk: Number of project rows per yielded chunk.
+
+    Yields:
+        Consecutive pieces of the CSV document. The first is the header
+        row alone, produced before the database is queried.
+    """
     output = io.StringIO()
-    writer = csv.DictWriter(output, fieldnames=CSV_FIELDNAMES)
-    writer.writeheader()
-
-    for project in projects:
-        # Truncate notes to 200 chars
-        notes = project.notes or ''
-        if len(notes) > 200:
-            notes = notes[:197] + '...'
-
-        row = {
-            'ID': project.id,
-            'Project Name': project.project_name,
-            'Project Group': project.project_group or '',
-            'Department': project.department,
-            'Date to Client': _format_date(project.date_to_client),
-            'Date Assigned': _format_date(project.date_assigned_to_us),
-            'Assigned Attorney': project.assigned_attorney,
-            'QCP Attorney': project.qcp_attorney,
-            'Internal Deadline': _format_date(project.internal_deadline),
-            'Delivery Deadline': _format_date(project.delivery_deadline),
-            'Status': project.status,
-            'Notes': notes,
-        }
-        writer.writerow(row)
-
-    return output.getvalue()
+    writer = csv.writer(output)
+
+    # Send the header before querying so the download starts right away
+    writer.writerow(CSV_FIELDNAMES)
+    yield output.getvalue()
+    output.seek(0)
+    output.truncate()
+
+    pending = 0
+    # Read one character past the limit, enough to tell whether to truncate
+    rows = iter_project_rows(
+        filters, _CSV_COLUMNS, batch_size=rows_per_chunk,
+        max_lengths={'notes': _CSV_NOTES_LENGTH + 1},
+    )
+    for project in rows:
+        writer.writerow(_csv_row(project))
+
+        pending += 1
+        if pending == rows_per_chunk:
+            yield output.getvalue()
+            output.seek(0)
+            output.truncate()
+            pending = 0
+
+    # Remaining rows
+    remainder = output.getvalue()
+    if remainder:
+        yield remainder
+
+
+def _csv_row(project: Row) -> tuple:
+    """Build a CSV export row, in CSV_FIELDNAMES order.
+
+    Notes are truncated to _CSV_NOTES_LENGTH characters.
+
+    Args:
+        project: Row with the _CSV_COLUMNS columns.
+
+    Returns:
+        Tuple of cell values.
+    """
+    notes = project.notes
+    if not notes:
+        notes = ''
+    elif len(notes) > _CSV_NOTES_LENGTH:
+        notes = notes[:_CSV_NOTES_LENGTH - 3] + '...'
+
+    return (
+        project.id,
+        project.project_name,
+        project.project_group or '',
+        project.department,
+        _format_date(project.date_to_client),
+        _format_date(project.date_assigned_to_us),
+        project.assigned_attorney,
+        project.qcp_attorney,
+        _format_date(project.internal_deadline),
+        _format_date(project.delivery_deadline),
+        project.status,
+        notes,
+    )
 
 
 def _format_date(d: Optional[date]) -> str:
@@ -90,11 +90,19 @@ def run_migrations_online():
                 directives[:] = []
                 logger.info('No changes in schema detected.')
 
+    connectable = get_engine()
+
+    # autogenerate does not apply Index.ddl_if(dialect=...); leave
+    # dialect-specific indexes out of the comparison on other backends
+    def include_object(object, name, type_, reflected, compare_to):
+        ddl_if = getattr(object, '_ddl_if', None)
+        return ddl_if is None or ddl_if.dialect in (None, connectable.dialect.name)
+
     conf_args = current_app.extensions['migrate'].configure_args
     if conf_args.get("process_revision_directives") is None:
         conf_args["process_revision_directives"] = process_revision_directives
-
-    connectable = get_engine()
+    if conf_args.get("include_object") is None:
+        conf_args["include_object"] = include_object
 
     with connectable.connect() as connection:
         context.configure(
@@ -0,0 +1,33 @@
+"""Drop deleted_at index and make updated_at index partial
+
+Revision ID: 1f6d0b8e3c52
+Revises: e7a2c94b1d36
+Create Date: 2026-10-15 19:40:21.093614
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '1f6d0b8e3c52'
+down_revision = 'e7a2c94b1d36'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    # Every live-project query is served by a partial index. The full
+    # deleted_at index was mostly NULLs, and SQLite preferred its equality
+    # match over the partial sort indexes, adding a temp B-tree sort.
+    with op.batch_alter_table('projects', schema=None) as batch_op:
+        batch_op.drop_index('ix_projects_deleted_at')
+        batch_op.drop_index('ix_projects_updated_at')
+        batch_op.create_index('ix_projects_updated_at', ['updated_at'], unique=False, postgresql_where=sa.text('deleted_at IS NULL'), sqlite_where=sa.text('deleted_at IS NULL'))
+
+
+def downgrade():
+    with op.batch_alter_table('projects', schema=None) as batch_op:
+        batch_op.drop_index('ix_projects_updated_at', postgresql_where=sa.text('deleted_at IS NULL'), sqlite_where=sa.text('deleted_at IS NULL'))
+        batch_op.create_index('ix_projects_updated_at', ['updated_at'], unique=False)
+        batch_op.create_index('ix_projects_deleted_at', ['deleted_at'], unique=False)
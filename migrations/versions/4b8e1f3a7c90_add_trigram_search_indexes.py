@@ -0,0 +1,37 @@
+"""Add trigram indexes for project search on PostgreSQL
+
+Revision ID: 4b8e1f3a7c90
+Revises: 1f6d0b8e3c52
+Create Date: 2026-10-15 20:05:47.381926
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '4b8e1f3a7c90'
+down_revision = '1f6d0b8e3c52'
+branch_labels = None
+depends_on = None
+
+FIELDS = ('project_name', 'department', 'notes', 'project_group')
+
+
+def upgrade():
+    # GIN trigram indexes let PostgreSQL answer ILIKE '%term%' without a
+    # sequential scan. SQLite has no equivalent; it keeps scanning.
+    if op.get_bind().dialect.name != 'postgresql':
+        return
+    op.execute('CREATE EXTENSION IF NOT EXISTS pg_trgm')
+    with op.batch_alter_table('projects', schema=None) as batch_op:
+        for field in FIELDS:
+            batch_op.create_index(f'ix_projects_{field}_trgm', [field], unique=False, postgresql_using='gin', postgresql_ops={field: 'gin_trgm_ops'}, postgresql_where=sa.text('deleted_at IS NULL'))
+
+
+def downgrade():
+    if op.get_bind().dialect.name != 'postgresql':
+        return
+    with op.batch_alter_table('projects', schema=None) as batch_op:
+        for field in reversed(FIELDS):
+            batch_op.drop_index(f'ix_projects_{field}_trgm')
@@ -0,0 +1,30 @@
+"""Add lower-case indexes for department and attorney filters
+
+Revision ID: 5e0b7c3f9a62
+Revises: c52e9f0a7d18
+Create Date: 2026-10-15 16:40:52.631907
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '5e0b7c3f9a62'
+down_revision = 'c52e9f0a7d18'
+branch_labels = None
+depends_on = None
+
+FIELDS = ('department', 'assigned_attorney', 'qcp_attorney')
+
+
+def upgrade():
+    with op.batch_alter_table('projects', schema=None) as batch_op:
+        for field in FIELDS:
+            batch_op.create_index(f'ix_projects_{field}_lower', [sa.text(f'lower({field})')], unique=False, postgresql_where=sa.text('deleted_at IS NULL'), sqlite_where=sa.text('deleted_at IS NULL'))
+
+
+def downgrade():
+    with op.batch_alter_table('projects', schema=None) as batch_op:
+        for field in reversed(FIELDS):
+            batch_op.drop_index(f'ix_projects_{field}_lower')
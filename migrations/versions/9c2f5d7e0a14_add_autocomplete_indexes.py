@@ -0,0 +1,30 @@
+"""Add autocomplete indexes
+
+Revision ID: 9c2f5d7e0a14
+Revises: 4b8e1f3a7c90
+Create Date: 2026-10-15 20:31:09.624183
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '9c2f5d7e0a14'
+down_revision = '4b8e1f3a7c90'
+branch_labels = None
+depends_on = None
+
+FIELDS = ('department', 'assigned_attorney', 'qcp_attorney', 'project_group')
+
+
+def upgrade():
+    with op.batch_alter_table('projects', schema=None) as batch_op:
+        for field in FIELDS:
+            batch_op.create_index(f'ix_projects_{field}', [field], unique=False, postgresql_where=sa.text('deleted_at IS NULL'), sqlite_where=sa.text('deleted_at IS NULL'))
+
+
+def downgrade():
+    with op.batch_alter_table('projects', schema=None) as batch_op:
+        for field in reversed(FIELDS):
+            batch_op.drop_index(f'ix_projects_{field}')
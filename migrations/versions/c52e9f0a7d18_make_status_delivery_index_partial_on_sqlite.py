@@ -0,0 +1,30 @@
+"""Make status/delivery index partial on SQLite
+
+Revision ID: c52e9f0a7d18
+Revises: 8d4f2a6b1c37
+Create Date: 2026-10-15 15:21:08.447102
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'c52e9f0a7d18'
+down_revision = '8d4f2a6b1c37'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    # Recreate with the deleted_at IS NULL predicate on SQLite as well;
+    # on PostgreSQL the index was already partial.
+    with op.batch_alter_table('projects', schema=None) as batch_op:
+        batch_op.drop_index('ix_projects_status_delivery', postgresql_where=sa.text('deleted_at IS NULL'))
+        batch_op.create_index('ix_projects_status_delivery', ['status', 'delivery_deadline'], unique=False, postgresql_where=sa.text('deleted_at IS NULL'), sqlite_where=sa.text('deleted_at IS NULL'))
+
+
+def downgrade():
+    with op.batch_alter_table('projects', schema=None) as batch_op:
+        batch_op.drop_index('ix_projects_status_delivery', postgresql_where=sa.text('deleted_at IS NULL'), sqlite_where=sa.text('deleted_at IS NULL'))
+        batch_op.create_index('ix_projects_status_delivery', ['status', 'delivery_deadline'], unique=False, postgresql_where=sa.text('deleted_at IS NULL'))
@@ -0,0 +1,28 @@
+"""Add status to the lower-case department index
+
+Revision ID: e7a2c94b1d36
+Revises: a9c3d81e4f05
+Create Date: 2026-10-15 19:12:40.518273
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'e7a2c94b1d36'
+down_revision = 'a9c3d81e4f05'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    with op.batch_alter_table('projects', schema=None) as batch_op:
+        batch_op.drop_index('ix_projects_department_lower')
+        batch_op.create_index('ix_projects_department_lower_status', [sa.text('lower(department)'), 'status'], unique=False, postgresql_where=sa.text('deleted_at IS NULL'), sqlite_where=sa.text('deleted_at IS NULL'))
+
+
+def downgrade():
+    with op.batch_alter_table('projects', schema=None) as batch_op:
+        batch_op.drop_index('ix_projects_department_lower_status')
+        batch_op.create_index('ix_projects_department_lower', [sa.text('lower(department)')], unique=False, postgresql_where=sa.text('deleted_at IS NULL'), sqlite_where=sa.text('deleted_at IS NULL'))
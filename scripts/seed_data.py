@@ -13,8 +13,13 @@ seeding if data already exists. Use reset_db.py to clear and reseed.
 """
 import random
 import sys
+from collections import Counter
 from datetime import date, timedelta
+from functools import lru_cache
 from pathlib import Path
+from string import Formatter
+
+from sqlalchemy import insert
 
 # Add project root to path for imports
 sys.path.insert(0, str(Path(__file__).parent.parent))
@@ -100,47 +105,101 @@ TOPICS = [
 ]
 
 
+# PROJECT_TEMPLATES with each template's placeholder names, parsed once
+PARSED_TEMPLATES = {
+    category: [
+        (template, frozenset(name for _, name, _, _ in Formatter().parse(template) if name))
+        for template in templates
+    ]
+    for category, templates in PROJECT_TEMPLATES.items()
+}
+
+# Status pools for each create_seed_projects section
+OVERDUE_STATUSES = (ProjectStatus.IN_PROGRESS, ProjectStatus.UNDER_REVIEW)
+DUE_THIS_WEEK_STATUSES = (
+    ProjectStatus.IN_PROGRESS,
+    ProjectStatus.UNDER_REVIEW,
+    ProjectStatus.WAITING_ON_CLIENT,
+)
+LONGER_DEADLINE_STATUSES = (
+    ProjectStatus.IN_PROGRESS,
+    ProjectStatus.ON_HOLD,
+    ProjectStatus.WAITING_ON_CLIENT,
+)
+NO_DEADLINE_STATUSES = (ProjectStatus.IN_PROGRESS, ProjectStatus.ON_HOLD)
+
+# Template category pools for the sections that vary the project type
+DUE_THIS_WEEK_CATEGORIES = ("prr", "agreement", "review")
+LONGER_DEADLINE_CATEGORIES = ("investigation", "litigation", "agreement")
+COMPLETED_CATEGORIES = ("prr", "agreement", "review")
+
+# Note entries in workflow order; later entries repeat the last one
+NOTE_TEMPLATES = (
+    "Initial review started",
+    "Research completed, drafting response",
+    "Sent to QCP for review",
+    "QCP comments received, revising",
+    "Client follow-up call scheduled",
+    "Awaiting additional documents from client",
+    "Draft delivered for internal review",
+    "Final review in progress",
+    "Ready for delivery",
+)
+
+# Working hours and quarter-hour minutes used for seeded note timestamps
+NOTE_HOURS = range(8, 18)
+NOTE_MINUTES = (0, 15, 30, 45)
+
+# Largest number of days before or after today used by create_seed_projects
+SEED_DAY_RANGE = 90
+
+
 def generate_project_name(category: str, dept: str, counter: int) -> str:
     """Generate a realistic project name based on category."""
-    year = date.today().year
-    template = random.choice(PROJECT_TEMPLATES[category])
-
-    return template.format(
-        dept=dept.split()[0],  # First word of department
-        year=year,
-        num=counter,
-        policy=random.choice(POLICIES),
-        topic=random.choice(TOPICS),
+    template, fields = random.choice(PARSED_TEMPLATES[category])
+
+    # Only compute (and draw random values for) placeholders the template
+    # uses; unused ones stay None so repeated combinations share a cache entry
+    return _render_project_name(
+        template,
+        dept.split()[0] if "dept" in fields else None,  # First word of department
+        date.today().year if "year" in fields else None,
+        counter if "num" in fields else None,
+        random.choice(POLICIES) if "policy" in fields else None,
+        random.choice(TOPICS) if "topic" in fields else None,
     )
 
 
+@lru_cache(maxsize=4096)
+def _render_project_name(
+    template: str,
+    dept: str | None,
+    year: int | None,
+    num: int | None,
+    policy: str | None,
+    topic: str | None,
+) -> str:
+    """Substitute placeholder values into a project name template."""
+    return template.format(dept=dept, year=year, num=num, policy=policy, topic=topic)
+
+
 def generate_notes(num_entries: int = 0) -> str | None:
     """Generate sample timestamped notes."""
     if num_entries == 0:
         return None
 
-    note_templates = [
-        "Initial review started",
-        "Research completed, drafting response",
-        "Sent to QCP for review",
-        "QCP comments received, revising",
-        "Client follow-up call scheduled",
-        "Awaiting additional documents from client",
-        "Draft delivered for internal review",
-        "Final review in progress",
-        "Ready for delivery",
-    ]
-
     today = date.today()
+    last = len(NOTE_TEMPLATES) - 1
     notes = []
-    for i in range(num_entries):
-        days_ago = (num_entries - i) * 3 + random.randint(0, 2)
-        note_date = today - timedelta(days=days_ago)
-        hour = random.randint(8, 17)
-        minute = random.choice([0, 15, 30, 45])
-        timestamp = f"{note_date.isoformat()} {hour:02d}:{minute:02d}"
-        note_text = note_templates[min(i, len(note_templates) - 1)]
-        notes.append(f"[{timestamp}]: {note_text}")
+    jitters = random.choices(range(3), k=num_entries)
+    hours = random.choices(NOTE_HOURS, k=num_entries)
+    minutes = random.choices(NOTE_MINUTES, k=num_entries)
+    for i, jitter, hour, minute in zip(range(num_entries), jitters, hours, minutes):
+        note_date = today - timedelta(days=(num_entries - i) * 3 + jitter)
+        notes.append(
+            f"[{note_date.isoformat()} {hour:02d}:{minute:02d}]: "
+            f"{NOTE_TEMPLATES[min(i, last)]}"
+        )
 
     return "\n".join(notes)
 
@@ -151,132 +210,153 @@ def create_seed_projects() -> list[dict]:
     projects = []
     counter = 1
 
+    # Every date the generators use lies within SEED_DAY_RANGE days of
+    # today, so build them once and look them up by offset
+    calendar = [
+        today + timedelta(days=offset)
+        for offset in range(-SEED_DAY_RANGE, SEED_DAY_RANGE + 1)
+    ]
+
+    def days_ago(days: int) -> date:
+        return calendar[SEED_DAY_RANGE - days]
+
+    def days_from_now(days: int) -> date:
+        return calendar[SEED_DAY_RANGE + days]
+
     # Helper to pick attorneys (assigned and QCP should be different)
     def pick_attorneys():
-        assigned = random.choice(ATTORNEYS)
-        qcp = random.choice([a for a in ATTORNEYS if a != assigned])
-        return assigned, qcp
+        return tuple(random.sample(ATTORNEYS, 2))
 
     # === OVERDUE PROJECTS (4) ===
     # delivery_deadline in past, status != Completed
-    for i in range(4):
-        dept = random.choice(DEPARTMENTS)
+    statuses = random.choices(OVERDUE_STATUSES, k=4)
+    overdue = random.choices(range(3, 22), k=4)
+    lead_times = random.choices(range(14, 31), k=4)
+    note_counts = random.choices(range(1, 4), k=4)
+    for dept, status, days_overdue, lead_time, num_notes in zip(
+        random.choices(DEPARTMENTS, k=4), statuses, overdue, lead_times, note_counts
+    ):
         assigned, qcp = pick_attorneys()
-        days_overdue = random.randint(3, 21)
-        days_assigned = days_overdue + random.randint(14, 30)
+        days_assigned = days_overdue + lead_time
 
         projects.append({
             "project_name": generate_project_name("review", dept, counter),
+            "project_group": None,
             "department": dept,
-            "date_to_client": today - timedelta(days=days_assigned + 5),
-            "date_assigned_to_us": today - timedelta(days=days_assigned),
+            "date_to_client": days_ago(days_assigned + 5),
+            "date_assigned_to_us": days_ago(days_assigned),
             "assigned_attorney": assigned,
             "qcp_attorney": qcp,
-            "internal_deadline": today - timedelta(days=days_overdue + 3),
-            "delivery_deadline": today - timedelta(days=days_overdue),
-            "status": random.choice([ProjectStatus.IN_PROGRESS, ProjectStatus.UNDER_REVIEW]),
-            "notes": generate_notes(random.randint(1, 3)),
+            "internal_deadline": days_ago(days_overdue + 3),
+            "delivery_deadline": days_ago(days_overdue),
+            "status": status,
+            "notes": generate_notes(num_notes),
         })
         counter += 1
 
     # === DUE THIS WEEK (6) ===
     # delivery_deadline within 0-6 days from today
-    for i in range(6):
-        dept = random.choice(DEPARTMENTS)
+    statuses = random.choices(DUE_THIS_WEEK_STATUSES, k=6)
+    categories = random.choices(DUE_THIS_WEEK_CATEGORIES, k=6)
+    due = random.choices(range(0, 7), k=6)
+    assigned_days = random.choices(range(14, 31), k=6)
+    note_counts = random.choices(range(2, 5), k=6)
+    for dept, status, category, days_until_due, days_assigned, num_notes in zip(
+        random.choices(DEPARTMENTS, k=6), statuses, categories, due, assigned_days, note_counts
+    ):
         assigned, qcp = pick_attorneys()
-        days_until_due = random.randint(0, 6)
-        days_assigned = random.randint(14, 30)
 
         projects.append({
-            "project_name": generate_project_name(
-                random.choice(["prr", "agreement", "review"]), dept, counter
-            ),
+            "project_name": generate_project_name(category, dept, counter),
+            "project_group": None,
             "department": dept,
-            "date_to_client": today - timedelta(days=days_assigned + 5),
-            "date_assigned_to_us": today - timedelta(days=days_assigned),
+            "date_to_client": days_ago(days_assigned + 5),
+            "date_assigned_to_us": days_ago(days_assigned),
             "assigned_attorney": assigned,
             "qcp_attorney": qcp,
-            "internal_deadline": today + timedelta(days=days_until_due - 2),
-            "delivery_deadline": today + timedelta(days=days_until_due),
-            "status": random.choice([
-                ProjectStatus.IN_PROGRESS,
-                ProjectStatus.UNDER_REVIEW,
-                ProjectStatus.WAITING_ON_CLIENT,
-            ]),
-            "notes": generate_notes(random.randint(2, 4)),
+            "internal_deadline": days_from_now(days_until_due - 2),
+            "delivery_deadline": days_from_now(days_until_due),
+            "status": status,
+            "notes": generate_notes(num_notes),
         })
         counter += 1
 
     # === LONGER DEADLINE (8) ===
     # delivery_deadline > 7 days out
-    for i in range(8):
-        dept = random.choice(DEPARTMENTS)
+    statuses = random.choices(LONGER_DEADLINE_STATUSES, k=8)
+    categories = random.choices(LONGER_DEADLINE_CATEGORIES, k=8)
+    due = random.choices(range(8, 46), k=8)
+    assigned_days = random.choices(range(7, 22), k=8)
+    note_counts = random.choices(range(0, 3), k=8)
+    for dept, status, category, days_until_due, days_assigned, num_notes in zip(
+        random.choices(DEPARTMENTS, k=8), statuses, categories, due, assigned_days, note_counts
+    ):
         assigned, qcp = pick_attorneys()
-        days_until_due = random.randint(8, 45)
-        days_assigned = random.randint(7, 21)
 
         projects.append({
-            "project_name": generate_project_name(
-                random.choice(["investigation", "litigation", "agreement"]), dept, counter
-            ),
+            "project_name": generate_project_name(category, dept, counter),
+            "project_group": None,
             "department": dept,
-            "date_to_client": today - timedelta(days=days_assigned + 5),
-            "date_assigned_to_us": today - timedelta(days=days_assigned),
+            "date_to_client": days_ago(days_assigned + 5),
+            "date_assigned_to_us": days_ago(days_assigned),
             "assigned_attorney": assigned,
             "qcp_attorney": qcp,
-            "internal_deadline": today + timedelta(days=days_until_due - 5),
-            "delivery_deadline": today + timedelta(days=days_until_due),
-            "status": random.choice([
-                ProjectStatus.IN_PROGRESS,
-                ProjectStatus.ON_HOLD,
-                ProjectStatus.WAITING_ON_CLIENT,
-            ]),
-            "notes": generate_notes(random.randint(0, 2)),
+            "internal_deadline": days_from_now(days_until_due - 5),
+            "delivery_deadline": days_from_now(days_until_due),
+            "status": status,
+            "notes": generate_notes(num_notes),
         })
         counter += 1
 
     # === NO DEADLINE (4) ===
     # delivery_deadline is None
-    for i in range(4):
-        dept = random.choice(DEPARTMENTS)
+    statuses = random.choices(NO_DEADLINE_STATUSES, k=4)
+    assigned_days = random.choices(range(7, 31), k=4)
+    note_counts = random.choices(range(0, 2), k=4)
+    for dept, status, days_assigned, num_notes in zip(
+        random.choices(DEPARTMENTS, k=4), statuses, assigned_days, note_counts
+    ):
         assigned, qcp = pick_attorneys()
-        days_assigned = random.randint(7, 30)
 
         projects.append({
             "project_name": generate_project_name("review", dept, counter),
+            "project_group": None,
             "department": dept,
-            "date_to_client": today - timedelta(days=days_assigned + 5),
-            "date_assigned_to_us": today - timedelta(days=days_assigned),
+            "date_to_client": days_ago(days_assigned + 5),
+            "date_assigned_to_us": days_ago(days_assigned),
             "assigned_attorney": assigned,
             "qcp_attorney": qcp,
             "internal_deadline": None,
             "delivery_deadline": None,
-            "status": random.choice([ProjectStatus.IN_PROGRESS, ProjectStatus.ON_HOLD]),
-            "notes": generate_notes(random.randint(0, 1)),
+            "status": status,
+            "notes": generate_notes(num_notes),
         })
         counter += 1
 
     # === COMPLETED (5) ===
     # status = Completed, for "Recently Completed" section
-    for i in range(5):
-        dept = random.choice(DEPARTMENTS)
+    categories = random.choices(COMPLETED_CATEGORIES, k=5)
+    completed = random.choices(range(1, 15), k=5)
+    lead_times = random.choices(range(14, 31), k=5)
+    note_counts = random.choices(range(3, 6), k=5)
+    for dept, category, days_completed, lead_time, num_notes in zip(
+        random.choices(DEPARTMENTS, k=5), categories, completed, lead_times, note_counts
+    ):
         assigned, qcp = pick_attorneys()
-        days_completed = random.randint(1, 14)
-        days_assigned = days_completed + random.randint(14, 30)
+        days_assigned = days_completed + lead_time
 
         projects.append({
-            "project_name": generate_project_name(
-                random.choice(["prr", "agreement", "review"]), dept, counter
-            ),
+            "project_name": generate_project_name(category, dept, counter),
+            "project_group": None,
             "department": dept,
-            "date_to_client": today - timedelta(days=days_assigned + 5),
-            "date_assigned_to_us": today - timedelta(days=days_assigned),
+            "date_to_client": days_ago(days_assigned + 5),
+            "date_assigned_to_us": days_ago(days_assigned),
             "assigned_attorney": assigned,
             "qcp_attorney": qcp,
-            "internal_deadline": today - timedelta(days=days_completed + 3),
-            "delivery_deadline": today - timedelta(days=days_completed),
+            "internal_deadline": days_ago(days_completed + 3),
+            "delivery_deadline": days_ago(days_completed),
             "status": ProjectStatus.COMPLETED,
-            "notes": generate_notes(random.randint(3, 5)),
+            "notes": generate_notes(num_notes),
         })
         counter += 1
 
@@ -386,25 +466,75 @@ def create_project_group_projects() -> list[dict]:
     return projects
 
 
-def seed_database() -> int:
+def generate_all_projects() -> list[dict]:
+    """Generate the regular and project group seed rows together."""
+    return create_seed_projects() + create_project_group_projects()
+
+
+def seed_database(all_projects: list[dict] | None = None) -> int:
     """Seed the database with fake projects.
 
+    Args:
+        all_projects: Rows to insert. Defaults to a fresh
+            generate_all_projects() batch.
+
     Returns:
         Number of projects created.
     """
-    # Combine regular and project group projects
-    all_projects = create_seed_projects() + create_project_group_projects()
+    if all_projects is None:
+        all_projects = generate_all_projects()
 
-    # Create projects using direct model instantiation
+    # Core takes the INSERT's column list from the first row, so make sure
+    # every row carries the same keys
+    columns = dict.fromkeys(key for row in all_projects for key in row)
+    all_projects = [{**columns, **row} for row in all_projects]
+
+    # Insert the rows directly in one executemany batch, in one transaction
     # (bypassing service to avoid normalization affecting our controlled data)
-    created_count = 0
-    for data in all_projects:
-        project = Project(**data)
-        db.session.add(project)
-        created_count += 1
+    with db.engine.connect() as conn:
+        sqlite = conn.dialect.name == 'sqlite'
+        if sqlite:
+            # Dev-only seeding: skip fsyncs and keep the rollback journal in
+            # memory. Set before the transaction begins, as SQLite requires.
+            conn.exec_driver_sql('PRAGMA synchronous=OFF')
+            conn.exec_driver_sql('PRAGMA journal_mode=MEMORY')
+            conn.commit()
+
+        with conn.begin():
+            conn.execute(insert(Project), all_projects)
+
+        if sqlite:
+            # The pragmas are per connection; discard it rather than return
+            # it to the pool with durability turned off.
+            conn.invalidate()
+
+    return len(all_projects)
+
+
+def print_summary(projects: list[dict]) -> None:
+    """Print status, deadline and group counts for freshly seeded rows.
 
-    db.session.commit()
-    return created_count
+    Computed from the rows just inserted rather than re-queried; main()
+    only seeds an empty table, so the two always agree.
+    """
+    by_status = Counter(project["status"] for project in projects)
+    for status in ProjectStatus.ALL:
+        print(f"  - {status}: {by_status[status]}")
+
+    today = date.today()
+    week_end = today + timedelta(days=6)
+    deadlines = [
+        project["delivery_deadline"]
+        for project in projects
+        if project["delivery_deadline"] is not None
+        and project["status"] != ProjectStatus.COMPLETED
+    ]
+    overdue = sum(1 for deadline in deadlines if deadline < today)
+    due_this_week = sum(1 for deadline in deadlines if today <= deadline <= week_end)
+    groups = {project["project_group"] for project in projects} - {None}
+    print(f"  - Overdue: {overdue}")
+    print(f"  - Due this week: {due_this_week}")
+    print(f"  - Project groups: {len(groups)}")
 
 
 def main():
@@ -420,47 +550,10 @@ def main():
             return
 
         print("Seeding database with fake projects...")
-        count = seed_database()
+        all_projects = generate_all_projects()
+        count = seed_database(all_projects)
         print(f"Created {count} projects.")
-
-        # Print summary
-        statuses = {}
-        for status in ProjectStatus.ALL:
-            status_count = db.session.query(Project).filter_by(status=status).count()
-            statuses[status] = status_count
-            print(f"  - {status}: {status_count}")
-
-        # Count overdue
-        today = date.today()
-        overdue = (
-            db.session.query(Project)
-            .filter(Project.delivery_deadline < today)
-            .filter(Project.status != ProjectStatus.COMPLETED)
-            .filter(Project.deleted_at.is_(None))
-            .count()
-        )
-        print(f"  - Overdue: {overdue}")
-
-        # Count due this week
-        week_end = today + timedelta(days=6)
-        due_this_week = (
-            db.session.query(Project)
-            .filter(Project.delivery_deadline >= today)
-            .filter(Project.delivery_deadline <= week_end)
-            .filter(Project.status != ProjectStatus.COMPLETED)
-            .filter(Project.deleted_at.is_(None))
-            .count()
-        )
-        print(f"  - Due this week: {due_this_week}")
-
-        # Count project groups
-        groups = (
-            db.session.query(Project.project_group)
-            .filter(Project.project_group.isnot(None))
-            .distinct()
-            .count()
-        )
-        print(f"  - Project groups: {groups}")
+        print_summary(all_projects)
 
         print("\nSeed complete!")
 
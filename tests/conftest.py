@@ -1,15 +1,21 @@
 """Pytest fixtures for the Legal Project Tracker tests.
 
 This module provides fixtures for setting up test database and application
-context. Uses an in-memory SQLite database to ensure test isolation and
-avoid affecting development data.
+context. Uses an in-memory SQLite database to avoid affecting development
+data. The schema is created once per session; each test runs in a
+transaction that is rolled back afterwards.
 """
+import itertools
 import pytest
-from datetime import date
+from datetime import date, timedelta
+
+from flask_sqlalchemy.session import Session
+from sqlalchemy import event
 
 from app import create_app, db
 from app.config import Config
 from app.models import Project, ProjectStatus
+from app.services import project_service
 
 
 class TestConfig(Config):
@@ -19,16 +25,50 @@ class TestConfig(Config):
     """
     TESTING = True
     SQLALCHEMY_DATABASE_URI = 'sqlite:///:memory:'
+    SQLALCHEMY_ENGINE_OPTIONS = {}
+    SQLALCHEMY_RAISELOAD = True
+    JINJA_BYTECODE_CACHE = False
     WTF_CSRF_ENABLED = False
     SECRET_KEY = 'test-secret-key'
 
 
-@pytest.fixture(scope='function')
-def app():
-    """Create and configure a test application instance.
+class _ConnectionBoundSession(Session):
+    """Session that uses its bind connection for every query.
+
+    Flask-SQLAlchemy's Session.get_bind() always returns the app's engine,
+    which would bypass the per-test connection and its transaction.
+    """
+
+    def get_bind(self, *args, **kwargs):
+        return self.bind
+
+
+def _use_explicit_sqlite_transactions(engine) -> None:
+    """Let SQLAlchemy, not pysqlite, emit BEGIN so SAVEPOINTs nest.
 
-    Uses an in-memory SQLite database to ensure each test starts with
-    a clean database. Tables are created fresh for each test function.
+    pysqlite defers BEGIN until the first DML statement, so the outer test
+    transaction would not exist when the first SAVEPOINT is issued, and
+    releasing it would commit. See the SQLAlchemy pysqlite documentation,
+    "Serializable isolation / Savepoints / Transactional DDL".
+
+    The connect hook also applies per-connection SQLite PRAGMAs.
+    """
+    @event.listens_for(engine, 'connect')
+    def do_connect(dbapi_connection, connection_record):
+        dbapi_connection.isolation_level = None
+        # Keep sorter and temp-index spill files in memory too. The journal
+        # and fsync settings need no tuning: an in-memory database already
+        # journals in memory and never syncs.
+        dbapi_connection.execute('PRAGMA temp_store=MEMORY')
+
+    @event.listens_for(engine, 'begin')
+    def do_begin(conn):
+        conn.exec_driver_sql('BEGIN')
+
+
+@pytest.fixture(scope='session')
+def _app():
+    """Create the application and its schema once for the test session.
 
     Yields:
         Flask application configured for testing.
@@ -36,12 +76,54 @@ def app():
     app = create_app(TestConfig)
 
     with app.app_context():
+        _use_explicit_sqlite_transactions(db.engine)
         db.create_all()
         yield app
         db.session.remove()
         db.drop_all()
 
 
+@pytest.fixture(scope='function')
+def app(_app):
+    """Provide the test application with an isolated database transaction.
+
+    Each test runs inside a transaction that is rolled back afterwards;
+    commits made by the code under test only release a SAVEPOINT. Config
+    values and per-app caches (app.extensions) are restored as well, so
+    every test starts from the same state without recreating the schema.
+
+    Args:
+        _app: Session-scoped application fixture.
+
+    Yields:
+        Flask application configured for testing.
+    """
+    config = dict(_app.config)
+    extensions = set(_app.extensions)
+
+    connection = db.engine.connect()
+    transaction = connection.begin()
+    session = db.session
+    db.session = db._make_scoped_session({
+        'class_': _ConnectionBoundSession,
+        'bind': connection,
+        'join_transaction_mode': 'create_savepoint',
+    })
+
+    with _app.app_context():
+        yield _app
+
+    db.session.remove()
+    db.session = session
+    transaction.rollback()
+    connection.close()
+
+    _app.config.clear()
+    _app.config.update(config)
+    for key in set(_app.extensions) - extensions:
+        del _app.extensions[key]
+
+
 @pytest.fixture(scope='function')
 def client(app):
     """Create a test client for the application.
@@ -69,6 +151,43 @@ def db_session(app):
         yield db.session
 
 
+@pytest.fixture
+def sql_statements(app):
+    """Record the SQL statements executed while a block runs.
+
+    SAVEPOINT statements issued for test isolation are left out.
+
+    Usage:
+        with sql_statements() as statements:
+            ...
+        assert len(statements) == 1
+
+    Args:
+        app: Flask application fixture.
+
+    Returns:
+        Context manager factory yielding the list of executed statements.
+    """
+    from contextlib import contextmanager
+
+    @contextmanager
+    def record():
+        statements = []
+
+        def before_cursor_execute(conn, cursor, statement, *args):
+            # SAVEPOINT bookkeeping comes from the per-test transaction
+            if 'SAVEPOINT' not in statement:
+                statements.append(statement)
+
+        event.listen(db.engine, 'before_cursor_execute', before_cursor_execute)
+        try:
+            yield statements
+        finally:
+            event.remove(db.engine, 'before_cursor_execute', before_cursor_execute)
+
+    return record
+
+
 @pytest.fixture
 def sample_project_data():
     """Provide sample data for creating a project.
@@ -106,7 +225,54 @@ def sample_project(app, sample_project_data):
         project = Project(**sample_project_data)
         db.session.add(project)
         db.session.commit()
-        # Refresh to get the ID and return a detached object
-        project_id = project.id
-        db.session.expunge(project)
+        # Load the committed row; the session is removed with this app
+        # context, leaving a detached instance with every column populated
+        db.session.refresh(project)
         return project
+
+
+_project_name_counter = itertools.count()
+
+
+@pytest.fixture
+def create_projects(app):
+    """Factory fixture to create several projects in one INSERT batch.
+
+    Returns a function that takes a list of attribute dicts, each merged
+    over defaults dated relative to today, and returns the new IDs in the
+    same order. Each default project name is unique.
+
+    Args:
+        app: Flask application fixture.
+
+    Returns:
+        Function creating the projects and returning their IDs.
+    """
+    def _create_projects(rows):
+        today = date.today()
+        merged = [
+            {
+                'project_name': f'Test Project {next(_project_name_counter)}',
+                'department': 'Public Works',
+                'date_to_client': today - timedelta(days=7),
+                'date_assigned_to_us': today - timedelta(days=5),
+                'assigned_attorney': 'John Smith',
+                'qcp_attorney': 'Jane Doe',
+                'status': ProjectStatus.IN_PROGRESS,
+                'delivery_deadline': today + timedelta(days=7),
+                **row,
+            }
+            for row in rows
+        ]
+        with app.app_context():
+            ids = db.session.scalars(
+                db.insert(Project).returning(Project.id, sort_by_parameter_order=True),
+                merged,
+            ).all()
+            db.session.commit()
+            # Bulk INSERTs skip the ORM write events, which would otherwise
+            # mark the data changed and drop the cached distinct values
+            project_service.bump_data_version()
+            project_service.invalidate_distinct_values()
+            return ids
+    return _create_projects
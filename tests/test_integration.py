@@ -26,63 +26,31 @@ from app.services import project_service
 # ============================================================================
 
 @pytest.fixture
-def create_test_project(app):
+def create_test_project(create_projects):
     """Factory fixture to create projects with controlled attributes.
 
     Returns a function that creates a project and returns its ID.
     Defaults are provided but can be overridden with kwargs.
     """
     def _create(**kwargs):
-        defaults = {
-            'project_name': f'Test Project {datetime.now().timestamp()}',
-            'department': 'Public Works',
-            'date_to_client': date.today() - timedelta(days=7),
-            'date_assigned_to_us': date.today() - timedelta(days=5),
-            'assigned_attorney': 'John Smith',
-            'qcp_attorney': 'Jane Doe',
-            'status': ProjectStatus.IN_PROGRESS,
-            'delivery_deadline': date.today() + timedelta(days=7),
-        }
-        defaults.update(kwargs)
-        with app.app_context():
-            project = Project(**defaults)
-            db.session.add(project)
-            db.session.commit()
-            return project.id
+        return create_projects([kwargs])[0]
     return _create
 
 
 @pytest.fixture
-def create_project_with_timestamps(app):
+def create_project_with_timestamps(create_projects):
     """Factory fixture to create projects with controlled created_at/updated_at.
 
     Useful for testing monthly stats where we need to control when
     projects were created or completed.
     """
     def _create(created_at=None, updated_at=None, **kwargs):
-        defaults = {
-            'project_name': f'Test Project {datetime.now().timestamp()}',
-            'department': 'Public Works',
-            'date_to_client': date.today() - timedelta(days=7),
-            'date_assigned_to_us': date.today() - timedelta(days=5),
-            'assigned_attorney': 'John Smith',
-            'qcp_attorney': 'Jane Doe',
-            'status': ProjectStatus.IN_PROGRESS,
-        }
-        defaults.update(kwargs)
-        with app.app_context():
-            project = Project(**defaults)
-            db.session.add(project)
-            db.session.flush()  # Get ID before setting timestamps
-
-            # Override timestamps if provided
-            if created_at:
-                project.created_at = created_at
-            if updated_at:
-                project.updated_at = updated_at
-
-            db.session.commit()
-            return project.id
+        # Override timestamps if provided
+        if created_at:
+            kwargs['created_at'] = created_at
+        if updated_at:
+            kwargs['updated_at'] = updated_at
+        return create_projects([kwargs])[0]
     return _create
 
 
@@ -208,13 +176,15 @@ class TestProjectLifecycleDashboard:
 class TestFilteringAndSorting:
     """Tests for: Create multiple projects → filter works → sort works."""
 
-    def test_filter_by_department(self, client, create_test_project):
+    def test_filter_by_department(self, client, create_projects):
         """Filter by department returns only matching projects."""
         # Create projects in different departments
-        create_test_project(project_name='PW Project 1', department='Public Works')
-        create_test_project(project_name='PW Project 2', department='Public Works')
-        create_test_project(project_name='HR Project', department='Human Resources')
-        create_test_project(project_name='Finance Project', department='Finance')
+        create_projects([
+            {'project_name': 'PW Project 1', 'department': 'Public Works'},
+            {'project_name': 'PW Project 2', 'department': 'Public Works'},
+            {'project_name': 'HR Project', 'department': 'Human Resources'},
+            {'project_name': 'Finance Project', 'department': 'Finance'},
+        ])
 
         # Filter by Public Works
         response = client.get('/projects?department=Public+Works')
@@ -224,11 +194,13 @@ class TestFilteringAndSorting:
         for project in data['data']:
             assert project['department'] == 'Public Works'
 
-    def test_filter_by_status(self, client, create_test_project):
+    def test_filter_by_status(self, client, create_projects):
         """Filter by status returns only matching projects."""
-        create_test_project(project_name='In Progress', status=ProjectStatus.IN_PROGRESS)
-        create_test_project(project_name='Under Review 1', status=ProjectStatus.UNDER_REVIEW)
-        create_test_project(project_name='Under Review 2', status=ProjectStatus.UNDER_REVIEW)
+        create_projects([
+            {'project_name': 'In Progress', 'status': ProjectStatus.IN_PROGRESS},
+            {'project_name': 'Under Review 1', 'status': ProjectStatus.UNDER_REVIEW},
+            {'project_name': 'Under Review 2', 'status': ProjectStatus.UNDER_REVIEW},
+        ])
 
         # Filter by Under Review
         response = client.get('/projects?status=Under+Review&include_completed=true')
@@ -238,20 +210,13 @@ class TestFilteringAndSorting:
         for project in data['data']:
             assert project['status'] == ProjectStatus.UNDER_REVIEW
 
-    def test_sort_by_delivery_deadline_ascending(self, client, create_test_project):
+    def test_sort_by_delivery_deadline_ascending(self, client, create_projects):
         """Sort by delivery_deadline ascending orders correctly."""
-        create_test_project(
-            project_name='Later',
-            delivery_deadline=date.today() + timedelta(days=10)
-        )
-        create_test_project(
-            project_name='Sooner',
-            delivery_deadline=date.today() + timedelta(days=2)
-        )
-        create_test_project(
-            project_name='Middle',
-            delivery_deadline=date.today() + timedelta(days=5)
-        )
+        create_projects([
+            {'project_name': 'Later', 'delivery_deadline': date.today() + timedelta(days=10)},
+            {'project_name': 'Sooner', 'delivery_deadline': date.today() + timedelta(days=2)},
+            {'project_name': 'Middle', 'delivery_deadline': date.today() + timedelta(days=5)},
+        ])
 
         response = client.get('/projects?sort_by=delivery_deadline&sort_dir=asc')
         assert response.status_code == 200
@@ -260,23 +225,25 @@ class TestFilteringAndSorting:
         names = [p['project_name'] for p in data['data']]
         assert names.index('Sooner') < names.index('Middle') < names.index('Later')
 
-    def test_multi_term_search(self, client, create_test_project):
+    def test_multi_term_search(self, client, create_projects):
         """Multi-term search finds projects matching all terms."""
-        create_test_project(
-            project_name='HR Investigation Case',
-            department='Human Resources',
-            notes='Investigation into employee conduct'
-        )
-        create_test_project(
-            project_name='Finance Audit',
-            department='Finance',
-            notes='Annual audit review'
-        )
-        create_test_project(
-            project_name='HR Benefits Review',
-            department='Human Resources',
-            notes='Quarterly benefits review'
-        )
+        create_projects([
+            {
+                'project_name': 'HR Investigation Case',
+                'department': 'Human Resources',
+                'notes': 'Investigation into employee conduct',
+            },
+            {
+                'project_name': 'Finance Audit',
+                'department': 'Finance',
+                'notes': 'Annual audit review',
+            },
+            {
+                'project_name': 'HR Benefits Review',
+                'department': 'Human Resources',
+                'notes': 'Quarterly benefits review',
+            },
+        ])
 
         # Search for "HR Investigation" - should only find the first project
         response = client.get('/projects?search=HR+Investigation')
@@ -285,26 +252,28 @@ class TestFilteringAndSorting:
         assert data['count'] == 1
         assert data['data'][0]['project_name'] == 'HR Investigation Case'
 
-    def test_combined_filters(self, client, create_test_project):
+    def test_combined_filters(self, client, create_projects):
         """Multiple filters work together."""
-        create_test_project(
-            project_name='Match All',
-            department='Public Works',
-            status=ProjectStatus.UNDER_REVIEW,
-            assigned_attorney='John Smith',
-        )
-        create_test_project(
-            project_name='Wrong Dept',
-            department='Finance',
-            status=ProjectStatus.UNDER_REVIEW,
-            assigned_attorney='John Smith',
-        )
-        create_test_project(
-            project_name='Wrong Status',
-            department='Public Works',
-            status=ProjectStatus.IN_PROGRESS,
-            assigned_attorney='John Smith',
-        )
+        create_projects([
+            {
+                'project_name': 'Match All',
+                'department': 'Public Works',
+                'status': ProjectStatus.UNDER_REVIEW,
+                'assigned_attorney': 'John Smith',
+            },
+            {
+                'project_name': 'Wrong Dept',
+                'department': 'Finance',
+                'status': ProjectStatus.UNDER_REVIEW,
+                'assigned_attorney': 'John Smith',
+            },
+            {
+                'project_name': 'Wrong Status',
+                'department': 'Public Works',
+                'status': ProjectStatus.IN_PROGRESS,
+                'assigned_attorney': 'John Smith',
+            },
+        ])
 
         # Combine department and status filters
         response = client.get(
@@ -387,14 +356,13 @@ class TestCompletionWorkflow:
         assert 'Dashboard Completed' not in due_this_week_names
         assert 'Dashboard Completed' not in longer_names
 
-    def test_recently_completed_limited_to_10(self, client, create_test_project):
+    def test_recently_completed_limited_to_10(self, client, create_projects):
         """Recently Completed section shows maximum 10 projects."""
         # Create 12 completed projects
-        for i in range(12):
-            create_test_project(
-                project_name=f'Completed {i}',
-                status=ProjectStatus.COMPLETED
-            )
+        create_projects([
+            {'project_name': f'Completed {i}', 'status': ProjectStatus.COMPLETED}
+            for i in range(12)
+        ])
 
         response = client.get('/api/dashboard')
         data = response.get_json()
@@ -409,12 +377,14 @@ class TestCompletionWorkflow:
 class TestWeeklyReport:
     """Tests for: Generate weekly report → all active projects appear."""
 
-    def test_weekly_report_includes_active_projects(self, client, create_test_project):
+    def test_weekly_report_includes_active_projects(self, client, create_projects):
         """Weekly report includes all active (non-completed) projects."""
-        create_test_project(project_name='Active 1', status=ProjectStatus.IN_PROGRESS)
-        create_test_project(project_name='Active 2', status=ProjectStatus.UNDER_REVIEW)
-        create_test_project(project_name='Active 3', status=ProjectStatus.ON_HOLD)
-        create_test_project(project_name='Completed', status=ProjectStatus.COMPLETED)
+        create_projects([
+            {'project_name': 'Active 1', 'status': ProjectStatus.IN_PROGRESS},
+            {'project_name': 'Active 2', 'status': ProjectStatus.UNDER_REVIEW},
+            {'project_name': 'Active 3', 'status': ProjectStatus.ON_HOLD},
+            {'project_name': 'Completed', 'status': ProjectStatus.COMPLETED},
+        ])
 
         response = client.get('/reports/weekly')
         assert response.status_code == 200
@@ -709,11 +679,13 @@ class TestSoftDelete:
 class TestAutocompleteNormalization:
     """Tests for autocomplete and soft normalization."""
 
-    def test_autocomplete_returns_distinct_values(self, client, create_test_project):
+    def test_autocomplete_returns_distinct_values(self, client, create_projects):
         """Autocomplete endpoint returns distinct values."""
-        create_test_project(project_name='P1', department='Public Works')
-        create_test_project(project_name='P2', department='Human Resources')
-        create_test_project(project_name='P3', department='Public Works')  # Duplicate
+        create_projects([
+            {'project_name': 'P1', 'department': 'Public Works'},
+            {'project_name': 'P2', 'department': 'Human Resources'},
+            {'project_name': 'P3', 'department': 'Public Works'},  # Duplicate
+        ])
 
         response = client.get('/api/autocomplete/department')
         assert response.status_code == 200
@@ -774,10 +746,23 @@ class TestCSVExport:
         assert len(rows) >= 1
         assert 'Project Name' in reader.fieldnames
 
-    def test_csv_export_respects_filters(self, client, create_test_project):
+    def test_csv_export_is_streamed(self, client, create_projects):
+        """CSV export is sent in chunks as rows are read, not built up front."""
+        create_projects([{'project_name': f'Streamed {i}'} for i in range(3)])
+
+        response = client.get('/projects/export')
+        assert response.is_streamed
+        assert 'attachment' in response.headers['Content-Disposition']
+
+        rows = list(csv.DictReader(io.StringIO(response.get_data(as_text=True))))
+        assert {row['Project Name'] for row in rows} >= {'Streamed 0', 'Streamed 1', 'Streamed 2'}
+
+    def test_csv_export_respects_filters(self, client, create_projects):
         """CSV export respects filter parameters."""
-        create_test_project(project_name='PW Export', department='Public Works')
-        create_test_project(project_name='HR Export', department='Human Resources')
+        create_projects([
+            {'project_name': 'PW Export', 'department': 'Public Works'},
+            {'project_name': 'HR Export', 'department': 'Human Resources'},
+        ])
 
         # Export with department filter
         response = client.get('/projects/export?department=Public+Works')
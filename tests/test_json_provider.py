@@ -0,0 +1,57 @@
+"""Tests for the application JSON provider.
+
+Verifies dates serialize as ISO strings and that the orjson and
+standard library paths produce equivalent JSON.
+"""
+import json
+from datetime import date, datetime
+from decimal import Decimal
+
+import pytest
+
+from app import json_provider
+
+
+@pytest.fixture(params=['orjson', 'stdlib'])
+def provider(app, request, monkeypatch):
+    """The app's JSON provider, run with and without orjson."""
+    if request.param == 'orjson':
+        pytest.importorskip('orjson')
+    else:
+        monkeypatch.setattr(json_provider, 'orjson', None)
+    return app.json
+
+
+class TestISODateJSONProvider:
+    """Tests for ISODateJSONProvider."""
+
+    def test_dates_are_iso_strings(self, provider):
+        """Dates and datetimes serialize as ISO-8601 strings."""
+        result = json.loads(provider.dumps({
+            'day': date(2026, 1, 5),
+            'moment': datetime(2026, 1, 5, 9, 30, 15, 123456),
+        }))
+        assert result == {
+            'day': '2026-01-05',
+            'moment': '2026-01-05T09:30:15.123456',
+        }
+
+    def test_keys_sorted(self, provider):
+        """Object keys are sorted, matching Flask's default."""
+        output = provider.dumps({'b': 1, 'a': 2})
+        assert output.index('"a"') < output.index('"b"')
+
+    def test_indented_output(self, provider):
+        """The 2-space indent used for debug responses is honored."""
+        assert provider.dumps({'a': [1]}, indent=2) == '{\n  "a": [\n    1\n  ]\n}'
+
+    def test_falls_back_for_unsupported_types(self, provider):
+        """Types only the standard encoder's default handles still work."""
+        assert json.loads(provider.dumps({'amount': Decimal('1.50')})) == {'amount': '1.50'}
+
+    def test_response(self, app, provider):
+        """response() returns a JSON response body."""
+        with app.test_request_context():
+            response = provider.response({'day': date(2026, 1, 5)})
+        assert response.mimetype == 'application/json'
+        assert response.get_json() == {'day': '2026-01-05'}
@@ -6,9 +6,12 @@ that all fields work correctly and the model behaves as expected.
 from datetime import date, datetime
 
 import pytest
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.exc import SAWarning
+from sqlalchemy.schema import CreateIndex
 
 from app import db
-from app.models import Project, ProjectStatus
+from app.models import SEARCH_FIELDS, Project, ProjectStatus
 
 
 class TestProjectStatus:
@@ -31,10 +34,29 @@ class TestProjectStatus:
         assert ProjectStatus.ON_HOLD in ProjectStatus.ALL
         assert ProjectStatus.COMPLETED in ProjectStatus.ALL
 
+    def test_active_list_excludes_completed(self):
+        """Verify ACTIVE is ALL without Completed, in the same order."""
+        assert ProjectStatus.ACTIVE == tuple(
+            s for s in ProjectStatus.ALL if s != ProjectStatus.COMPLETED
+        )
+
+    def test_status_sets_match_sequences(self):
+        """Verify the frozenset forms hold the same statuses."""
+        assert ProjectStatus.ALL_SET == frozenset(ProjectStatus.ALL)
+        assert ProjectStatus.ACTIVE_SET == frozenset(ProjectStatus.ACTIVE)
+
 
 class TestProjectModel:
     """Tests for the Project model."""
 
+    @pytest.mark.parametrize('run', [1, 2])
+    def test_committed_rows_do_not_leak_between_tests(self, app, sample_project_data, run):
+        """Each test's commits are rolled back before the next test."""
+        with app.app_context():
+            db.session.add(Project(**sample_project_data))
+            db.session.commit()
+            assert db.session.query(Project).count() == 1
+
     def test_create_project_with_required_fields(self, app):
         """Test creating a project with all required fields."""
         with app.app_context():
@@ -237,6 +259,17 @@ class TestProjectModel:
             assert result['delivery_deadline'] is None
             assert result['deleted_at'] is None
 
+    def test_to_dict_covers_all_columns(self, app, sample_project_data):
+        """Test to_dict includes exactly the table's columns."""
+        with app.app_context():
+            project = Project(**sample_project_data)
+            db.session.add(project)
+            db.session.commit()
+
+            result = project.to_dict()
+
+            assert set(result) == set(Project.__table__.columns.keys())
+
     def test_all_status_values_can_be_set(self, app):
         """Test that all status values from the enum can be saved."""
         with app.app_context():
@@ -288,3 +321,63 @@ class TestProjectTableStructure:
 
             assert required_columns.issubset(columns), \
                 f"Missing columns: {required_columns - columns}"
+
+    def test_dashboard_indexes_exist(self, app):
+        """Verify the indexes backing dashboard and list queries exist."""
+        with app.app_context():
+            from sqlalchemy import inspect
+            inspector = inspect(db.engine)
+            # Expression indexes can't be reflected on SQLite; they are
+            # covered by test_partial_indexes
+            with pytest.warns(SAWarning, match='expression-based index'):
+                indexes = {
+                    idx['name']: idx['column_names']
+                    for idx in inspector.get_indexes('projects')
+                }
+
+            assert indexes['ix_projects_status_delivery'] == ['status', 'delivery_deadline']
+            assert indexes['ix_projects_updated_at'] == ['updated_at']
+            # Live-project queries use the partial indexes instead
+            assert 'ix_projects_deleted_at' not in indexes
+
+    @pytest.mark.parametrize('name, expression', [
+        ('ix_projects_active_delivery', '(delivery_deadline)'),
+        ('ix_projects_status_delivery', '(status, delivery_deadline)'),
+        ('ix_projects_department_lower_status', '(lower(department), status)'),
+        ('ix_projects_assigned_attorney_lower', '(lower(assigned_attorney))'),
+        ('ix_projects_qcp_attorney_lower', '(lower(qcp_attorney))'),
+        ('ix_projects_status_updated', '(status, updated_at)'),
+        ('ix_projects_created_at', '(created_at)'),
+        ('ix_projects_updated_at', '(updated_at)'),
+        ('ix_projects_department', '(department)'),
+        ('ix_projects_assigned_attorney', '(assigned_attorney)'),
+        ('ix_projects_qcp_attorney', '(qcp_attorney)'),
+        ('ix_projects_project_group', '(project_group)'),
+    ])
+    def test_partial_indexes(self, app, name, expression):
+        """Verify the partial indexes only cover live projects."""
+        with app.app_context():
+            sql = db.session.execute(
+                db.text("SELECT sql FROM sqlite_master WHERE name = :name"),
+                {'name': name},
+            ).scalar()
+
+            assert f'ON projects {expression} WHERE deleted_at IS NULL' in sql
+
+    @pytest.mark.parametrize('field', SEARCH_FIELDS)
+    def test_trigram_search_indexes_are_postgresql_only(self, app, field):
+        """Search columns get GIN trigram indexes on PostgreSQL and none on SQLite."""
+        name = f'ix_projects_{field}_trgm'
+        index = next(idx for idx in Project.__table__.indexes if idx.name == name)
+        ddl = str(CreateIndex(index).compile(dialect=postgresql.dialect()))
+        assert ddl == (
+            f'CREATE INDEX {name} ON projects USING gin ({field} gin_trgm_ops) '
+            'WHERE deleted_at IS NULL'
+        )
+
+        with app.app_context():
+            sql = db.session.execute(
+                db.text("SELECT sql FROM sqlite_master WHERE name = :name"),
+                {'name': name},
+            ).scalar()
+            assert sql is None
@@ -15,8 +15,10 @@ from app.services.report_service import (
     get_weekly_status_data,
     get_monthly_stats,
     export_projects_csv,
+    iter_projects_csv,
     get_available_weekly_fields,
     DEFAULT_WEEKLY_FIELDS,
+    CSV_FIELDNAMES,
 )
 
 
@@ -94,6 +96,55 @@ class TestGetWeeklyStatusData:
             assert result[0]['project_name'] == 'Test Project'
             assert result[0]['department'] == 'Public Works'
 
+    def test_skips_fields_that_are_not_columns(self, app):
+        """Unknown names and model methods are left out of the rows."""
+        with app.app_context():
+            create_project({
+                'project_name': 'Test Project',
+                'department': 'Public Works',
+                'date_to_client': date(2026, 1, 1),
+                'date_assigned_to_us': date(2026, 1, 5),
+                'assigned_attorney': 'John Smith',
+                'qcp_attorney': 'Jane Doe',
+                'delivery_deadline': date(2026, 2, 1),
+            })
+
+            result = get_weekly_status_data(
+                fields=['project_name', 'to_dict', 'nonexistent', 'anticipated_completion']
+            )
+
+            assert result == [{
+                'project_name': 'Test Project',
+                'anticipated_completion': '2026-02-01',
+            }]
+
+    def test_formats_date_and_datetime_columns(self, app):
+        """Date and datetime values are ISO strings; missing dates stay None."""
+        with app.app_context():
+            created = create_project({
+                'project_name': 'Test Project',
+                'department': 'Public Works',
+                'date_to_client': date(2026, 1, 1),
+                'date_assigned_to_us': date(2026, 1, 5),
+                'assigned_attorney': 'John Smith',
+                'qcp_attorney': 'Jane Doe',
+                'delivery_deadline': date(2026, 2, 1),
+            })
+            created_at = created.created_at.isoformat()
+
+            result = get_weekly_status_data(fields=[
+                'delivery_deadline', 'anticipated_completion',
+                'internal_deadline', 'created_at', 'id',
+            ])
+
+            assert result == [{
+                'delivery_deadline': '2026-02-01',
+                'anticipated_completion': '2026-02-01',
+                'internal_deadline': None,
+                'created_at': created_at,
+                'id': created.id,
+            }]
+
     def test_field_rename_delivery_deadline_to_anticipated_completion(self, app):
         """Should rename delivery_deadline to anticipated_completion in output."""
         with app.app_context():
@@ -208,6 +259,21 @@ class TestGetWeeklyStatusData:
             assert result[0]['project_name'] == 'Has Deadline'
             assert result[1]['project_name'] == 'No Deadline'
 
+    def test_single_query_filtered_by_status_index(self, app, sql_statements):
+        """Completed rows are excluded in SQL by seeking the status index."""
+        with app.app_context():
+            with sql_statements() as statements:
+                get_weekly_status_data()
+
+            assert len(statements) == 1
+            plan = db.session.connection().exec_driver_sql(
+                f'EXPLAIN QUERY PLAN {statements[0]}', tuple(ProjectStatus.ACTIVE)
+            ).all()
+            details = ' '.join(row[-1] for row in plan)
+            # Either (status, ...) partial index serves the IN (...) seek
+            assert 'SEARCH projects USING INDEX ix_projects_status_' in details
+            assert '(status=?)' in details
+
 
 class TestGetMonthlyStats:
     """Tests for get_monthly_stats function."""
@@ -326,6 +392,75 @@ class TestGetMonthlyStats:
 
             assert stats['avg_days_to_completion'] == 10.0
 
+    def test_avg_days_counts_whole_days(self, app):
+        """Days are whole days to the completion date, averaged to one decimal."""
+        with app.app_context():
+            completed_at = [
+                datetime(2026, 1, 11, 23, 59),  # 1 day
+                datetime(2026, 1, 12, 0, 1),    # 2 days
+                datetime(2026, 1, 12, 12, 0),   # 2 days
+            ]
+            for index, updated_at in enumerate(completed_at):
+                project = create_project({
+                    'project_name': f'Completed {index}',
+                    'department': 'Public Works',
+                    'date_to_client': date(2026, 1, 1),
+                    'date_assigned_to_us': date(2026, 1, 10),
+                    'assigned_attorney': 'John Smith',
+                    'qcp_attorney': 'Jane Doe',
+                    'status': ProjectStatus.COMPLETED,
+                })
+                project.updated_at = updated_at
+            db.session.commit()
+
+            stats = get_monthly_stats(2026, 1)
+
+            assert stats['projects_completed'] == 3
+            assert stats['avg_days_to_completion'] == 1.7
+
+    def test_days_between_compiles_for_postgres(self):
+        """PostgreSQL subtracts the dates directly."""
+        from sqlalchemy.dialects import postgresql
+        from app.services.report_service import _DaysBetween
+
+        expr = _DaysBetween(Project.date_assigned_to_us, Project.updated_at)
+        sql = str(expr.compile(dialect=postgresql.dialect()))
+        assert sql == (
+            '(CAST(projects.updated_at AS DATE) - projects.date_assigned_to_us)'
+        )
+
+    def test_stats_read_in_one_query(self, app, sql_statements):
+        """Opened breakdowns and completion stats come from a single statement."""
+        with app.app_context():
+            january = datetime(2026, 1, 15, 10, 0, 0, tzinfo=timezone.utc)
+            for name, department, attorney, status in [
+                ('Opened 1', 'Public Works', 'John Smith', ProjectStatus.IN_PROGRESS),
+                ('Opened 2', 'Finance', 'John Smith', ProjectStatus.IN_PROGRESS),
+                ('Done', 'Finance', 'Amy Adams', ProjectStatus.COMPLETED),
+            ]:
+                project = create_project({
+                    'project_name': name,
+                    'department': department,
+                    'date_to_client': date(2026, 1, 1),
+                    'date_assigned_to_us': date(2026, 1, 5),
+                    'assigned_attorney': attorney,
+                    'qcp_attorney': 'Jane Doe',
+                    'status': status,
+                })
+                project.created_at = january
+                project.updated_at = january
+            db.session.commit()
+
+            with sql_statements() as statements:
+                stats = get_monthly_stats(2026, 1)
+
+            assert len(statements) == 1
+            assert stats['projects_opened'] == 3
+            assert stats['projects_completed'] == 1
+            assert list(stats['by_department'].items()) == [('Finance', 2), ('Public Works', 1)]
+            assert list(stats['by_attorney'].items()) == [('Amy Adams', 1), ('John Smith', 2)]
+            assert stats['avg_days_to_completion'] == 10.0
+
     def test_handles_month_with_no_projects(self, app):
         """Should return zeros when no projects in month."""
         with app.app_context():
@@ -403,6 +538,36 @@ class TestGetMonthlyStats:
 class TestExportProjectsCsv:
     """Tests for export_projects_csv function."""
 
+    def test_chunked_export_matches_full_export(self, app):
+        """Chunks concatenate to the same CSV as the full export."""
+        with app.app_context():
+            for i in range(5):
+                create_project({
+                    'project_name': f'Project {i}',
+                    'department': 'Public Works',
+                    'date_to_client': date(2026, 1, 1),
+                    'date_assigned_to_us': date(2026, 1, 5),
+                    'assigned_attorney': 'John Smith',
+                    'qcp_attorney': 'Jane Doe',
+                    'delivery_deadline': date(2026, 2, i + 1),
+                })
+
+            chunks = list(iter_projects_csv(rows_per_chunk=2))
+
+            # Header alone, then rows two at a time, then the last row
+            assert len(chunks) == 4
+            assert chunks[0] == ','.join(CSV_FIELDNAMES) + '\r\n'
+            assert ''.join(chunks) == export_projects_csv()
+            rows = list(csv.DictReader(io.StringIO(''.join(chunks))))
+            assert [r['Project Name'] for r in rows] == [f'Project {i}' for i in range(5)]
+
+    def test_chunked_export_empty(self, app):
+        """With no projects, only the header is produced."""
+        with app.app_context():
+            chunks = list(iter_projects_csv())
+            assert len(chunks) == 1
+            assert chunks[0].startswith('ID,')
+
     def test_returns_valid_csv_string(self, app):
         """Should return a valid CSV-formatted string."""
         with app.app_context():
@@ -469,6 +634,25 @@ class TestExportProjectsCsv:
             assert len(row['Notes']) == 200  # 197 + '...'
             assert row['Notes'].endswith('...')
 
+    @pytest.mark.parametrize('length, truncated', [(200, False), (201, True)])
+    def test_notes_truncation_boundary(self, app, length, truncated):
+        """Notes of exactly 200 characters are kept whole."""
+        with app.app_context():
+            create_project({
+                'project_name': 'Test Project',
+                'department': 'Public Works',
+                'date_to_client': date(2026, 1, 1),
+                'date_assigned_to_us': date(2026, 1, 5),
+                'assigned_attorney': 'John Smith',
+                'qcp_attorney': 'Jane Doe',
+                'notes': 'A' * length,
+            })
+
+            row = next(csv.DictReader(io.StringIO(export_projects_csv())))
+
+            assert len(row['Notes']) == 200
+            assert row['Notes'].endswith('...') is truncated
+
     def test_filters_are_applied(self, app):
         """Should apply filters to the export."""
         with app.app_context():
@@ -10,6 +10,7 @@ import pytest
 
 from app import db
 from app.models import Project, ProjectStatus
+from app.services import project_service
 
 
 # ============================================================================
@@ -56,6 +57,52 @@ def create_project(app):
     return _create_project
 
 
+# ============================================================================
+# Request Parsing Tests
+# ============================================================================
+
+class TestParseDate:
+    """Tests for the parse_date request helper."""
+
+    def test_parses_iso_date(self):
+        """Parses YYYY-MM-DD strings."""
+        from app.routes._utils import parse_date
+        assert parse_date('2026-01-15') == date(2026, 1, 15)
+
+    @pytest.mark.parametrize('value', [
+        None, '', '2026-02-30', '20260115', '2026-W03-4',
+        '2026- 1-05', '+026-01-05', '2026-01-0\u0665', 20260115,
+    ])
+    def test_rejects_other_values(self, value):
+        """Returns None for anything but a valid YYYY-MM-DD date string."""
+        from app.routes._utils import parse_date
+        assert parse_date(value) is None
+
+
+class TestParseBoolAndInt:
+    """Tests for the parse_bool and parse_int request helpers."""
+
+    @pytest.mark.parametrize('value', ['true', 'TRUE', '1', 'yes', 'on', 'Y', 't'])
+    def test_truthy_values(self, value):
+        """Recognized truthy strings parse as True, ignoring case."""
+        from app.routes._utils import parse_bool
+        assert parse_bool(value) is True
+
+    def test_bool_missing_and_other_values(self):
+        """Missing values use the default; anything else is False."""
+        from app.routes._utils import parse_bool
+        assert parse_bool(None, True) is True
+        assert parse_bool('false', True) is False
+        assert parse_bool('maybe') is False
+
+    def test_parse_int(self):
+        """Parses integers, falling back to the default."""
+        from app.routes._utils import parse_int
+        assert parse_int('12', 1) == 12
+        assert parse_int('', 1) == 1
+        assert parse_int('twelve', 1) == 1
+
+
 # ============================================================================
 # GET /projects Tests
 # ============================================================================
@@ -84,6 +131,43 @@ class TestGetProjects:
         assert 'Project 1' in names
         assert 'Project 2' in names
 
+    def test_get_projects_streams_large_lists(self, client, app):
+        """Lists longer than one streamed batch are returned intact."""
+        with app.app_context():
+            db.session.execute(db.insert(Project), [
+                {
+                    'project_name': f'Project {i:03d}',
+                    'department': 'Public Works',
+                    'date_to_client': date(2026, 1, 1),
+                    'date_assigned_to_us': date(2026, 1, 5),
+                    'assigned_attorney': 'John Smith',
+                    'qcp_attorney': 'Jane Doe',
+                }
+                for i in range(205)
+            ])
+            db.session.commit()
+
+        response = client.get('/projects?sort_by=project_name')
+        assert response.status_code == 200
+        assert response.is_streamed
+        data = response.get_json()
+        assert data['count'] == 205
+        assert [p['project_name'] for p in data['data']] == [
+            f'Project {i:03d}' for i in range(205)
+        ]
+
+    def test_get_projects_does_not_load_full_list(self, client, create_project, monkeypatch):
+        """Projects are streamed from iter_projects, not loaded as one list."""
+        create_project(project_name='Streamed')
+
+        def fail(*args, **kwargs):
+            raise AssertionError('get_all_projects should not be called')
+
+        monkeypatch.setattr(project_service, 'get_all_projects', fail)
+        data = client.get('/projects').get_json()
+        assert data['count'] == 1
+        assert data['data'][0]['project_name'] == 'Streamed'
+
     def test_get_projects_filter_by_status(self, client, create_project):
         """Filters projects by status."""
         create_project(project_name='In Progress', status=ProjectStatus.IN_PROGRESS)
@@ -95,11 +179,13 @@ class TestGetProjects:
         assert data['count'] == 1
         assert data['data'][0]['project_name'] == 'Under Review'
 
-    def test_get_projects_filter_multiple_status(self, client, create_project):
+    def test_get_projects_filter_multiple_status(self, client, create_projects):
         """Filters by comma-separated statuses."""
-        create_project(project_name='In Progress', status=ProjectStatus.IN_PROGRESS)
-        create_project(project_name='Under Review', status=ProjectStatus.UNDER_REVIEW)
-        create_project(project_name='On Hold', status=ProjectStatus.ON_HOLD)
+        create_projects([
+            {'project_name': 'In Progress', 'status': ProjectStatus.IN_PROGRESS},
+            {'project_name': 'Under Review', 'status': ProjectStatus.UNDER_REVIEW},
+            {'project_name': 'On Hold', 'status': ProjectStatus.ON_HOLD},
+        ])
 
         response = client.get('/projects?status=In+Progress,Under+Review&include_completed=true')
         assert response.status_code == 200
@@ -131,6 +217,15 @@ class TestGetProjects:
         data = response.get_json()
         assert data['count'] == 2
 
+    def test_get_projects_include_completed_checkbox_value(self, client, create_project):
+        """Accepts the 'on' value submitted by HTML checkboxes."""
+        create_project(project_name='Active', status=ProjectStatus.IN_PROGRESS)
+        create_project(project_name='Completed', status=ProjectStatus.COMPLETED)
+
+        response = client.get('/projects?include_completed=on')
+        assert response.status_code == 200
+        assert response.get_json()['count'] == 2
+
     def test_get_projects_sorting_asc(self, client, create_project):
         """Sorts projects ascending."""
         create_project(project_name='Z Project', delivery_deadline=date(2026, 3, 1))
@@ -193,11 +288,13 @@ class TestGetProjects:
         assert data['count'] == 1
         assert data['data'][0]['project_name'] == 'Active'
 
-    def test_get_projects_date_range_filter(self, client, create_project):
+    def test_get_projects_date_range_filter(self, client, create_projects):
         """Filters by delivery deadline date range."""
-        create_project(project_name='Early', delivery_deadline=date(2026, 1, 10))
-        create_project(project_name='Middle', delivery_deadline=date(2026, 1, 20))
-        create_project(project_name='Late', delivery_deadline=date(2026, 1, 30))
+        create_projects([
+            {'project_name': 'Early', 'delivery_deadline': date(2026, 1, 10)},
+            {'project_name': 'Middle', 'delivery_deadline': date(2026, 1, 20)},
+            {'project_name': 'Late', 'delivery_deadline': date(2026, 1, 30)},
+        ])
 
         response = client.get(
             '/projects?delivery_deadline_from=2026-01-15&delivery_deadline_to=2026-01-25'
@@ -207,6 +304,15 @@ class TestGetProjects:
         assert data['count'] == 1
         assert data['data'][0]['project_name'] == 'Middle'
 
+    def test_get_projects_ignores_non_extended_dates(self, client, create_project):
+        """Compact ISO dates are not accepted as date filters."""
+        create_project(project_name='Early', delivery_deadline=date(2026, 1, 10))
+        create_project(project_name='Late', delivery_deadline=date(2026, 1, 30))
+
+        response = client.get('/projects?delivery_deadline_from=20260115')
+        assert response.status_code == 200
+        assert response.get_json()['count'] == 2
+
 
 # ============================================================================
 # GET /projects/<id> Tests
@@ -310,6 +416,79 @@ class TestCreateProject:
         # Flask returns 415 when no content-type is set
         assert response.status_code in (400, 415)
 
+    def test_create_project_invalid_date(self, client, sample_project_json):
+        """Returns 400 naming the field for a malformed date."""
+        sample_project_json['delivery_deadline'] = '01/25/2026'
+        response = client.post(
+            '/projects',
+            data=json.dumps(sample_project_json),
+            content_type='application/json'
+        )
+        assert response.status_code == 400
+        assert 'delivery_deadline' in response.get_json()['error']
+        assert client.get('/projects').get_json()['count'] == 0
+
+
+# ============================================================================
+# POST /projects/bulk Tests
+# ============================================================================
+
+class TestBulkCreateProjects:
+    """Tests for POST /projects/bulk endpoint."""
+
+    def test_bulk_create_projects(self, client, sample_project_json):
+        """Creates every row and returns their IDs in order."""
+        rows = [
+            dict(sample_project_json, project_name='First'),
+            dict(sample_project_json, project_name='Second'),
+        ]
+        response = client.post(
+            '/projects/bulk',
+            data=json.dumps(rows),
+            content_type='application/json'
+        )
+        assert response.status_code == 201
+        data = response.get_json()
+        assert data['count'] == 2
+
+        first = client.get(f"/projects/{data['data'][0]}").get_json()['data']
+        assert first['project_name'] == 'First'
+        assert first['delivery_deadline'] == '2026-01-25'
+
+    def test_bulk_create_invalid_row_creates_nothing(self, client, sample_project_json):
+        """Returns 400 naming the bad row and creates no projects."""
+        rows = [sample_project_json, {'project_name': 'Incomplete'}]
+        response = client.post(
+            '/projects/bulk',
+            data=json.dumps(rows),
+            content_type='application/json'
+        )
+        assert response.status_code == 400
+        assert 'Row 1' in response.get_json()['error']
+        assert client.get('/projects').get_json()['count'] == 0
+
+    def test_bulk_create_invalid_date_names_row(self, client, sample_project_json):
+        """Returns 400 naming the row and field for a malformed date."""
+        rows = [sample_project_json, dict(sample_project_json, date_to_client='soon')]
+        response = client.post(
+            '/projects/bulk',
+            data=json.dumps(rows),
+            content_type='application/json'
+        )
+        assert response.status_code == 400
+        error = response.get_json()['error']
+        assert 'Row 1' in error
+        assert 'date_to_client' in error
+
+    def test_bulk_create_requires_array(self, client, sample_project_json):
+        """Returns 400 when the body is not a JSON array."""
+        response = client.post(
+            '/projects/bulk',
+            data=json.dumps(sample_project_json),
+            content_type='application/json'
+        )
+        assert response.status_code == 400
+
 
 # ============================================================================
 # PUT /projects/<id> Tests
@@ -340,6 +519,15 @@ class TestUpdateProject:
         )
         assert response.status_code == 404
 
+    def test_update_project_not_found_with_invalid_status(self, client):
+        """Returns 404, not 400, when a missing project gets an invalid status."""
+        response = client.put(
+            '/projects/99999',
+            data=json.dumps({'status': 'Bogus'}),
+            content_type='application/json'
+        )
+        assert response.status_code == 404
+
     def test_update_project_invalid_status(self, client, create_project):
         """Returns 400 for invalid status."""
         project_id = create_project()
@@ -353,6 +541,20 @@ class TestUpdateProject:
         data = response.get_json()
         assert 'Invalid status' in data['error']
 
+    def test_update_project_invalid_date(self, client, create_project):
+        """Returns 400 for a malformed date and leaves the project unchanged."""
+        project_id = create_project(project_name='Unchanged')
+
+        response = client.put(
+            f'/projects/{project_id}',
+            data=json.dumps({'project_name': 'Changed', 'internal_deadline': '2026-13-01'}),
+            content_type='application/json'
+        )
+        assert response.status_code == 400
+        assert 'internal_deadline' in response.get_json()['error']
+        data = client.get(f'/projects/{project_id}').get_json()['data']
+        assert data['project_name'] == 'Unchanged'
+
     def test_update_project_status(self, client, create_project):
         """Updates project status."""
         project_id = create_project(status=ProjectStatus.IN_PROGRESS)
@@ -483,11 +685,13 @@ class TestAppendNote:
 class TestAutocomplete:
     """Tests for GET /api/autocomplete/<field> endpoint."""
 
-    def test_autocomplete_department(self, client, create_project):
+    def test_autocomplete_department(self, client, create_projects):
         """Returns distinct department values."""
-        create_project(department='Public Works')
-        create_project(department='Human Resources')
-        create_project(department='Public Works')  # Duplicate
+        create_projects([
+            {'department': 'Public Works'},
+            {'department': 'Human Resources'},
+            {'department': 'Public Works'},  # Duplicate
+        ])
 
         response = client.get('/api/autocomplete/department')
         assert response.status_code == 200
@@ -534,6 +738,24 @@ class TestAutocomplete:
         data = response.get_json()
         assert 'error' in data
 
+    def test_autocomplete_invalid_field_skips_service(self, client, monkeypatch):
+        """Unknown fields are rejected without calling the service."""
+        from app.services import project_service
+
+        def fail(*args, **kwargs):
+            raise AssertionError('service should not be called')
+
+        monkeypatch.setattr(project_service, 'get_distinct_values', fail)
+        monkeypatch.setattr(project_service, 'get_distinct_values_bulk', fail)
+
+        response = client.get('/api/autocomplete/notes')
+        assert response.status_code == 400
+        assert 'Invalid field: notes' in response.get_json()['error']
+
+        response = client.get('/api/autocomplete?fields=department,notes')
+        assert response.status_code == 400
+        assert 'Invalid field: notes' in response.get_json()['error']
+
     def test_autocomplete_empty_database(self, client):
         """Returns empty list when no data."""
         response = client.get('/api/autocomplete/department')
@@ -559,6 +781,89 @@ class TestAutocomplete:
         assert 'Active Dept' in data['data']
         assert 'Deleted Dept' not in data['data']
 
+    def test_autocomplete_not_modified(self, client, create_project):
+        """Returns 304 when the client's ETag still matches."""
+        create_project(department='Finance')
+        first = client.get('/api/autocomplete/department')
+        assert first.headers['ETag']
+        assert 'no-cache' in first.headers['Cache-Control']
+
+        response = client.get(
+            '/api/autocomplete/department',
+            headers={'If-None-Match': first.headers['ETag']}
+        )
+        assert response.status_code == 304
+        assert response.data == b''
+
+    def test_autocomplete_etag_changes_with_values(self, client, create_project):
+        """A new value produces a new ETag and a full response."""
+        create_project(department='Finance')
+        etag = client.get('/api/autocomplete/department').headers['ETag']
+        create_project(department='Planning')
+
+        response = client.get(
+            '/api/autocomplete/department', headers={'If-None-Match': etag}
+        )
+        assert response.status_code == 200
+        assert 'Planning' in response.get_json()['data']
+
+
+# ============================================================================
+# GET /api/autocomplete Tests
+# ============================================================================
+
+class TestAutocompleteBulk:
+    """Tests for GET /api/autocomplete endpoint."""
+
+    def test_returns_each_requested_field(self, client, create_project):
+        """Returns distinct values keyed by field."""
+        create_project(department='Finance', assigned_attorney='Smith', qcp_attorney='Jones')
+        create_project(department='Planning', assigned_attorney='Smith', qcp_attorney='Lee')
+
+        response = client.get(
+            '/api/autocomplete?fields=department,assigned_attorney,qcp_attorney'
+        )
+        assert response.status_code == 200
+        assert response.get_json() == {
+            'department': ['Finance', 'Planning'],
+            'assigned_attorney': ['Smith'],
+            'qcp_attorney': ['Jones', 'Lee'],
+        }
+
+    def test_repeated_and_duplicate_fields(self, client, create_project):
+        """Accepts repeated parameters and ignores duplicates."""
+        create_project(department='Finance')
+
+        response = client.get(
+            '/api/autocomplete?fields=department&fields=department, status'
+        )
+        assert response.status_code == 200
+        assert response.get_json() == {
+            'department': ['Finance'],
+            'status': [ProjectStatus.IN_PROGRESS],
+        }
+
+    def test_missing_fields(self, client):
+        """Returns 400 when no fields are requested."""
+        response = client.get('/api/autocomplete')
+        assert response.status_code == 400
+        assert 'error' in response.get_json()
+
+    def test_invalid_field(self, client):
+        """Returns 400 when any field is invalid."""
+        response = client.get('/api/autocomplete?fields=department,notes')
+        assert response.status_code == 400
+        assert 'error' in response.get_json()
+
+    def test_not_modified(self, client, create_project):
+        """Returns 304 when the client's ETag still matches."""
+        create_project(department='Finance')
+        url = '/api/autocomplete?fields=department,qcp_attorney'
+        etag = client.get(url).headers['ETag']
+
+        response = client.get(url, headers={'If-None-Match': etag})
+        assert response.status_code == 304
+
 
 # ============================================================================
 # Dashboard Route Tests
@@ -662,6 +967,30 @@ class TestDashboardRoute:
         assert data['overdue']['data'][0]['project_name'] == 'Overdue Project'
         assert data['due_this_week']['count'] == 0
 
+    def test_dashboard_api_dates_are_iso_strings(self, client, create_project):
+        """API serializes dates and timestamps as ISO-8601 strings."""
+        yesterday = date.today() - timedelta(days=1)
+        create_project(project_name='ISO Dates', delivery_deadline=yesterday)
+
+        response = client.get('/api/dashboard')
+        project = response.get_json()['overdue']['data'][0]
+
+        assert project['delivery_deadline'] == yesterday.isoformat()
+        assert project['date_to_client'] == '2026-01-01'
+        assert project['internal_deadline'] is None
+        assert 'T' in project['created_at']
+
+    def test_dashboard_marks_overdue_cards(self, client, create_project):
+        """Dashboard HTML flags overdue project cards."""
+        yesterday = date.today() - timedelta(days=1)
+        create_project(project_name='Late Project', delivery_deadline=yesterday)
+
+        response = client.get('/dashboard')
+        html = response.data.decode('utf-8')
+
+        assert 'card-overdue' in html
+        assert f'Due: {yesterday.isoformat()}' in html
+
     def test_dashboard_api_categorizes_due_this_week(self, client, create_project):
         """API correctly identifies projects due this week."""
         in_three_days = date.today() + timedelta(days=3)
@@ -711,18 +1040,23 @@ class TestDashboardRoute:
         assert data['due_this_week']['count'] == 0
         assert data['longer_deadline']['count'] == 0
 
-    def test_dashboard_api_with_mixed_projects(self, client, create_project):
+    def test_dashboard_api_with_mixed_projects(self, client, create_projects):
         """API correctly categorizes multiple projects."""
         yesterday = date.today() - timedelta(days=1)
         in_three_days = date.today() + timedelta(days=3)
         in_ten_days = date.today() + timedelta(days=10)
 
-        create_project(project_name='Overdue', delivery_deadline=yesterday)
-        create_project(project_name='Due Soon 1', delivery_deadline=in_three_days)
-        create_project(project_name='Due Soon 2', delivery_deadline=in_three_days)
-        create_project(project_name='Future', delivery_deadline=in_ten_days)
-        create_project(project_name='Done', delivery_deadline=in_three_days,
-                      status=ProjectStatus.COMPLETED)
+        create_projects([
+            {'project_name': 'Overdue', 'delivery_deadline': yesterday},
+            {'project_name': 'Due Soon 1', 'delivery_deadline': in_three_days},
+            {'project_name': 'Due Soon 2', 'delivery_deadline': in_three_days},
+            {'project_name': 'Future', 'delivery_deadline': in_ten_days},
+            {
+                'project_name': 'Done',
+                'delivery_deadline': in_three_days,
+                'status': ProjectStatus.COMPLETED,
+            },
+        ])
 
         response = client.get('/api/dashboard')
         data = response.get_json()
@@ -732,6 +1066,59 @@ class TestDashboardRoute:
         assert data['longer_deadline']['count'] == 1
         assert data['recently_completed']['count'] == 1
 
+    def test_dashboard_api_is_one_query(self, client, create_project, sql_statements):
+        """All four sections are fetched in a single SELECT."""
+        create_project(project_name='Overdue', delivery_deadline=date.today() - timedelta(days=1))
+        create_project(project_name='Done', status=ProjectStatus.COMPLETED)
+
+        with sql_statements() as statements:
+            response = client.get('/api/dashboard')
+
+        assert response.status_code == 200
+        assert len(statements) == 1
+        assert statements[0].lstrip().upper().startswith('SELECT')
+
+    def test_dashboard_api_not_modified(self, client, create_project):
+        """Returns 304 when the client's ETag still matches."""
+        create_project(project_name='Overdue', delivery_deadline=date.today() - timedelta(days=1))
+        first = client.get('/api/dashboard')
+        assert first.headers['ETag']
+        assert 'no-cache' in first.headers['Cache-Control']
+
+        response = client.get('/api/dashboard', headers={'If-None-Match': first.headers['ETag']})
+        assert response.status_code == 304
+        assert response.data == b''
+
+    def test_dashboard_data_reused_between_requests(self, client, create_project, sql_statements):
+        """A repeat request within the TTL runs no queries."""
+        create_project(project_name='Overdue', delivery_deadline=date.today() - timedelta(days=1))
+        first = client.get('/api/dashboard')
+
+        with sql_statements() as statements:
+            second = client.get('/api/dashboard')
+
+        assert statements == []
+        assert second.get_json() == first.get_json()
+
+    def test_dashboard_data_refreshed_after_write(self, client, create_project):
+        """A project write is reflected on the next request despite the cache."""
+        etag = client.get('/api/dashboard').headers['ETag']
+        create_project(project_name='Overdue', delivery_deadline=date.today() - timedelta(days=1))
+
+        response = client.get('/api/dashboard', headers={'If-None-Match': etag})
+        assert response.status_code == 200
+        assert response.get_json()['overdue']['count'] == 1
+
+    def test_dashboard_cache_disabled(self, app, client, create_project, sql_statements):
+        """DASHBOARD_CACHE_TTL = 0 queries on every request."""
+        app.config['DASHBOARD_CACHE_TTL'] = 0
+        client.get('/api/dashboard')
+
+        with sql_statements() as statements:
+            client.get('/api/dashboard')
+
+        assert len(statements) == 1
+
 
 # ============================================================================
 # GET /projects Search Tests
@@ -933,6 +1320,16 @@ class TestProjectsHtmlRoutes:
         assert '<!DOCTYPE' not in html
         assert '<head>' not in html
 
+    def test_projects_table_rows_reuses_template(self, client, app, create_project):
+        """The rows template is resolved once and reused across requests."""
+        create_project(project_name='First Render')
+        client.get('/projects/table_rows')
+        template = app.extensions['project_table_rows_template']
+
+        response = client.get('/projects/table_rows')
+        assert 'First Render' in response.data.decode('utf-8')
+        assert app.extensions['project_table_rows_template'] is template
+
     def test_projects_table_rows_with_search(self, client, create_project):
         """Projects table rows filters with search."""
         create_project(project_name='Municipal Review')
@@ -951,6 +1348,62 @@ class TestProjectsHtmlRoutes:
 
         assert 'No projects found' in html
 
+    def test_projects_table_rows_results_count(self, client, create_project):
+        """The out-of-band results count matches the rows rendered."""
+        create_project(project_name='First')
+        create_project(project_name='Second')
+
+        html = client.get('/projects/table_rows').data.decode('utf-8')
+
+        assert html.count('class="project-row"') == 2
+        assert '<span class="results-count">2</span> projects' in html
+
+    def test_projects_table_rows_serves_cached_fragment(self, client, app, create_project):
+        """Repeated identical filters reuse the rendered fragment."""
+        create_project(project_name='Cached Project')
+        first = client.get('/projects/table_rows?search=Cached&sort_by=project_name')
+
+        # Change the row behind the ORM's back; the cached HTML is served
+        db.session.execute(
+            db.update(Project).values(project_name='Renamed Project')
+        )
+        second = client.get('/projects/table_rows?sort_by=project_name&search=Cached')
+
+        assert second.data == first.data
+        assert len(app.extensions['project_table_rows_cache']) == 1
+
+    def test_projects_table_rows_cache_cleared_by_writes(self, client, create_project):
+        """A project written through the app is visible on the next request."""
+        create_project(project_name='Before Write')
+        client.get('/projects/table_rows')
+
+        client.post('/projects', json={
+            'project_name': 'After Write',
+            'department': 'Finance',
+            'date_to_client': '2026-01-05',
+            'date_assigned_to_us': '2026-01-05',
+            'assigned_attorney': 'Smith',
+            'qcp_attorney': 'Jones',
+        })
+        html = client.get('/projects/table_rows').data.decode('utf-8')
+
+        assert 'After Write' in html
+
+    def test_projects_table_rows_cache_disabled(self, client, app, create_project):
+        """A TTL of 0 renders every request."""
+        app.config['TABLE_ROWS_CACHE_TTL'] = 0
+        project_id = create_project(project_name='Original Name')
+        client.get('/projects/table_rows')
+
+        db.session.execute(
+            db.update(Project).where(Project.id == project_id)
+            .values(project_name='Updated Name')
+        )
+        html = client.get('/projects/table_rows').data.decode('utf-8')
+
+        assert 'Updated Name' in html
+        assert 'project_table_rows_cache' not in app.extensions
+
     def test_projects_page_excludes_completed_by_default(self, client, create_project):
         """Projects page excludes completed by default."""
         create_project(project_name='Active Project', status=ProjectStatus.IN_PROGRESS)
@@ -1102,6 +1555,24 @@ class TestProjectDetailRoutes:
             assert 'This is a test note' in updated.notes
             assert ']: ' in updated.notes  # Timestamp format
 
+    def test_update_project_form_invalid_date(self, client, app, create_project):
+        """Update project form rejects a bad date and leaves the project unchanged."""
+        project_id = create_project(project_name='Original Name')
+
+        response = client.post(f'/projects/{project_id}/update', data={
+            'project_name': 'Updated Name',
+            'department': 'Public Works',
+            'assigned_attorney': 'John Smith',
+            'qcp_attorney': 'Jane Doe',
+            'date_to_client': '2026-01-01',
+            'date_assigned_to_us': 'yesterday',
+            'status': 'In Progress'
+        }, follow_redirects=True)
+
+        assert 'Invalid date format for Date Assigned To Us' in response.data.decode('utf-8')
+        with app.app_context():
+            assert db.session.get(Project, project_id).project_name == 'Original Name'
+
     def test_update_project_form_not_found_redirects(self, client):
         """Update project form redirects to projects page if not found."""
         response = client.post('/projects/99999/update', data={
@@ -1132,6 +1603,15 @@ class TestProjectDetailRoutes:
         assert 'clone_from=' in response.location
         assert 'Copy+of+Clone+Source' in response.location or 'Copy%20of%20Clone%20Source' in response.location
 
+    def test_clone_project_omits_empty_fields(self, client, create_project):
+        """Clone redirect leaves out fields the source project has no value for."""
+        project_id = create_project(project_name='No Group', department='R&D')
+        response = client.get(f'/projects/{project_id}/clone')
+
+        assert response.status_code == 302
+        assert 'project_group' not in response.location
+        assert 'department=R%26D' in response.location
+
     def test_clone_project_not_found_redirects(self, client):
         """Clone project redirects to projects page if not found."""
         response = client.get('/projects/99999/clone')
@@ -1186,14 +1666,14 @@ class TestNewProjectForm:
         assert 'Create Project' in html
         assert 'project_name' in html
 
-    def test_new_project_form_has_default_date(self, client):
-        """New project form defaults date_assigned_to_us to today."""
+    def test_new_project_form_has_default_date(self, client, monkeypatch):
+        """New project form defaults date_assigned_to_us to today (UTC)."""
+        monkeypatch.setattr(project_service, 'current_date', lambda: date(2026, 3, 4))
         response = client.get('/projects/new')
         assert response.status_code == 200
         html = response.data.decode('utf-8')
         # The today variable is passed to the template
-        today_str = date.today().strftime('%Y-%m-%d')
-        assert today_str in html
+        assert 'value="2026-03-04"' in html
 
     def test_new_project_form_clone_prefill(self, client, create_project):
         """New project form shows prefilled data when cloning."""
@@ -1313,3 +1793,18 @@ class TestNewProjectForm:
             assert project is not None
             assert project.internal_deadline == date(2026, 1, 15)
             assert project.delivery_deadline == date(2026, 1, 20)
+
+
+# ============================================================================
+# Health Check Tests
+# ============================================================================
+
+class TestHealthCheck:
+    """Tests for the /health endpoint."""
+
+    def test_health_check(self, client):
+        """Returns healthy status as JSON."""
+        response = client.get('/health')
+        assert response.status_code == 200
+        assert response.mimetype == 'application/json'
+        assert response.get_json() == {'status': 'healthy'}
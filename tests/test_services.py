@@ -8,18 +8,25 @@ from datetime import date, datetime, timedelta, timezone
 
 from app import db
 from app.models import Project, ProjectStatus
+from app.services import project_service
 from app.services import (
     create_project,
+    bulk_create_projects,
     get_project,
+    get_project_fields,
     get_all_projects,
+    iter_project_rows,
     update_project,
     delete_project,
     append_note,
     get_distinct_values,
+    get_distinct_values_bulk,
     get_overdue_projects,
     get_due_this_week,
     get_longer_deadline,
     get_recently_completed,
+    get_dashboard_buckets,
+    current_date,
 )
 
 
@@ -99,6 +106,63 @@ class TestCreateProject:
             assert project2.qcp_attorney == 'Jane Doe'
 
 
+class TestBulkCreateProjects:
+    """Tests for bulk_create_projects function."""
+
+    def _row(self, **kwargs):
+        """Build a valid project row, overridden by kwargs."""
+        row = {
+            'project_name': 'Bulk Project',
+            'department': 'Finance',
+            'date_to_client': date(2026, 1, 1),
+            'date_assigned_to_us': date(2026, 1, 5),
+            'assigned_attorney': 'John Smith',
+            'qcp_attorney': 'Jane Doe',
+        }
+        row.update(kwargs)
+        return row
+
+    def test_bulk_create_returns_ids_in_order(self, app):
+        """Created IDs line up with the input rows."""
+        with app.app_context():
+            ids = bulk_create_projects([
+                self._row(project_name='A'),
+                self._row(project_name='B', notes='Has notes'),
+                self._row(project_name='C'),
+            ])
+
+            assert [get_project(i).project_name for i in ids] == ['A', 'B', 'C']
+            assert get_project(ids[1]).notes == 'Has notes'
+            assert get_project(ids[0]).status == ProjectStatus.IN_PROGRESS
+            assert get_project(ids[0]).created_at is not None
+
+    def test_bulk_create_normalizes_within_batch(self, app):
+        """Rows match existing values and values earlier in the batch."""
+        with app.app_context():
+            create_project(self._row(department='Public Works'))
+            ids = bulk_create_projects([
+                self._row(department='public works', assigned_attorney='New Person'),
+                self._row(assigned_attorney='NEW PERSON'),
+            ])
+
+            assert get_project(ids[0]).department == 'Public Works'
+            assert get_project(ids[1]).assigned_attorney == 'New Person'
+            assert get_distinct_values('assigned_attorney') == ['John Smith', 'New Person']
+
+    def test_bulk_create_invalid_row_raises(self, app):
+        """An invalid row aborts the whole batch."""
+        with app.app_context():
+            with pytest.raises(ValueError) as excinfo:
+                bulk_create_projects([self._row(), self._row(status='Bogus')])
+            assert 'Row 1' in str(excinfo.value)
+            assert get_all_projects() == []
+
+    def test_bulk_create_empty(self, app):
+        """An empty batch creates nothing."""
+        with app.app_context():
+            assert bulk_create_projects([]) == []
+
+
 class TestGetProject:
     """Tests for get_project function."""
 
@@ -128,6 +192,87 @@ class TestGetProject:
             assert project is None
 
 
+class TestGetProjectFields:
+    """Tests for get_project_fields function."""
+
+    def test_get_project_fields(self, app, sample_project_data):
+        """Returns only the requested columns."""
+        with app.app_context():
+            created = create_project(sample_project_data)
+            result = get_project_fields(created.id, ['project_name', 'department'])
+
+            assert result == {
+                'project_name': sample_project_data['project_name'],
+                'department': sample_project_data['department'],
+            }
+
+    def test_get_project_fields_excludes_deleted(self, app, sample_project_data):
+        """Soft-deleted and missing projects return None."""
+        with app.app_context():
+            created = create_project(sample_project_data)
+            delete_project(created.id)
+
+            assert get_project_fields(created.id, ['project_name']) is None
+            assert get_project_fields(99999, ['project_name']) is None
+
+    def test_get_project_fields_invalid_field(self, app):
+        """Unknown field names raise ValueError."""
+        with app.app_context():
+            with pytest.raises(ValueError):
+                get_project_fields(1, ['project_name', 'nope'])
+
+
+class TestIterProjectRows:
+    """Tests for iter_project_rows function."""
+
+    def test_yields_selected_columns_in_sort_order(self, app, sample_project_data):
+        """Rows hold only the requested columns and follow the filter sort."""
+        with app.app_context():
+            create_project(dict(sample_project_data, project_name='Beta'))
+            create_project(dict(sample_project_data, project_name='Alpha'))
+
+            rows = list(iter_project_rows(
+                {'sort_by': 'project_name'}, ['project_name', 'department']
+            ))
+
+            assert [tuple(row) for row in rows] == [
+                ('Alpha', sample_project_data['department']),
+                ('Beta', sample_project_data['department']),
+            ]
+            assert rows[0].project_name == 'Alpha'
+
+    def test_applies_filters(self, app, sample_project_data):
+        """Soft-deleted projects are excluded by default."""
+        with app.app_context():
+            kept = create_project(sample_project_data)
+            removed = create_project(sample_project_data)
+            delete_project(removed.id)
+
+            assert [row.id for row in iter_project_rows(columns=['id'])] == [kept.id]
+
+    def test_invalid_column(self, app):
+        """Unknown column names raise ValueError."""
+        with app.app_context():
+            with pytest.raises(ValueError):
+                list(iter_project_rows(columns=['id', 'to_dict']))
+
+    def test_max_lengths_cut_values_in_sql(self, app, sample_project_data):
+        """max_lengths caps text columns; short and NULL values are unchanged."""
+        with app.app_context():
+            create_project(dict(sample_project_data, project_name='Long', notes='x' * 50))
+            create_project(dict(sample_project_data, project_name='Short', notes='short'))
+            create_project(dict(sample_project_data, project_name='Empty', notes=None))
+
+            rows = iter_project_rows(
+                {'sort_by': 'project_name'},
+                columns=['project_name', 'notes'],
+                max_lengths={'notes': 10},
+            )
+            assert [tuple(row) for row in rows] == [
+                ('Empty', None), ('Long', 'x' * 10), ('Short', 'short'),
+            ]
+
+
 class TestGetAllProjects:
     """Tests for get_all_projects function."""
 
@@ -202,6 +347,48 @@ class TestGetAllProjects:
 class TestGetAllProjectsFiltering:
     """Tests for filtering in get_all_projects."""
 
+    @pytest.mark.parametrize('field', ['department', 'assigned_attorney', 'qcp_attorney'])
+    def test_text_filter_uses_lower_index(self, app, field):
+        """Case-insensitive filters are answered from the lower() indexes."""
+        with app.app_context():
+            query = project_service._filtered_query({field: 'Some Value'})
+            sql = str(query.statement.compile(
+                db.engine, compile_kwargs={'literal_binds': True}
+            ))
+            plan = db.session.execute(db.text(f'EXPLAIN QUERY PLAN {sql}')).all()
+            details = ' '.join(row[-1] for row in plan)
+            assert f'USING INDEX ix_projects_{field}_lower' in details
+
+    @pytest.mark.parametrize('sort_by, index', [
+        ('delivery_deadline', 'ix_projects_active_delivery'),
+        ('updated_at', 'ix_projects_updated_at'),
+    ])
+    def test_default_list_scans_partial_index_in_order(self, app, sort_by, index):
+        """Live projects are read in sort order from a partial index, without a sort step."""
+        with app.app_context():
+            query = project_service._filtered_query({'sort_by': sort_by})
+            sql = str(query.statement.compile(
+                db.engine, compile_kwargs={'literal_binds': True}
+            ))
+            plan = db.session.execute(db.text(f'EXPLAIN QUERY PLAN {sql}')).all()
+            details = ' '.join(row[-1] for row in plan)
+            assert f'SCAN projects USING INDEX {index}' in details
+            assert 'TEMP B-TREE' not in details
+
+    def test_department_and_status_filter_seek_one_index(self, app):
+        """Department plus status filters are both answered by one index seek."""
+        with app.app_context():
+            query = project_service._filtered_query({
+                'department': 'Public Works',
+                'status': 'In Progress,Under Review',
+            })
+            sql = str(query.statement.compile(
+                db.engine, compile_kwargs={'literal_binds': True}
+            ))
+            plan = db.session.execute(db.text(f'EXPLAIN QUERY PLAN {sql}')).all()
+            details = ' '.join(row[-1] for row in plan)
+            assert 'USING INDEX ix_projects_department_lower_status (<expr>=? AND status=?)' in details
+
     def test_filter_by_single_status(self, app):
         """Filter by single status value."""
         with app.app_context():
@@ -562,6 +749,23 @@ class TestUpdateProject:
             result = update_project(99999, {'project_name': 'New Name'})
             assert result is None
 
+    def test_update_project_not_found_before_invalid_status(self, app):
+        """A missing project returns None even when the status is invalid."""
+        with app.app_context():
+            assert update_project(99999, {'status': 'Bogus'}) is None
+
+    def test_update_project_not_found_keeps_pending_changes(self, app, sample_project_data):
+        """Missing a project does not roll back the caller's session."""
+        with app.app_context():
+            project = Project(**sample_project_data)
+            db.session.add(project)
+            db.session.flush()
+
+            assert update_project(99999, {'project_name': 'New Name'}) is None
+            assert project in db.session
+            db.session.commit()
+            assert get_project(project.id) is not None
+
     def test_update_project_cannot_update_deleted(self, app, sample_project_data):
         """Cannot update soft-deleted project."""
         with app.app_context():
@@ -571,6 +775,32 @@ class TestUpdateProject:
             result = update_project(created.id, {'project_name': 'New Name'})
             assert result is None
 
+    def test_update_project_is_one_statement(self, app, sample_project_data, sql_statements):
+        """A plain update is a single UPDATE ... RETURNING, with no SELECT first."""
+        with app.app_context():
+            project_id = create_project(sample_project_data).id
+            with sql_statements() as statements:
+                result = update_project(project_id, {'project_name': 'Renamed'})
+                assert result.project_name == 'Renamed'
+
+            assert len(statements) == 1
+            assert statements[0].lstrip().upper().startswith('UPDATE')
+            assert result.project_name == 'Renamed'
+
+    def test_update_project_ignores_protected_fields(self, app, sample_project_data):
+        """id, created_at and deleted_at cannot be set through update_project."""
+        with app.app_context():
+            created = create_project(sample_project_data)
+            result = update_project(created.id, {
+                'id': 999,
+                'deleted_at': datetime.now(timezone.utc),
+                'project_name': 'Renamed',
+            })
+
+            assert result.id == created.id
+            assert result.deleted_at is None
+            assert result.project_name == 'Renamed'
+
 
 class TestDeleteProject:
     """Tests for delete_project function."""
@@ -662,6 +892,90 @@ class TestAppendNote:
             result = append_note(99999, 'Note')
             assert result is None
 
+    def test_append_note_to_blank_notes(self, app, sample_project_data):
+        """An empty-string notes field gets no leading newline."""
+        with app.app_context():
+            sample_project_data['notes'] = ''
+            created = create_project(sample_project_data)
+            result = append_note(created.id, 'First note')
+
+            assert result.notes.startswith('[')
+            assert '\n' not in result.notes
+
+    def test_append_note_keeps_rows_written_elsewhere(self, app, sample_project_data):
+        """Notes are appended in SQL, not from the session's stale copy."""
+        with app.app_context():
+            sample_project_data['notes'] = None
+            created = create_project(sample_project_data)
+            assert created.notes is None
+
+            # Another writer appends a note behind this session's back
+            db.session.execute(
+                db.update(Project).values(notes='[2026-01-01 09:00]: Other writer')
+            )
+            db.session.commit()
+            result = append_note(created.id, 'Mine')
+
+            assert result.notes.startswith('[2026-01-01 09:00]: Other writer\n[')
+            assert result.notes.endswith(']: Mine')
+
+    def test_append_note_deleted_project(self, app, sample_project_data):
+        """Append note to a soft-deleted project returns None."""
+        with app.app_context():
+            created = create_project(sample_project_data)
+            delete_project(created.id)
+            assert append_note(created.id, 'Note') is None
+
+    def test_append_note_is_one_statement(self, app, sample_project_data, sql_statements):
+        """Appending a note issues only the UPDATE ... RETURNING."""
+        with app.app_context():
+            project_id = create_project(sample_project_data).id
+            with sql_statements() as statements:
+                result = append_note(project_id, 'Note')
+                assert result.notes.endswith(']: Note')
+            assert len(statements) == 1
+
+    def test_append_note_bumps_data_version(self, app, sample_project_data):
+        """Appending a note invalidates data-version keyed caches."""
+        with app.app_context():
+            created = create_project(sample_project_data)
+            version = project_service.get_data_version()
+            append_note(created.id, 'Note')
+            assert project_service.get_data_version() > version
+
+
+class TestDataVersion:
+    """Tests for the project data version used as a cache key."""
+
+    def test_bumped_on_commit_not_flush(self, app, sample_project_data):
+        """A flushed write changes the version only once it is committed."""
+        with app.app_context():
+            version = project_service.get_data_version()
+            db.session.add(Project(**sample_project_data))
+            db.session.flush()
+            assert project_service.get_data_version() == version
+
+            db.session.commit()
+            assert project_service.get_data_version() == version + 1
+
+    def test_not_bumped_on_rollback(self, app, sample_project_data):
+        """Rolled-back writes leave the version unchanged."""
+        with app.app_context():
+            version = project_service.get_data_version()
+            db.session.add(Project(**sample_project_data))
+            db.session.flush()
+            db.session.rollback()
+            db.session.commit()
+            assert project_service.get_data_version() == version
+
+    def test_not_bumped_without_project_writes(self, app, sample_project):
+        """Committing a session that only read projects keeps the version."""
+        with app.app_context():
+            version = project_service.get_data_version()
+            project_service.get_project(sample_project.id)
+            db.session.commit()
+            assert project_service.get_data_version() == version
+
 
 class TestGetDistinctValues:
     """Tests for get_distinct_values function."""
@@ -754,6 +1068,152 @@ class TestGetDistinctValues:
             departments = get_distinct_values('department')
             assert departments == ['Apple', 'Middle', 'Zebra']
 
+    @pytest.mark.parametrize('field', project_service.DISTINCT_FIELDS)
+    def test_get_distinct_reads_values_in_index_order(self, app, sql_statements, field):
+        """Distinct values come from an ordered index scan, with no sort step."""
+        with app.app_context():
+            with sql_statements() as statements:
+                get_distinct_values(field)
+
+            plan = db.session.connection().exec_driver_sql(
+                f'EXPLAIN QUERY PLAN {statements[0]}', ('',)
+            ).all()
+            details = ' '.join(row[-1] for row in plan)
+            assert 'USING INDEX ix_projects_' in details
+            assert 'TEMP B-TREE' not in details
+
+    def test_get_distinct_single_field_skips_union(self, app, sql_statements):
+        """A single uncached field is read without a UNION ALL."""
+        with app.app_context():
+            with sql_statements() as statements:
+                get_distinct_values('department')
+            assert len(statements) == 1
+            assert 'UNION' not in statements[0].upper()
+
+    def test_get_distinct_values_cached(self, app):
+        """Repeated calls are served from the cache until a write."""
+        with app.app_context():
+            create_project({
+                'project_name': 'Project 1',
+                'department': 'Finance',
+                'date_to_client': date(2026, 1, 1),
+                'date_assigned_to_us': date(2026, 1, 5),
+                'assigned_attorney': 'John Smith',
+                'qcp_attorney': 'Jane Doe',
+            })
+            assert get_distinct_values('department') == ['Finance']
+
+            # A Core UPDATE bypasses ORM events, so the cached value remains
+            db.session.execute(db.update(Project).values(department='IT'))
+            db.session.commit()
+            assert get_distinct_values('department') == ['Finance']
+
+    def test_get_distinct_values_invalidated_on_write(self, app):
+        """ORM inserts and updates clear the cache."""
+        with app.app_context():
+            project = create_project({
+                'project_name': 'Project 1',
+                'department': 'Finance',
+                'date_to_client': date(2026, 1, 1),
+                'date_assigned_to_us': date(2026, 1, 5),
+                'assigned_attorney': 'John Smith',
+                'qcp_attorney': 'Jane Doe',
+            })
+            assert get_distinct_values('department') == ['Finance']
+
+            update_project(project.id, {'department': 'IT'})
+            assert get_distinct_values('department') == ['IT']
+
+    def test_get_distinct_values_invalidates_only_changed_fields(self, app):
+        """Updates clear only the cached fields they modify."""
+        with app.app_context():
+            project = create_project({
+                'project_name': 'Project 1',
+                'department': 'Finance',
+                'date_to_client': date(2026, 1, 1),
+                'date_assigned_to_us': date(2026, 1, 5),
+                'assigned_attorney': 'John Smith',
+                'qcp_attorney': 'Jane Doe',
+            })
+            assert get_distinct_values('department') == ['Finance']
+            assert get_distinct_values('qcp_attorney') == ['Jane Doe']
+
+            # Change the QCP behind the cache's back, then update other fields
+            db.session.execute(db.update(Project).values(qcp_attorney='Someone Else'))
+            db.session.commit()
+            append_note(project.id, 'A note')
+            update_project(project.id, {'department': 'IT'})
+
+            assert get_distinct_values('department') == ['IT']
+            assert get_distinct_values('qcp_attorney') == ['Jane Doe']
+
+    def test_get_distinct_values_invalidated_on_soft_delete(self, app):
+        """Soft-deleting a project clears every cached field."""
+        with app.app_context():
+            project = create_project({
+                'project_name': 'Project 1',
+                'department': 'Finance',
+                'date_to_client': date(2026, 1, 1),
+                'date_assigned_to_us': date(2026, 1, 5),
+                'assigned_attorney': 'John Smith',
+                'qcp_attorney': 'Jane Doe',
+            })
+            assert get_distinct_values('assigned_attorney') == ['John Smith']
+
+            delete_project(project.id)
+            assert get_distinct_values('assigned_attorney') == []
+
+    def test_get_distinct_values_cache_disabled(self, app):
+        """A TTL of 0 disables caching."""
+        app.config['DISTINCT_VALUES_CACHE_TTL'] = 0
+        with app.app_context():
+            assert get_distinct_values('department') == []
+
+            db.session.execute(db.insert(Project).values(
+                project_name='Project 1',
+                department='Finance',
+                date_to_client=date(2026, 1, 1),
+                date_assigned_to_us=date(2026, 1, 5),
+                assigned_attorney='John Smith',
+                qcp_attorney='Jane Doe',
+                status=ProjectStatus.IN_PROGRESS,
+                created_at=datetime(2026, 1, 1),
+                updated_at=datetime(2026, 1, 1),
+            ))
+            db.session.commit()
+            assert get_distinct_values('department') == ['Finance']
+
+
+class TestGetDistinctValuesBulk:
+    """Tests for get_distinct_values_bulk function."""
+
+    def test_bulk_matches_single_field_calls(self, app):
+        """Each field's values match get_distinct_values with caching off."""
+        app.config['DISTINCT_VALUES_CACHE_TTL'] = 0
+        with app.app_context():
+            for dept, attorney in [('Zebra', 'B Person'), ('Apple', 'A Person'), ('Apple', 'B Person')]:
+                create_project({
+                    'project_name': f'Project {dept}',
+                    'department': dept,
+                    'date_to_client': date(2026, 1, 1),
+                    'date_assigned_to_us': date(2026, 1, 5),
+                    'assigned_attorney': attorney,
+                    'qcp_attorney': 'Jane Doe',
+                })
+
+            fields = ['department', 'assigned_attorney', 'qcp_attorney', 'project_group']
+            values = get_distinct_values_bulk(fields)
+
+            assert values == {field: get_distinct_values(field) for field in fields}
+            assert values['department'] == ['Apple', 'Zebra']
+            assert values['project_group'] == []
+
+    def test_bulk_invalid_field(self, app):
+        """An invalid field raises ValueError."""
+        with app.app_context():
+            with pytest.raises(ValueError):
+                get_distinct_values_bulk(['department', 'invalid_field'])
+
 
 class TestSoftNormalization:
     """Tests for soft normalization behavior."""
@@ -783,6 +1243,29 @@ class TestSoftNormalization:
 
             assert second.department == 'Public Works'
 
+    def test_normalization_uses_casefold(self, app):
+        """Values matching only under full case folding are normalized."""
+        with app.app_context():
+            create_project({
+                'project_name': 'First',
+                'department': 'Straße',
+                'date_to_client': date(2026, 1, 1),
+                'date_assigned_to_us': date(2026, 1, 5),
+                'assigned_attorney': 'John Smith',
+                'qcp_attorney': 'Jane Doe',
+            })
+
+            second = create_project({
+                'project_name': 'Second',
+                'department': 'STRASSE',
+                'date_to_client': date(2026, 1, 1),
+                'date_assigned_to_us': date(2026, 1, 5),
+                'assigned_attorney': 'John Smith',
+                'qcp_attorney': 'Jane Doe',
+            })
+
+            assert second.department == 'Straße'
+
     def test_new_value_becomes_canonical(self, app):
         """New value that doesn't match existing stays as entered."""
         with app.app_context():
@@ -825,6 +1308,51 @@ class TestSoftNormalization:
             assert second.assigned_attorney == 'John Smith'
             assert second.qcp_attorney == 'Jane Doe'
 
+    def test_normalization_uses_one_query(self, app, sql_statements):
+        """All normalized fields are looked up with a single SELECT."""
+        data = {
+            'project_name': 'Counted',
+            'department': 'public works',
+            'date_to_client': date(2026, 1, 1),
+            'date_assigned_to_us': date(2026, 1, 5),
+            'assigned_attorney': 'john smith',
+            'qcp_attorney': 'jane doe',
+        }
+        with app.app_context():
+            create_project(dict(data, department='Public Works',
+                                assigned_attorney='John Smith', qcp_attorney='Jane Doe'))
+
+            with sql_statements() as statements:
+                project = create_project(data)
+
+            selects = [s for s in statements if s.lstrip().upper().startswith('SELECT')]
+            assert len(selects) == 1
+            assert project.department == 'Public Works'
+            assert project.qcp_attorney == 'Jane Doe'
+
+    def test_update_normalization_uses_one_query(self, app, sql_statements):
+        """Updating all normalized fields looks them up in one SELECT."""
+        with app.app_context():
+            existing = create_project({
+                'project_name': 'Existing',
+                'department': 'Public Works',
+                'date_to_client': date(2026, 1, 1),
+                'date_assigned_to_us': date(2026, 1, 5),
+                'assigned_attorney': 'John Smith',
+                'qcp_attorney': 'Jane Doe',
+            })
+
+            with sql_statements() as statements:
+                project = update_project(existing.id, {
+                    'department': 'PUBLIC WORKS',
+                    'assigned_attorney': 'JOHN SMITH',
+                    'qcp_attorney': 'JANE DOE',
+                })
+
+            distinct = [s for s in statements if 'DISTINCT' in s.upper()]
+            assert len(distinct) == 1
+            assert project.assigned_attorney == 'John Smith'
+
 
 class TestEdgeCases:
     """Tests for edge cases and missing coverage."""
@@ -888,6 +1416,24 @@ class TestEdgeCases:
             assert projects[0].project_name == 'Late Deadline'
             assert projects[1].project_name == 'Early Deadline'
 
+    @pytest.mark.parametrize('sort_by', ['to_dict', 'query', '__tablename__'])
+    def test_sort_by_non_column_attribute_falls_back(self, app, sort_by):
+        """Model attributes that are not columns are not used for sorting."""
+        with app.app_context():
+            for name, deadline in (('Late', date(2026, 1, 30)), ('Early', date(2026, 1, 10))):
+                create_project({
+                    'project_name': name,
+                    'department': 'Public Works',
+                    'date_to_client': date(2026, 1, 1),
+                    'date_assigned_to_us': date(2026, 1, 5),
+                    'assigned_attorney': 'John Smith',
+                    'qcp_attorney': 'Jane Doe',
+                    'delivery_deadline': deadline,
+                })
+
+            projects = get_all_projects({'sort_by': sort_by})
+            assert [p.project_name for p in projects] == ['Early', 'Late']
+
     def test_get_distinct_status_values(self, app):
         """Get distinct status values."""
         with app.app_context():
@@ -997,6 +1543,23 @@ class TestEdgeCases:
             assert len(projects) == 1
             assert projects[0].status == ProjectStatus.IN_PROGRESS
 
+    def test_filter_status_as_active_tuple(self, app):
+        """The ProjectStatus.ACTIVE default excludes completed projects."""
+        with app.app_context():
+            for status in (ProjectStatus.ON_HOLD, ProjectStatus.COMPLETED):
+                create_project({
+                    'project_name': f'{status} Project',
+                    'department': 'Public Works',
+                    'date_to_client': date(2026, 1, 1),
+                    'date_assigned_to_us': date(2026, 1, 5),
+                    'assigned_attorney': 'John Smith',
+                    'qcp_attorney': 'Jane Doe',
+                    'status': status,
+                })
+
+            projects = get_all_projects({'status': ProjectStatus.ACTIVE})
+            assert [p.status for p in projects] == [ProjectStatus.ON_HOLD]
+
     def test_create_project_invalid_status_raises_error(self, app):
         """Create project with invalid status raises ValueError."""
         with app.app_context():
@@ -1234,8 +1797,8 @@ class TestDashboardFunctions:
         with app.app_context():
             today = self._utc_today()
             # Create 15 completed projects
-            for i in range(15):
-                create_project({
+            bulk_create_projects([
+                {
                     'project_name': f'Completed Project {i}',
                     'department': 'Public Works',
                     'date_to_client': date(2026, 1, 1),
@@ -1244,7 +1807,9 @@ class TestDashboardFunctions:
                     'qcp_attorney': 'Jane Doe',
                     'delivery_deadline': today,
                     'status': ProjectStatus.COMPLETED,
-                })
+                }
+                for i in range(15)
+            ])
 
             # Default limit is 10
             completed = get_recently_completed()
@@ -1264,6 +1829,119 @@ class TestDashboardFunctions:
             completed = get_recently_completed()
             assert len(completed) == 0
 
+    def test_dashboard_buckets_match_individual_functions(self, app):
+        """Buckets contain the same projects, in order, as the per-section functions."""
+        with app.app_context():
+            today = self._utc_today()
+            self._create_project_with_deadline(today - timedelta(days=2))
+            self._create_project_with_deadline(today - timedelta(days=5))
+            self._create_project_with_deadline(today + timedelta(days=3))
+            self._create_project_with_deadline(today + timedelta(days=20))
+            self._create_project_with_deadline(today, ProjectStatus.COMPLETED)
+
+            buckets = get_dashboard_buckets()
+            expected = {
+                'overdue': get_overdue_projects(),
+                'due_this_week': get_due_this_week(),
+                'longer_deadline': get_longer_deadline(),
+                'recently_completed': get_recently_completed(),
+            }
+            assert set(buckets) == set(expected)
+            for name, projects in expected.items():
+                rows, total = buckets[name]
+                assert [r['id'] for r in rows] == [p.id for p in projects]
+                assert total == len(projects)
+            assert len(buckets['overdue'][0]) == 2
+
+    def test_dashboard_buckets_rows_are_column_dicts(self, app):
+        """Bucket rows expose every column by name with native values."""
+        with app.app_context():
+            yesterday = self._utc_today() - timedelta(days=1)
+            self._create_project_with_deadline(yesterday)
+
+            row = get_dashboard_buckets()['overdue'][0][0]
+            assert set(row) == set(Project.__table__.columns.keys())
+            assert row['delivery_deadline'] == yesterday
+
+    def test_dashboard_buckets_respects_recently_completed_limit(self, app):
+        """Recently completed bucket respects the limit parameter."""
+        with app.app_context():
+            today = self._utc_today()
+            for _ in range(3):
+                self._create_project_with_deadline(today, ProjectStatus.COMPLETED)
+
+            rows, total = get_dashboard_buckets(recently_completed_limit=2)['recently_completed']
+            assert len(rows) == 2
+            assert total == 3
+
+    def test_dashboard_buckets_limit_keeps_total(self, app):
+        """Deadline sections are capped but report the full count."""
+        with app.app_context():
+            today = self._utc_today()
+            for days in (1, 2, 3):
+                self._create_project_with_deadline(today - timedelta(days=days))
+
+            rows, total = get_dashboard_buckets(limit=2)['overdue']
+            assert [r['delivery_deadline'] for r in rows] == [
+                today - timedelta(days=3), today - timedelta(days=2)
+            ]
+            assert total == 3
+
+    @pytest.mark.parametrize('criteria', ['_overdue_criteria', '_due_this_week_criteria'])
+    def test_open_status_filter_seeks_status_index(self, app, criteria):
+        """Open projects are matched with status IN (...), which can seek the index."""
+        with app.app_context():
+            stmt = (
+                db.select(Project.id)
+                .where(*getattr(project_service, criteria)(self._utc_today()))
+                .order_by(Project.delivery_deadline)
+            )
+            sql = str(stmt.compile(db.engine, compile_kwargs={'literal_binds': True}))
+            plan = db.session.execute(db.text(f'EXPLAIN QUERY PLAN {sql}')).all()
+            details = ' '.join(row[-1] for row in plan)
+
+            assert 'status IN' in sql
+            assert 'USING INDEX ix_projects_status_delivery (status=?' in details
+
+    def test_dashboard_buckets_empty(self, app):
+        """All buckets are present and empty when there are no projects."""
+        with app.app_context():
+            buckets = get_dashboard_buckets()
+            assert all(section == ([], 0) for section in buckets.values())
+
+
+class TestCurrentDate:
+    """Tests for current_date memoization."""
+
+    @pytest.fixture
+    def advancing_clock(self, monkeypatch):
+        """Make each datetime.now() call in the service a day later."""
+        calls = []
+        start = datetime(2026, 1, 1, 23, 59, tzinfo=timezone.utc)
+
+        class AdvancingClock:
+            @staticmethod
+            def now(tz=None):
+                calls.append(tz)
+                return start + timedelta(days=len(calls))
+
+        monkeypatch.setattr(project_service, 'datetime', AdvancingClock)
+        return calls
+
+    def test_memoized_for_request(self, app, advancing_clock):
+        """Every call within one request sees the same date."""
+        with app.test_request_context('/dashboard'):
+            first = current_date()
+            assert current_date() == first
+        assert len(advancing_clock) == 1
+
+    def test_new_request_recomputes(self, app, advancing_clock):
+        """The memo does not leak into the next request."""
+        with app.test_request_context('/dashboard'):
+            first = current_date()
+        with app.test_request_context('/dashboard'):
+            assert current_date() == first + timedelta(days=1)
+
 
 class TestSearchFunctionality:
     """Tests for multi-term search functionality in get_all_projects."""